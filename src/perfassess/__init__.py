@@ -0,0 +1,50 @@
+r"""Compute time and memory consumption.
+
+The profiling entry points are imported on first use, so that light modules,
+like `perfassess.session_client`, do not import NumPy and Plotly.
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [I]
+from importlib import import_module
+
+
+# Public name, with the module defining it.
+EXPORT: dict = {
+    "PerformanceAssessor": "class_performance_assessor",
+    "SampledProfiler": "sampled_profiler",
+    "get_assessor": "block_profiling",
+    "profile": "block_profiling",
+    "profiled": "block_profiling",
+    "serve": "live_server"
+}
+
+__all__ = list(EXPORT)
+
+
+def __getattr__(name: str) -> object:
+    """Import a public name on first use.
+
+    Parameters
+    ----------
+    name : `str`
+        The asked name.
+
+    Returns
+    -------
+    `object`
+        The public object.
+
+    Raises
+    ------
+    `AttributeError`
+        If the name is not public.
+    """
+    if name not in EXPORT:
+        raise AttributeError(f"[Err##] Module \"{__name__}\" has no attribute "
+                             f"\"{name}\".")
+
+    return getattr(import_module(f".{EXPORT[name]}", __name__), name)
@@ -0,0 +1,131 @@
+r"""Contains a context manager and a decorator to profile code in place.
+
+Usage
+-----
+```py
+import perfassess
+
+with perfassess.profile():
+    some_stage()
+
+
+@perfassess.profiled
+def some_function():
+    ...
+
+
+perfassess.get_assessor().plot(path="output_directory/")
+```
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [C]
+from contextlib import contextmanager
+# [F]
+from functools import wraps
+# [T]
+from typing import Callable, Iterator
+
+# [C]
+from .class_performance_assessor import PerformanceAssessor
+
+
+# The assessor used when none is given.
+ASSESSOR: "dict[PerformanceAssessor]" = {}
+
+
+def get_assessor(reset: bool = False) -> PerformanceAssessor:
+    """Get the assessor shared by every block and call profiled without a
+    given assessor.
+
+    Parameters
+    ----------
+    reset : `bool`, optional
+        Replace the shared assessor by a new one, dropping its evaluations.
+        By default False.
+
+    Returns
+    -------
+    `PerformanceAssessor`
+        The shared assessor.
+    """
+    if reset or "default" not in ASSESSOR:
+        ASSESSOR["default"] = PerformanceAssessor(main=None)
+
+    return ASSESSOR["default"]
+
+
+@contextmanager
+def profile(
+    assessor: PerformanceAssessor = None,
+    **option
+) -> Iterator[PerformanceAssessor]:
+    """Profile a code block. Its time and memory evaluations are added to the
+    ones of the assessor previous blocks and calls. They are parsed once, when
+    the assessor data or plots are asked for.
+
+    An assessor measures one block at a time. A block entered while another
+    one runs, nested or from another thread, is part of the running one: see
+    `PerformanceAssessor.profiling()`.
+
+    Parameters
+    ----------
+    assessor : `PerformanceAssessor`, optional
+        The assessor accumulating the evaluations. By default None, using
+        `get_assessor()`.
+
+    option
+        The options of `PerformanceAssessor.launch_profiling()`, like
+        `do_memory`.
+
+    Yields
+    ------
+    `PerformanceAssessor`
+        The assessor, to plot or export its evaluations.
+    """
+    if assessor is None:
+        assessor = get_assessor()
+
+    with assessor.profiling(accumulate=True, **option):
+        yield assessor
+
+
+def profiled(
+    function: Callable = None,
+    assessor: PerformanceAssessor = None,
+    **option
+) -> Callable:
+    """Profile every call of a function, like `profile()` does for a block.
+    Can be used as `@profiled` or as `@profiled(assessor=..., ...)`.
+
+    Parameters
+    ----------
+    function : `Callable`, optional
+        The function to profile. By default None, returning a decorator.
+
+    assessor : `PerformanceAssessor`, optional
+        The assessor accumulating the evaluations. By default None, using
+        `get_assessor()`.
+
+    option
+        The options of `PerformanceAssessor.launch_profiling()`, like
+        `do_memory`.
+
+    Returns
+    -------
+    `Callable`
+        The profiled function, or a decorator when no function is given.
+    """
+    if function is None:
+        return lambda function: profiled(function=function,
+                                         assessor=assessor, **option)
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        with profile(assessor=assessor, **option):
+            return function(*args, **kwargs)
+
+    return wrapper
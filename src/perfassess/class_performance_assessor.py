@@ -6,25 +6,71 @@ __contact__ = ["lucas.rouaud@gmail.com"]
 __copyright__ = "MIT License"
 
 # [C]
+from collections import Counter
+from contextlib import ExitStack, contextmanager
 from cProfile import Profile
+# [F]
+from functools import partial
+# [G]
+import gc
 # [I]
 from io import StringIO
 # [P]
 from pstats import Stats
-import sys
 # [T]
 import tracemalloc
-from typing import Callable
+from typing import Callable, Iterator
+# [W]
+from warnings import warn
 # [O]
-from os.path import exists, isdir
+from os.path import dirname, exists, isdir, join
 
 # [N]
 import numpy as np
 # [P]
 import plotly.graph_objects as go
 
+# [C]
+from .code_filter import CodeFilter
+# [F]
+from .function_table import function_evaluation
+# [G]
+from .gc_monitor import (GcMonitor, count_object, object_evaluation,
+                         restore_gc)
+# [L]
+from .leak_detector import LeakDetector
+from .line_timer import LineTimer
+# [M]
+from .memory_sampler import MemorySampler
+from .monitoring import HAS_MONITORING
+from .monitoring_profiler import OWN_FILE, MonitoringProfiler
+# [N]
+from .noise import NoiseMonitor
+# [P]
+from .plot import (SIDECAR_SCRIPT, is_downsampled, set_phase_timeline,
+                   set_plot, set_quadrant, set_table, set_timeline,
+                   sidecar_data)
+# [R]
+from .resource_usage import ResourceUsage
+from .result_io import trim_label
 # [T]
 from .testor import testor
+from .throughput import ThroughputBenchmark
+
+
+# The files allocating memory while measuring, removed from the memory
+# evaluation.
+MEMORY_OWN_FILE: set = OWN_FILE | {tracemalloc.__file__} | {
+    join(dirname(__file__), name)
+    for name in ("code_filter.py", "gc_monitor.py", "line_timer.py",
+                 "noise.py", "resource_usage.py")
+}
+# Domain of the NumPy data buffers allocations, traced apart from the python
+# heap.
+NUMPY_DOMAIN: int = np.lib.tracemalloc_domain
+# Number of frames kept by tracemalloc with a filter, to find the nearest kept
+# frame of filtered allocations. Each frame slows down every allocation.
+FILTER_FRAME: int = 10
 
 
 class PerformanceAssessor:
@@ -79,11 +125,36 @@ class PerformanceAssessor:
         self.__data: dict = {}
         self.__plot: "dict[go.Figure]" = {}
         self.__n_field: int = n_field
-
+        # Kept between runs, to accumulate evaluations.
+        self.__profiler: object = None
+        self.__memory: dict = {}
+        self.__snapshot: list = []
+        self.__time_stat: dict = {}
+        self.__running: bool = False
+        # Parsing steps not done yet, by evaluation, in order.
+        self.__pending: dict = {}
+
+    # pylint: disable=too-many-arguments
+    # Each evaluation have its own options.
     def launch_profiling(
         self,
         do_memory: bool = True,
-        do_time: bool = True
+        do_time: bool = True,
+        do_gc: bool = False,
+        gc_mode: str = "enable",
+        line_function: "list[Callable]" = None,
+        time_backend: str = "cprofile",
+        include: list = None,
+        exclude: list = None,
+        do_resource: bool = True,
+        sample_interval: float = None,
+        do_noise: bool = False,
+        cpu: list = None,
+        priority: int = None,
+        max_noise: float = None,
+        n_retry: int = 0,
+        do_object: bool = False,
+        reset_peak: bool = False
     ):
         """Launch the evaluation of performance (memory or time).
 
@@ -95,115 +166,641 @@ class PerformanceAssessor:
         do_time : `bool`, optional
             Do the time evaluation. By default True.
 
+        do_gc : `bool`, optional
+            Record the garbage collector pauses. By default False.
+
+        gc_mode : `str`, optional
+            The garbage collector state during the measure: "enable" to keep
+            it as it is, "disable" to switch it off, or "freeze" to move every
+            existing object in a permanent generation, so that collections
+            only check objects created by the tested function. By default
+            "enable".
+
+        line_function : `list[Callable]`, optional
+            Functions to time line by line. By default None.
+
+        time_backend : `str`, optional
+            The time profiler: "cprofile", or "monitoring" for a lower
+            overhead profiler based on `sys.monitoring`. "monitoring" falls
+            back to "cprofile" before python 3.12. By default "cprofile".
+
+        include : `list`, optional
+            Module names or path globs of the code to keep in the time and
+            memory evaluations. Time and memory of removed code are given to
+            the nearest kept caller. By default None, keeping everything.
+
+        exclude : `list`, optional
+            Module names or path globs of the code to remove from the time
+            and memory evaluations. By default None, removing nothing.
+
+        do_resource : `bool`, optional
+            Compute the operating system resources used by the run: CPU and
+            wall times, RSS, page faults and context switches. By default
+            True.
+
+        sample_interval : `float`, optional
+            Sample the traced memory, the RSS and the running child of the
+            tested function in a background thread, every `sample_interval`
+            seconds. By default None, not sampling.
+
+        do_noise : `bool`, optional
+            Measure the noise of the machine with a short calibration loop,
+            run before and after the measure, and read the load, the CPU
+            frequency and the governor. Always done when `cpu` or `priority`
+            is given. By default False.
+
+        cpu : `list`, optional
+            The CPUs to pin the run to, with `os.sched_setaffinity()`. By
+            default None, not pinning.
+
+        priority : `int`, optional
+            The "nice" value of the run, from -20 (the highest priority, often
+            needing privileges) to 19. By default None, not changing it.
+
+        max_noise : `float`, optional
+            The maximal noise, in %, implying `do_noise`. A noisier run is
+            launched again, up to `n_retry` times, then a warning is given.
+            By default None, accepting any noise.
+
+        n_retry : `int`, optional
+            The number of new runs when the noise is over `max_noise`. By
+            default 0.
+
+        do_object : `bool`, optional
+            Count the live objects by type, with `gc.get_objects()`, before
+            and after the run. By default False.
+
+        reset_peak : `bool`, optional
+            Reset the RSS peak of the process before the run, on Linux, so
+            that the resource evaluation only gives the peak of the run. It
+            writes `/proc/self/clear_refs`, which also clears the page
+            referenced bits of the whole process. By default False, giving
+            the peak of the whole process.
+
         Raises
         ------
         `ValueError`
-            When both `do_memory` and `do_time` are set to `False`.
+            When both `do_memory` and `do_time` are set to `False`, when
+            `gc_mode` is not "enable", "disable" or "freeze", when
+            `time_backend` is not "cprofile" or "monitoring", when
+            `sample_interval` or `max_noise` is not strictly positive, when
+            `n_retry` is negative or when `cpu` cannot be used.
+        """
+        if max_noise is not None and max_noise <= 0:
+            raise ValueError(f"[Err##] Given max_noise \"{max_noise}\" should "
+                             "be strictly positive.")
+
+        if n_retry < 0:
+            raise ValueError(f"[Err##] Given n_retry \"{n_retry}\" should be "
+                             "positive.")
+
+        for _ in range(n_retry + 1):
+            with self.profiling(
+                do_memory=do_memory,
+                do_time=do_time,
+                do_gc=do_gc,
+                gc_mode=gc_mode,
+                line_function=line_function,
+                time_backend=time_backend,
+                include=include,
+                exclude=exclude,
+                do_resource=do_resource,
+                sample_interval=sample_interval,
+                do_noise=do_noise or max_noise is not None,
+                cpu=cpu,
+                priority=priority,
+                do_object=do_object,
+                reset_peak=reset_peak
+            ):
+                # Launch the function to test.
+                self.__assessed_function(**self.__function_argument)
+
+            # A nested run is measured by the outer one.
+            if max_noise is None or self.__running:
+                return
+
+            noise: float = self.data()["noise_evaluation"]["data"][0, 0]
+
+            if noise <= max_noise:
+                return
+
+        warn(f"[Warn##] The noise of the run, {noise:.2f} %, is over "
+             f"max_noise, {max_noise} %, after {n_retry + 1} runs. The "
+             "result may be unreliable.", RuntimeWarning)
+
+    # pylint: enable=too-many-arguments
+
+    @contextmanager
+    def profiling(
+        self,
+        accumulate: bool = False,
+        **option
+    ) -> Iterator["PerformanceAssessor"]:
+        """Evaluate the performance of a code block, with the same
+        evaluations than `launch_profiling()`.
+
+        Parameters
+        ----------
+        accumulate : `bool`, optional
+            Add the time and the memory evaluations to the ones of the
+            previous runs, instead of replacing them. The other evaluations
+            always describe the last run. Only the raw profiler statistics
+            and memory snapshots are kept at each run: they are parsed and
+            plotted once, by `data()`, `get_plot()` or `plot()`. By default
+            False.
+
+        option
+            The options of `launch_profiling()`, like `do_memory`.
+
+        Yields
+        ------
+        `PerformanceAssessor`
+            This object. When it is already profiling, nothing more is done.
+            A nested block is so part of the outer run. A block entered from
+            another thread meanwhile is not measured on its own either: its
+            time is only in the outer run with the "monitoring" backend, as
+            cProfile only follows the thread enabling it.
+
+        Example
+        -------
+        ```py
+        assessor: PerformanceAssessor = PerformanceAssessor(main=None)
+
+        with assessor.profiling(do_memory=False):
+            some_stage()
+
+        assessor.plot(path="output_directory/")
+        ```
+        """
+        if self.__running:
+            yield self
+            return
+
+        self.__running = True
+
+        try:
+            yield from self.__run_profiling(accumulate=accumulate, **option)
+        finally:
+            self.__running = False
+
+    # pylint: disable=too-many-arguments, too-many-branches, too-many-locals
+    # pylint: disable=too-many-statements
+    # Each evaluation have to be set up, started and stopped, implying a lot
+    # of arguments and branches.
+    def __run_profiling(
+        self,
+        accumulate: bool,
+        do_memory: bool = True,
+        do_time: bool = True,
+        do_gc: bool = False,
+        gc_mode: str = "enable",
+        line_function: "list[Callable]" = None,
+        time_backend: str = "cprofile",
+        include: list = None,
+        exclude: list = None,
+        do_resource: bool = True,
+        sample_interval: float = None,
+        do_noise: bool = False,
+        cpu: list = None,
+        priority: int = None,
+        do_object: bool = False,
+        reset_peak: bool = False
+    ):
+        """Start the evaluations, yield to the profiled code, then stop and
+        parse them. See `launch_profiling()` for the parameters.
+
+        Yields
+        ------
+        `PerformanceAssessor`
+            This object.
         """
         if not do_memory and not do_time:
             raise ValueError("[Err##] One value between \"do_memory\" or "
                              "\"do_time\" have to set to `True`.")
 
+        if gc_mode not in ("enable", "disable", "freeze"):
+            raise ValueError(f"[Err##] Given gc_mode \"{gc_mode}\" should be "
+                             "\"enable\", \"disable\" or \"freeze\".")
+
+        if time_backend not in ("cprofile", "monitoring"):
+            raise ValueError(f"[Err##] Given time_backend \"{time_backend}\" "
+                             "should be \"cprofile\" or \"monitoring\".")
+
+        if sample_interval is not None and sample_interval <= 0:
+            raise ValueError("[Err##] Given sample_interval "
+                             f"\"{sample_interval}\" should be strictly "
+                             "positive.")
+
+        if time_backend == "monitoring" and not HAS_MONITORING:
+            warn("[Warn##] sys.monitoring needs python 3.12 or higher, "
+                 "cProfile is used instead.", RuntimeWarning)
+            time_backend = "cprofile"
+
+        if not accumulate:
+            # Parse the previous runs before replacing them.
+            self.__update()
+
+        # The environment of the run is always reported when changed.
+        do_noise = do_noise or cpu is not None or priority is not None
+        code_filter: CodeFilter = CodeFilter(include=include, exclude=exclude)
+        snapshot_list: list = []
+        object_list: list = []
+
+        # Each started evaluation is stopped, even when a later one cannot
+        # start, from the last started one.
+        with ExitStack() as stack:
+            if do_noise:
+                noise_monitor: NoiseMonitor = NoiseMonitor(cpu=cpu,
+                                                           priority=priority)
+                # Pinning first, so that every evaluation runs in the same
+                # environment.
+                noise_monitor.start()
+                # Stopped last, so that the calibration is not slowed down,
+                # and to give back the CPUs and the priority.
+                stack.callback(noise_monitor.stop)
+
+            if do_object:
+                # Before freezing, which hides objects from the garbage
+                # collector.
+                object_before: Counter = count_object()
+
+            if do_memory:
+                # Starting to check memory usage, with the callers of
+                # filtered code.
+                tracemalloc.start(FILTER_FRAME if code_filter else 1)
+                stack.callback(tracemalloc.stop)
+                # Once the other evaluations are stopped, and the objects
+                # counted, to not count the snapshot. The profiler own
+                # allocations are removed when parsed.
+                stack.callback(lambda: snapshot_list.append(
+                    tracemalloc.take_snapshot()
+                ))
+
+            if do_object:
+                # Once the garbage collector state is given back.
+                stack.callback(lambda: object_list.append(count_object()))
+
+            stack.callback(restore_gc, frozen=gc_mode == "freeze",
+                           enabled=gc.isenabled())
+
+            if gc_mode == "disable":
+                gc.disable()
+            elif gc_mode == "freeze":
+                # Collect first, so that no garbage is frozen.
+                gc.collect()
+                gc.freeze()
+
+            if do_gc:
+                gc_monitor: GcMonitor = GcMonitor()
+                # Starting to check garbage collections.
+                gc_monitor.start()
+                stack.callback(gc_monitor.stop)
+
+            if sample_interval is not None:
+                memory_sampler: MemorySampler = MemorySampler(
+                    function=self.__assessed_function,
+                    interval=sample_interval
+                )
+                # Starting to sample memory usage.
+                memory_sampler.start()
+                stack.callback(memory_sampler.stop)
+
+            if do_resource:
+                resource_usage: ResourceUsage = ResourceUsage(
+                    reset_peak=reset_peak
+                )
+                # Starting to check resource usage, before the time, to not
+                # profile it. Stopped before tracemalloc, to get its peak.
+                resource_usage.start()
+                stack.callback(resource_usage.stop)
+
+            if line_function:
+                line_timer: LineTimer = LineTimer(function_list=line_function)
+                # Starting to check line time usage.
+                line_timer.start()
+                stack.callback(line_timer.stop)
+
+            if do_time:
+                profile: object = self.__profiler
+
+                # Keep the previous profiler, and so its statistics.
+                if not accumulate or not isinstance(profile, (
+                    MonitoringProfiler if time_backend == "monitoring"
+                    else Profile
+                )):
+                    if time_backend == "monitoring":
+                        profile = MonitoringProfiler(code_filter=code_filter)
+                    else:
+                        profile = Profile()
+
+                self.__profiler = profile
+
+                # Starting to check time usage, last to only profile the
+                # tested code, and stopped before anything else.
+                profile.enable()
+                stack.callback(profile.disable)
+
+            # Run the code to test.
+            yield self
+
+        # Only keep the raw results, parsed by `__update()`.
         if do_memory:
-            # Starting to check memory usage.
-            tracemalloc.start()
+            if not accumulate:
+                self.__memory = {}
+
+            self.__snapshot += [(snapshot_list[0], code_filter)]
+            self.__pending["memory_evaluation"] = self.__memory_evaluation
 
         if do_time:
-            profile: Profile = Profile()
-            # Starting to check time usage.
-            profile.enable()
+            self.__pending["time_evaluation"] = partial(
+                self.__time_evaluation, profile=profile,
+                code_filter=code_filter
+            )
 
-        # Launch the function to test.
-        self.__assessed_function(**self.__function_argument)
+        if do_time and do_memory:
+            self.__pending["function_evaluation"] = self.__function_evaluation
 
-        if do_memory:
-            # Get a traceback of memory usage.
-            snapshot = tracemalloc.take_snapshot()
+        if do_gc:
+            self.__pending["gc_evaluation"] = partial(self.__gc_evaluation,
+                                                      gc_monitor=gc_monitor)
 
-            # Create the plot for evaluating memory usage.
-            self.__memory_evaluation(stat_memory=snapshot.statistics("lineno"))
+        if line_function:
+            self.__pending["line_evaluation"] = partial(
+                self.__line_evaluation, line_timer=line_timer
+            )
 
-            # Stop to check memory usage.
-            tracemalloc.stop()
+        if do_resource:
+            self.__pending["resource_evaluation"] = partial(
+                self.__resource_evaluation, resource_usage=resource_usage
+            )
 
-        if do_time:
-            # Stop to check time usage.
-            profile.disable()
+        if do_object:
+            self.__pending["object_evaluation"] = partial(
+                self.__object_evaluation, before=object_before,
+                after=object_list[0]
+            )
 
-            # Create the plot for evaluating memory usage.
-            self.__time_evaluation(profile=profile)
+        if do_noise:
+            self.__pending["noise_evaluation"] = partial(
+                self.__noise_evaluation, noise_monitor=noise_monitor
+            )
+
+        if sample_interval is not None:
+            self.__pending["memory_timeline"] = partial(
+                self.__sampler_evaluation, memory_sampler=memory_sampler
+            )
 
-    def __memory_evaluation(
+        if not accumulate:
+            self.__update()
+
+    # pylint: enable=too-many-arguments, too-many-branches, too-many-locals
+    # pylint: enable=too-many-statements
+
+    def __update(self):
+        """Parse the raw results of the previous runs, and set their plots.
+        """
+        pending: dict = self.__pending
+        self.__pending = {}
+
+        for parse in pending.values():
+            parse()
+
+    def launch_leak_detection(
         self,
-        stat_memory: tracemalloc.Statistic
+        n_call: int = 10,
+        n_frame: int = 10,
+        min_slope: float = 0.1,
+        min_r2: float = 0.9
     ):
-        """Parsed memory evaluation output and set a plot.
+        """Call the function many times to find memory leaks: allocation
+        sites which retained size grows steadily with the number of calls.
 
         Parameters
         ----------
-        stat_memory : `tracemalloc.Statistic`
-            The "assessor".
+        n_call : `int`, optional
+            The number of calls, at least 3. By default 10.
+
+        n_frame : `int`, optional
+            The number of frames kept in tracebacks. By default 10.
+
+        min_slope : `float`, optional
+            The minimal growth of a leaking site, in Kib per call. By default
+            0.1.
+
+        min_r2 : `float`, optional
+            The minimal coefficient of determination of a leaking site. By
+            default 0.9.
         """
-        stat_dict = {}
+        leak_detector: LeakDetector = LeakDetector(
+            self.__assessed_function,
+            n_call=n_call,
+            n_frame=n_frame,
+            min_slope=min_slope,
+            min_r2=min_r2,
+            **self.__function_argument
+        )
 
-        # Setting the dataset for memory usage.
-        for stat in stat_memory:
-            key: str = str(stat).split()[0]
+        leak_detector.launch()
+        leak_data: dict = leak_detector.data()
+
+        # Save data into member.
+        self.__data.update(leak_data)
+
+        # "Pre-draw" the plots for leaks.
+        self.__plot["leak_evaluation"] = set_plot(
+            **leak_data["leak_evaluation"]
+        )
+        self.__plot["leak_timeline"] = set_timeline(
+            **leak_data["leak_timeline"],
+            mode="lines+markers"
+        )
+        self.__plot["leak_traceback"] = set_table(
+            **leak_data["leak_traceback"]
+        )
+
+    def launch_throughput(
+        self,
+        max_concurrency: int = None,
+        duration: float = 1,
+        worker_type: tuple = ("thread", "process")
+    ):
+        """Call the function from 1 to N concurrent threads, and separately
+        processes, to measure how its throughput scales.
+
+        Parameters
+        ----------
+        max_concurrency : `int`, optional
+            The highest concurrency level, N. By default None, using the
+            number of CPUs.
+
+        duration : `float`, optional
+            The measured window of each level, in s. By default 1.
+
+        worker_type : `tuple`, optional
+            The kinds of workers, "thread" and/or "process". By default both.
+            With processes, the function has to be picklable.
+        """
+        throughput_benchmark: ThroughputBenchmark = ThroughputBenchmark(
+            self.__assessed_function,
+            max_concurrency=max_concurrency,
+            duration=duration,
+            worker_type=worker_type,
+            **self.__function_argument
+        )
+
+        throughput_benchmark.launch()
+        throughput_data: dict = throughput_benchmark.data()
+
+        # Save data into member.
+        self.__data.update(throughput_data)
+
+        # "Pre-draw" the plots for the throughput.
+        self.__plot["throughput_evaluation"] = set_table(
+            **throughput_data["throughput_evaluation"]
+        )
 
-            if self.__n_field > 0:
-                key = key.split(sep="/")
-                key = key[len(key) - self.__n_field:]
-                key = "/".join(key)
+        for key in ("throughput_speedup", "throughput_efficiency"):
+            self.__plot[key] = set_timeline(**throughput_data[key],
+                                            mode="lines+markers")
+
+    def __memory_evaluation(self):
+        """Parsed memory evaluation output, adding the sizes of the snapshots
+        not parsed yet to the ones of the previous runs, and set a plot.
+        """
+        # Without the profiler own allocations.
+        own_filter: list = [tracemalloc.Filter(False, filename)
+                            for filename in MEMORY_OWN_FILE]
+
+        for snapshot, code_filter in self.__snapshot:
+            # The python heap, then NumPy data buffers, traced by NumPy in
+            # its own domain.
+            for i, is_numpy in enumerate((False, True)):
+                domain_snapshot: tracemalloc.Snapshot = snapshot.filter_traces(
+                    [tracemalloc.DomainFilter(is_numpy, NUMPY_DOMAIN),
+                     *own_filter]
+                )
+
+                if code_filter:
+                    domain_site: dict = code_filter.fold_traceback(
+                        stat_list=domain_snapshot.statistics("traceback")
+                    )
+                else:
+                    domain_site = {
+                        (stat.traceback[0].filename,
+                         stat.traceback[0].lineno): [stat.size, stat.count]
+                        for stat in domain_snapshot.statistics("lineno")
+                    }
+
+                for key, (size, count) in domain_site.items():
+                    value: list = self.__memory.setdefault(key, [0, 0, 0, 0])
+                    value[2 * i] += size
+                    value[2 * i + 1] += count
+
+        self.__snapshot = []
+
+        stat_dict: dict = {}
+
+        # Setting the dataset for memory usage.
+        for (filename, lineno), domain_value in self.__memory.items():
+            key: str = trim_label(label=f"{filename}:{lineno}",
+                                  n_field=self.__n_field)
 
             if key not in stat_dict:
-                stat_dict[key] = 0
+                stat_dict[key] = [0, 0, 0, 0]
+
+            for i, domain_value_i in enumerate(domain_value):
+                stat_dict[key][i] += domain_value_i
 
-            stat_dict[key] += stat.size
+        # Python size, python count, NumPy size, NumPy count.
+        domain: np.array = np.array(list(stat_dict.values()),
+                                    dtype=float).reshape(-1, 4)
+        size: np.array = domain[:, 0] + domain[:, 2]
+        count: np.array = domain[:, 1] + domain[:, 3]
 
         # Save data into member.
         self.__data["memory_evaluation"] = {
-            "head": np.array(["size (Mib)", "function"]),
+            "head": np.array(["size (Kib)", "python size (Kib)",
+                              "numpy size (Kib)", "allocations",
+                              "average size (b)", "function"]),
             "label": np.array(list(stat_dict.keys())),
-            "data": np.array([list(stat_dict.values())]).T / 1024
+            "data": np.column_stack((
+                size / 1024,
+                domain[:, 0] / 1024,
+                domain[:, 2] / 1024,
+                count,
+                np.divide(size, count, out=np.zeros(len(count)),
+                          where=count > 0)
+            ))
+        }
+        # Both domains need different fixes: fewer objects, or smaller
+        # arrays.
+        self.__data["memory_domain"] = {
+            "head": np.array(["size (Kib)", "allocations", "domain"]),
+            "label": np.array(["python heap", "numpy data"]),
+            "data": np.array([
+                np.sum(domain[:, [0, 1]], axis=0) / [1024, 1],
+                np.sum(domain[:, [2, 3]], axis=0) / [1024, 1]
+            ])
         }
 
-        # "Pre-draw" the plot for time usage.
-        self.__plot["memory_evaluation"] = self.__set_plot(
-            head=np.array(["size (Mib)", "function"]),
-            label=np.array(list(stat_dict.keys())),
-            data=np.array([list(stat_dict.values())]).T / 1024
+        # "Pre-draw" the plot for time usage, with a dropdown by column.
+        self.__plot["memory_evaluation"] = set_plot(
+            **self.__data["memory_evaluation"]
+        )
+        self.__plot["memory_domain"] = set_plot(
+            **self.__data["memory_domain"]
         )
 
     def __time_evaluation(
         self,
-        profile: Profile
+        profile: object,
+        code_filter: CodeFilter
     ):
         """Parsed time evaluation output and set a plot.
 
         Parameters
         ----------
-        profile : `Profile`
+        profile : `Profile` or `MonitoringProfiler`
             The "assessor".
+
+        code_filter : `CodeFilter`
+            The filter choosing which code is kept.
         """
-        # Redirect print stdout into a buffer.
+        if isinstance(profile, MonitoringProfiler):
+            # Already filtered while profiling.
+            self.__time_stat = profile.stat()
+            self.__set_time_data(**profile.data())
+            return
+
+        # Print the statistics into a buffer.
         buffer: StringIO = StringIO()
-        sys.stdout = buffer
+        stat_time: Stats = Stats(profile, stream=buffer)
+
+        # Remove the profiler own code, and fold filtered code into its
+        # callers.
+        stat_time.stats = code_filter.fold_stats(stats=stat_time.stats,
+                                                 own_file=OWN_FILE)
+        # Keep full file names, to find the functions of allocations.
+        self.__time_stat = {key: [stat[1], stat[2], stat[3]]
+                            for key, stat in stat_time.stats.items()}
 
         # Get the traceback of time execution.
-        stat_time: Stats = Stats(profile).strip_dirs().print_stats()
+        stat_time.strip_dirs().print_stats()
         stat_time = buffer.getvalue()
 
-        # Set the print stdout standard behaviour.
-        sys.stdout = sys.__stdout__
-
         skip_line: bool = True
+        # Without kept functions, no header is printed.
+        data_head: np.array = np.array(["ncalls", "tottime (s)",
+                                        "percall (s)", "cumtime (s)",
+                                        "percall (s)",
+                                        "filename:lineno(function)"])
         data_label: np.array = np.array([])
         numeric_data: np.array = np.array([])
 
         # Setting the dataset for time usage.
         for line in stat_time.strip().split("\n"):
             if "ncalls" in line:
-                data_head: np.array = np.array(line.split())
+                data_head = np.array(line.split())
                 # Add units (seconds) to each header, but the first one.
                 data_head = np.char.add(data_head, ["", *[" (s)"] * 4, ""])
 
@@ -225,198 +822,200 @@ class PerformanceAssessor:
             else:
                 numeric_data = np.vstack((numeric_data, line[:-1]))
 
-        numeric_data = numeric_data.astype(float)
-
-        # Save data into member.
-        self.__data["time_evaluation"] = {
-            "head": data_head,
-            "label": data_label,
-            "data": numeric_data
-        }
+        # A single kept function gives a single row.
+        numeric_data = numeric_data.astype(float).reshape(-1, 5)
 
-        # "Pre-draw" the plot for time usage.
-        self.__plot["time_evaluation"] = self.__set_plot(
+        self.__set_time_data(
             head=data_head,
             label=data_label,
             data=numeric_data
         )
 
-    # pylint: disable=too-many-arguments, too-many-instance-attributes
-    # Special class that needs a lot of data to be set up. Using a dataclass
-    # would be unnecessary, as far as it would just simply take more memory
-    # for nothing.
-
-    def __set_plot(
+    def __set_time_data(
         self,
         head: np.array,
         label: np.array,
-        data: np.array,
-        foreground: str = "#2E2E3E",
-        background: str = "rgba(0, 0, 0, 0)"
-    ) -> go.Figure:
-        """Set a Plotly bar plot based on computed evaluation.
+        data: np.array
+    ):
+        """Save time evaluation data and set a plot.
 
         Parameters
         ----------
         head : `np.array`
-            The data header (like ncall). Or like one label per column.
+            The data header (like ncall).
 
         label : `np.array`
-            The data label (like functions names). Or like one label per row.
+            The data label (like functions names).
 
         data : `np.array`
             The numerical data.
+        """
+        # Save data into member.
+        self.__data["time_evaluation"] = {
+            "head": head,
+            "label": label,
+            "data": data
+        }
 
-        foreground : `str`, optional
-            The "foreground" color. By default "#2E2E3E".
-
-        background : `str`, optional
-            The "background" color. By default "rgba(0, 0, 0, 0)".
+        # "Pre-draw" the plot for time usage.
+        self.__plot["time_evaluation"] = set_plot(
+            head=head,
+            label=label,
+            data=data
+        )
 
-        Returns
-        -------
-        go.Figure
-            The setted Plotly bar plot.
+    def __function_evaluation(self):
+        """Join the time and the memory evaluations by function, then set a
+        bar plot and a quadrant plot.
         """
-        plot: object = go.Figure()
-
-        sort_i: np.array = np.flip(np.argsort(data.T[0]))
-
-        # Trace the barplot
-        plot.add_trace(go.Bar(
-            x=label[sort_i],
-            y=data.T[0][sort_i],
-            marker_line_color=foreground,
-            marker_color=foreground
-        ))
-
-        # Modify general plot properties.
-        plot.update_layout(
-            template="plotly_white",
-            margin={"r": 5},
-            font={"size": 12, "family": "Roboto Light"},
-            xaxis={
-                "title": f"<b>Tested function ({head[-1]})</b>",
-                "showline": True,
-                "linewidth": 1,
-                "showgrid": False,
-                "title_font": {"family": "Roboto Black"},
-                "tickfont": {"size": 12}
-            },
-            yaxis={
-                "title": f"<b>{head[0].capitalize()}</b>",
-                "showline": True,
-                "linewidth": 1,
-                "showgrid": False,
-                "title_font": {"family": "Roboto Black"},
-                "tickfont": {"size": 12}
-            },
-            title_font={"family": "Roboto Black"},
-            plot_bgcolor=background,
-            paper_bgcolor=background,
+        function_data: dict = function_evaluation(
+            time_stat=self.__time_stat,
+            # Both domains.
+            site={key: [value[0] + value[2], value[1] + value[3]]
+                  for key, value in self.__memory.items()}
         )
 
-        # Add the rectangle border.
-        plot.add_shape(
-            type="rect",
-            xref="paper",
-            yref="paper",
-            x0=0,
-            y0=0,
-            x1=1,
-            y1=1,
-            line={"width": 2, "color": foreground}
+        # Save data into member.
+        self.__data["function_evaluation"] = function_data
+
+        # "Pre-draw" the plots for function usage.
+        self.__plot["function_evaluation"] = set_plot(**function_data)
+        self.__plot["function_quadrant"] = set_quadrant(**function_data,
+                                                        x_column=2,
+                                                        y_column=3)
+
+    def __gc_evaluation(
+        self,
+        gc_monitor: GcMonitor
+    ):
+        """Parsed garbage collector evaluation output and set plots.
+
+        Parameters
+        ----------
+        gc_monitor : `GcMonitor`
+            The "assessor".
+        """
+        gc_data: dict = gc_monitor.data()
+
+        # Save data into member.
+        self.__data.update(gc_data)
+
+        # "Pre-draw" the plots for garbage collections.
+        self.__plot["gc_evaluation"] = set_plot(**gc_data["gc_evaluation"])
+        self.__plot["gc_timeline"] = set_timeline(**gc_data["gc_timeline"])
+
+    def __line_evaluation(
+        self,
+        line_timer: LineTimer
+    ):
+        """Parsed line time evaluation output and set plots.
+
+        Parameters
+        ----------
+        line_timer : `LineTimer`
+            The "assessor".
+        """
+        line_data: dict = line_timer.data()
+
+        # Save data into member.
+        self.__data.update(line_data)
+
+        # "Pre-draw" the plot for line time usage and the annotated source.
+        self.__plot["line_evaluation"] = set_plot(
+            **line_data["line_evaluation"]
         )
+        self.__plot["line_source"] = set_table(**line_data["line_source"])
 
-        plot.update_traces()
+    def __resource_evaluation(
+        self,
+        resource_usage: ResourceUsage
+    ):
+        """Parsed resource evaluation output and set a summary table.
 
-        # Adding the dropdown menu in the case of multiple datas.
-        if data.T.shape[0] != 1:
-            # Add the dropdown to the plot.
-            plot.update_layout(updatemenus=self.__add_dropdown(
-                foreground=foreground,
-                head=head,
-                label=label,
-                data=data
-            ))
+        Parameters
+        ----------
+        resource_usage : `ResourceUsage`
+            The "assessor".
+        """
+        resource_data: dict = resource_usage.data()
 
-        return plot
+        # Save data into member.
+        self.__data["resource_evaluation"] = resource_data
 
-    # pylint: enable=too-many-arguments
+        # "Pre-draw" the summary, one row per resource.
+        self.__plot["resource_evaluation"] = set_table(
+            head=np.array(["value", "resource"]),
+            label=resource_data["head"][:-1],
+            data=resource_data["data"].T
+        )
 
-    def __add_dropdown(
+    def __object_evaluation(
         self,
-        head: np.array,
-        label: np.array,
-        data: np.array,
-        foreground: str
-    ) -> list:
-        """Add a dropdown to the Plotly plot, in order to select different
-        assessed values.
+        before: Counter,
+        after: Counter
+    ):
+        """Parsed live objects census and set a plot.
 
         Parameters
         ----------
-        head : `np.array`
-            The data header (like ncall). Or like one label per column.
+        before : `Counter`
+            The live objects by type, before the run.
 
-        label : `np.array`
-            The data label (like functions names). Or like one label per row.
+        after : `Counter`
+            The live objects by type, after the run.
+        """
+        # Save data into member.
+        self.__data["object_evaluation"] = object_evaluation(before=before,
+                                                             after=after)
 
-        data : `np.array`
-            The numerical data.
+        # "Pre-draw" the plot for the census.
+        self.__plot["object_evaluation"] = set_plot(
+            **self.__data["object_evaluation"]
+        )
 
-        foreground : `str`
-            The "foreground" color.
+    def __sampler_evaluation(
+        self,
+        memory_sampler: MemorySampler
+    ):
+        """Parsed memory sampler output and set a timeline.
 
-        Returns
-        -------
-        `list`
-            The dropdown menu, which is a `update_menu`.
+        Parameters
+        ----------
+        memory_sampler : `MemorySampler`
+            The "assessor".
         """
-        button: list = []
-
-        for i, label_i in enumerate(head[:-1]):
-            sort_i: np.array = np.flip(np.argsort(data.T[i]))
-
-            # Add a element in the dropdown. By selecting it, it will modify
-            # the plot.
-            button += [{
-                "method": "update",
-                "label": label_i,
-                "args": [
-                    # Restyling.
-                    {"x": [label[sort_i]], "y": [data.T[i][sort_i]]},
-                    # Updating.
-                    {"yaxis": {
-                        "showline": True,
-                        "linewidth": 1,
-                        "showgrid": False,
-                        "title": {
-                            "text": f"<b>{label_i.capitalize()}</b>",
-                            "font": {"family": "Roboto Black"}
-                        },
-                        "tickfont": {"size": 12}
-                    }}
-                ],
-            }]
-
-        # Create the dropdown menu.
-        update_menu: list = [{
-            "buttons": button,
-            "type": "dropdown",
-            "direction": "down",
-            "showactive": True,
-            "x": 1,
-            "xanchor": "right",
-            "y": 1.01,
-            "yanchor": "bottom",
-            "bgcolor": "#FFF",
-            "bordercolor": foreground,
-            "borderwidth": 2,
-            "font_color": foreground
-        }]
-
-        return update_menu
+        # Save data into member.
+        self.__data["memory_timeline"] = memory_sampler.data()
+
+        # "Pre-draw" the timeline of memory usage.
+        self.__plot["memory_timeline"] = set_phase_timeline(
+            **self.__data["memory_timeline"],
+            y_title="Memory (Kib)"
+        )
+
+    def __noise_evaluation(
+        self,
+        noise_monitor: NoiseMonitor
+    ):
+        """Parsed noise evaluation output and set a summary table.
+
+        Parameters
+        ----------
+        noise_monitor : `NoiseMonitor`
+            The "assessor".
+        """
+        noise_data: dict = noise_monitor.data()
+
+        # Save data into member.
+        self.__data["noise_evaluation"] = noise_data
+
+        # "Pre-draw" the summary, one row per measure.
+        self.__plot["noise_evaluation"] = set_table(
+            head=np.array(["value", "environment (governor "
+                           f"{noise_data['label'][0]})"]),
+            label=noise_data["head"][:-1],
+            data=noise_data["data"].T
+        )
 
     def plot(
         self,
@@ -448,14 +1047,66 @@ class PerformanceAssessor:
             raise ValueError(f"[Err##] Given path  \"{path}\" is not "
                              "directory.")
 
+        self.__update()
+
         for key, plot_i in self.__plot.items():
+            post_script: str = None
+
+            # Downsampled plots get their full data in a sidecar file.
+            if key in self.__data and is_downsampled(plot=plot_i):
+                sidecar: np.array = sidecar_data(
+                    label=self.__data[key]["label"],
+                    data=self.__data[key]["data"]
+                )
+                sidecar.tofile(f"{path}/{key}.bin")
+
+                post_script = SIDECAR_SCRIPT.replace(
+                    "SIDECAR_PATH", f"{key}.bin"
+                ).replace("N_COLUMN", str(sidecar.shape[1]))
+
             # Save the plot.
             plot_i.write_html(
                 file=f"{path}/{key}.html",
                 include_plotlyjs=True,
-                full_html=True
+                full_html=True,
+                post_script=post_script
             )
 
+    def add_evaluation(
+        self,
+        key: str,
+        evaluation: dict
+    ):
+        """Add an evaluation computed outside of this object, like the one of
+        an `ImportProfiler`, to the data and the plots.
+
+        Parameters
+        ----------
+        key : `str`
+            The evaluation name, used as the plot file name.
+
+        evaluation : `dict`
+            The evaluation, with "head", "label" and "data" keys.
+
+        Raises
+        ------
+        `ValueError`
+            If the evaluation does not have "head", "label" and "data" keys.
+        """
+        if not {"head", "label", "data"} <= set(evaluation):
+            raise ValueError(f"[Err##] Evaluation \"{key}\" should have "
+                             "\"head\", \"label\" and \"data\" keys.")
+
+        # Save data into member.
+        self.__data[key] = evaluation
+
+        # "Pre-draw" the plot for the evaluation.
+        self.__plot[key] = set_plot(
+            head=evaluation["head"],
+            label=evaluation["label"],
+            data=evaluation["data"]
+        )
+
     def get_plot(self) -> dict:
         """Get the setted plot.
 
@@ -464,6 +1115,8 @@ class PerformanceAssessor:
         `dict`
             The setted plot.
         """
+        self.__update()
+
         return self.__plot
 
     def data(self) -> dict:
@@ -479,6 +1132,8 @@ class PerformanceAssessor:
         `ValueError`
             _description_
         """
+        self.__update()
+
         if not self.__data:
             raise ValueError("[Err##] You have to computed properties before"
                              "getting them. For this, use"
@@ -0,0 +1,222 @@
+r"""An object to choose which code is kept in the evaluations.
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [F]
+from fnmatch import fnmatch
+
+
+class CodeFilter:
+    """A class to include or exclude code by its file.
+
+    A pattern is either a module name, like "numpy" or "package.module", or a
+    path glob, like "*/site-packages/*" (any pattern with a "/" or a "*").
+    A file is kept when it matches an included pattern (or when there are no
+    included patterns) and no excluded pattern.
+
+    Removed code is folded into the nearest kept code: its time goes to its
+    kept callers, and its memory to the kept frame which called it.
+    """
+
+    def __init__(self, include: list = None, exclude: list = None):
+        """Initialize a CodeFilter object.
+
+        Parameters
+        ----------
+        include : `list`, optional
+            The patterns to keep. By default None, keeping everything.
+
+        exclude : `list`, optional
+            The patterns to remove. By default None, removing nothing.
+        """
+        self.__include: list = [self.__to_glob(pattern)
+                                for pattern in include or []]
+        self.__exclude: list = [self.__to_glob(pattern)
+                                for pattern in exclude or []]
+        # Already matched files.
+        self.__cache: dict = {}
+
+    def __bool__(self) -> bool:
+        """Check if the filter removes something.
+
+        Returns
+        -------
+        `bool`
+            `True` if patterns are given.
+        """
+        return bool(self.__include or self.__exclude)
+
+    @staticmethod
+    def __to_glob(pattern: str) -> list:
+        """Convert a pattern into path globs.
+
+        Parameters
+        ----------
+        pattern : `str`
+            A module name or a path glob.
+
+        Returns
+        -------
+        `list`
+            The path globs matching the pattern.
+        """
+        if "/" in pattern or "*" in pattern:
+            return [pattern]
+
+        path: str = pattern.replace(".", "/")
+
+        # A package directory, or a module file.
+        return [f"*/{path}/*", f"{path}/*", f"*/{path}.py", f"{path}.py"]
+
+    def match(self, filename: str) -> bool:
+        """Check if a file is kept.
+
+        Parameters
+        ----------
+        filename : `str`
+            The file name, like `code.co_filename`.
+
+        Returns
+        -------
+        `bool`
+            `True` if the file is kept.
+        """
+        if filename in self.__cache:
+            return self.__cache[filename]
+
+        keep: bool = (
+            not self.__include
+            or any(fnmatch(filename, glob) for pattern in self.__include
+                   for glob in pattern)
+        ) and not any(fnmatch(filename, glob) for pattern in self.__exclude
+                      for glob in pattern)
+
+        self.__cache[filename] = keep
+
+        return keep
+
+    def fold_stats(self, stats: dict, own_file: set = frozenset()) -> dict:
+        """Remove filtered functions from `pstats.Stats.stats`, giving their
+        "tottime" to their nearest kept callers. The time is shared between
+        callers like their own calls.
+
+        Parameters
+        ----------
+        stats : `dict`
+            The cProfile statistics, by `(filename, lineno, function)`.
+
+        own_file : `set`, optional
+            Files removed without folding, like the profiler own code. By
+            default an empty set.
+
+        Returns
+        -------
+        `dict`
+            The statistics of kept functions only.
+        """
+        # Built-in functions only called by own files, like
+        # "Profile.disable()", are part of the profiler.
+        own_key: set = {
+            key for key, stat in stats.items()
+            if key[0] in own_file or (key[0] == "~" and stat[4] and all(
+                caller[0] in own_file for caller in stat[4]
+            ))
+        }
+        kept: set = {key for key in stats
+                     if key not in own_key and self.match(key[0])}
+        # Share of the time of a function given to each kept function.
+        share: dict = {}
+
+        def resolve(key: tuple, visiting: set) -> dict:
+            """Find the kept functions a function time is given to.
+
+            Parameters
+            ----------
+            key : `tuple`
+                The function, as `(filename, lineno, function)`.
+
+            visiting : `set`
+                The functions being resolved, to stop on recursion.
+
+            Returns
+            -------
+            `dict`
+                The share of the function time, by kept function.
+            """
+            if key in kept:
+                return {key: 1}
+            if key in share:
+                return share[key]
+            # Recursion, profiler code or caller from before the profiling.
+            if key in visiting or key not in stats or key in own_key:
+                return {}
+
+            visiting.add(key)
+            caller_dict: dict = stats[key][4]
+            total: float = sum(value[2] for value in caller_dict.values())
+            result: dict = {}
+
+            for caller, value in caller_dict.items():
+                weight: float = value[2] / total if total > 0 \
+                    else 1 / len(caller_dict)
+
+                for kept_key, part in resolve(caller, visiting).items():
+                    result[kept_key] = result.get(kept_key, 0) + weight * part
+
+            visiting.discard(key)
+            share[key] = result
+
+            return result
+
+        folded: dict = dict.fromkeys(kept, 0)
+
+        for key, stat in stats.items():
+            if key in kept or key in own_key:
+                continue
+
+            for kept_key, part in resolve(key, set()).items():
+                folded[kept_key] += stat[2] * part
+
+        return {
+            key: (
+                *stats[key][:2],
+                stats[key][2] + folded[key],
+                stats[key][3],
+                {caller: value for caller, value in stats[key][4].items()
+                 if caller in kept}
+            )
+            for key in kept
+        }
+
+    def fold_traceback(self, stat_list: list) -> dict:
+        """Give the size of each `tracemalloc` traceback to its most recent
+        kept frame.
+
+        Parameters
+        ----------
+        stat_list : `list`
+            The `tracemalloc.Statistic`, grouped by "traceback".
+
+        Returns
+        -------
+        `dict`
+            The `[size, count]` of allocations, by `(filename, lineno)` of
+            kept frames. Tracebacks without kept frames are removed.
+        """
+        site: dict = {}
+
+        for stat in stat_list:
+            # Frames are sorted from the oldest to the most recent.
+            for frame in reversed(stat.traceback):
+                if self.match(frame.filename):
+                    value: list = site.setdefault(
+                        (frame.filename, frame.lineno), [0, 0]
+                    )
+                    value[0] += stat.size
+                    value[1] += stat.count
+                    break
+
+        return site
@@ -0,0 +1,125 @@
+r"""Join the time and the memory evaluations by function.
+
+Allocation sites are given by `tracemalloc` as "filename:lineno", while
+profiled functions are given by their first line. Each site is mapped to the
+function containing it, with the lines of the code objects of its file.
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [F]
+from functools import lru_cache
+# [O]
+from os.path import basename
+# [P]
+from pstats import func_std_string
+
+# [N]
+import numpy as np
+
+
+@lru_cache(maxsize=256)
+def function_line(filename: str) -> dict:
+    """Map each line of a source file to the function containing it.
+
+    Parameters
+    ----------
+    filename : `str`
+        The source file.
+
+    Returns
+    -------
+    `dict`
+        The `(co_firstlineno, co_name)` of the innermost code object of each
+        line, empty if the file cannot be compiled.
+    """
+    try:
+        with open(filename, "r", encoding="utf-8") as file:
+            code: object = compile(file.read(), filename, "exec")
+    except (OSError, SyntaxError, ValueError):
+        return {}
+
+    line_dict: dict = {}
+    code_list: list = [code]
+
+    # Outer code first, so that nested functions replace their lines.
+    while code_list:
+        code = code_list.pop()
+
+        for _, _, line in code.co_lines():
+            # The "def" line belongs to the outer code.
+            if line is None or (line == code.co_firstlineno
+                                and line in line_dict):
+                continue
+
+            line_dict[line] = (code.co_firstlineno, code.co_name)
+
+        code_list += [const for const in code.co_consts
+                      if hasattr(const, "co_lines")]
+
+    return line_dict
+
+
+def function_at(filename: str, lineno: int) -> tuple:
+    """Get the function containing a line.
+
+    Parameters
+    ----------
+    filename : `str`
+        The source file.
+
+    lineno : `int`
+        The line number.
+
+    Returns
+    -------
+    `tuple`
+        The function `(filename, co_firstlineno, co_name)`, like a `pstats`
+        key, or `None` if the line is unknown.
+    """
+    function: tuple = function_line(filename).get(lineno)
+
+    if function is None:
+        return None
+
+    return (filename, *function)
+
+
+def function_evaluation(time_stat: dict, site: dict) -> dict:
+    """Merge the time and the memory evaluations by function.
+
+    Parameters
+    ----------
+    time_stat : `dict`
+        The `[ncalls, tottime, cumtime]` by `(filename, lineno, function)`.
+
+    site : `dict`
+        The allocated `[size, count]` by `(filename, lineno)`.
+
+    Returns
+    -------
+    `dict`
+        The evaluation, with "head", "label" and "data" keys. A function only
+        in one of the evaluations has 0 in the others columns.
+    """
+    row: dict = {key: [*value, 0, 0] for key, value in time_stat.items()}
+
+    for (filename, lineno), (size, count) in site.items():
+        key: tuple = function_at(filename=filename, lineno=lineno) or \
+            (filename, lineno, "?")
+        value: list = row.setdefault(key, [0, 0, 0, 0, 0])
+
+        value[3] += size / 1024
+        value[4] += count
+
+    # Labels written like the time evaluation ones.
+    return {
+        "head": np.array(["ncalls", "tottime (s)", "cumtime (s)",
+                          "size (Kib)", "allocations",
+                          "filename:lineno(function)"]),
+        "label": np.array([func_std_string((basename(filename), lineno, name))
+                           for filename, lineno, name in row], dtype=str),
+        "data": np.array(list(row.values()), dtype=float).reshape(-1, 5)
+    }
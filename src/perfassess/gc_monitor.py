@@ -0,0 +1,190 @@
+r"""An object to record the cyclic garbage collector pauses, and a census of
+the live objects by type.
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [C]
+from collections import Counter
+# [G]
+import gc
+# [T]
+from time import perf_counter
+
+# [N]
+import numpy as np
+
+
+class GcMonitor:
+    """A class to record every garbage collection with `gc.callbacks`: when
+    it starts, how long it pauses the program, which generation it collects
+    and how many objects it frees.
+    """
+
+    def __init__(self):
+        """Initialize a GcMonitor object."""
+        self.__origin: float = 0
+        self.__start: float = 0
+        # One row per collection: [start (s), pause (s), collected,
+        # uncollectable, generation].
+        self.__event: list = []
+
+    def start(self):
+        """Start to record garbage collections."""
+        self.__origin = perf_counter()
+        self.__event = []
+        gc.callbacks.append(self.__callback)
+
+    def stop(self):
+        """Stop to record garbage collections."""
+        if self.__callback in gc.callbacks:
+            gc.callbacks.remove(self.__callback)
+
+    def __callback(self, phase: str, info: dict):
+        """Record a collection, called by the garbage collector.
+
+        Parameters
+        ----------
+        phase : `str`
+            "start" or "stop".
+
+        info : `dict`
+            The collection information, with "generation", "collected" and
+            "uncollectable" keys.
+        """
+        if phase == "start":
+            self.__start = perf_counter()
+            return
+
+        self.__event += [[
+            self.__start - self.__origin,
+            perf_counter() - self.__start,
+            info["collected"],
+            info["uncollectable"],
+            info["generation"]
+        ]]
+
+    def data(self) -> dict:
+        """Get computed data.
+
+        Returns
+        -------
+        `dict`
+            Computed data, with a "gc_evaluation" summary by generation and a
+            "gc_timeline" with one row per collection. Both have "head",
+            "label" and "data" keys.
+        """
+        event: np.array = np.array(self.__event, dtype=float).reshape(-1, 5)
+        generation: np.array = np.arange(len(gc.get_count()))
+
+        summary: np.array = np.array([
+            [
+                np.sum(mask),
+                np.sum(event[mask, 1]),
+                np.max(event[mask, 1], initial=0),
+                np.sum(event[mask, 2]),
+                np.sum(event[mask, 3])
+            ]
+            for mask in (event[:, 4] == generation_i
+                         for generation_i in generation)
+        ])
+
+        return {
+            "gc_evaluation": {
+                "head": np.array(["collections", "pause (s)",
+                                  "max pause (s)", "collected",
+                                  "uncollectable", "generation"]),
+                "label": np.char.add("generation ", generation.astype(str)),
+                "data": summary
+            },
+            "gc_timeline": {
+                "head": np.array(["time (s)", "pause (s)", "collected",
+                                  "uncollectable", "generation"]),
+                "label": np.char.add(
+                    "generation ",
+                    event[:, 4].astype(int).astype(str)
+                ),
+                "data": event[:, :4]
+            }
+        }
+
+
+def restore_gc(frozen: bool, enabled: bool):
+    """Give back the garbage collector state of before a run.
+
+    Parameters
+    ----------
+    frozen : `bool`
+        If the run froze the objects, which are then unfrozen.
+
+    enabled : `bool`
+        If the garbage collector was enabled before the run.
+    """
+    if frozen:
+        gc.unfreeze()
+
+    if enabled:
+        gc.enable()
+
+
+def count_object() -> Counter:
+    """Count the live objects tracked by the garbage collector, by type.
+
+    Only containers, like lists, dicts, tuples or class instances, are
+    tracked: numbers and strings are not counted. A collection is run first,
+    so that unreachable cycles are not counted as live objects.
+
+    Returns
+    -------
+    `Counter`
+        The number of objects, by type name, like "dict" or
+        "package.module.Class".
+    """
+    gc.collect()
+    object_list: list = gc.get_objects()
+    count: Counter = Counter(map(type, object_list))
+
+    # Do not keep every object alive.
+    del object_list
+
+    census: Counter = Counter()
+
+    # Distinct types may have the same name, like classes defined in a
+    # function.
+    for kind, number in count.items():
+        census[kind.__qualname__ if kind.__module__ == "builtins"
+               else f"{kind.__module__}.{kind.__qualname__}"] += number
+
+    return census
+
+
+def object_evaluation(before: Counter, after: Counter) -> dict:
+    """Compare two censuses of the live objects.
+
+    Parameters
+    ----------
+    before : `Counter`
+        The census before the run, like given by `count_object()`.
+
+    after : `Counter`
+        The census after the run.
+
+    Returns
+    -------
+    `dict`
+        Computed data, with "head", "label" and "data" keys. There is one
+        row by type, sorted from the most created objects.
+    """
+    kind: list = sorted(before.keys() | after.keys(),
+                        key=lambda kind_i: before[kind_i] - after[kind_i])
+
+    return {
+        "head": np.array(["new objects", "before", "after", "type"]),
+        "label": np.array(kind, dtype=str),
+        "data": np.array([
+            [after[kind_i] - before[kind_i], before[kind_i], after[kind_i]]
+            for kind_i in kind
+        ], dtype=float).reshape(-1, 3)
+    }
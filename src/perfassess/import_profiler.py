@@ -0,0 +1,281 @@
+r"""An object to compute time and memory consumption of module importations.
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [I]
+from importlib.abc import MetaPathFinder
+# [S]
+import sys
+# [T]
+from time import perf_counter
+import tracemalloc
+
+# [N]
+import numpy as np
+
+
+class ImportProfiler(MetaPathFinder):
+    """A class to assess the time and memory consumption of importations.
+
+    Each module executed while the profiler is active is recorded, with its
+    nesting depth, like `python -X importtime` does. The "self" values exclude
+    the nested importations, the "cumulative" ones include them.
+    """
+
+    def __init__(self, do_memory: bool = True):
+        """Initialize an ImportProfiler object.
+
+        Parameters
+        ----------
+        do_memory : `bool`, optional
+            Do the memory evaluation. By default True.
+        """
+        self.__do_memory: bool = do_memory
+        self.__started_tracing: bool = False
+        # One row per executed module: [name, depth, self time, cumulative
+        # time, self size, cumulative size].
+        self.__record: list = []
+        # Open importations: [record index, start time, start size, child
+        # time, child size].
+        self.__stack: list = []
+
+    def __enter__(self) -> "ImportProfiler":
+        """Start to profile importations.
+
+        Returns
+        -------
+        `ImportProfiler`
+            The started profiler.
+        """
+        if self.__do_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.__started_tracing = True
+
+        sys.meta_path.insert(0, self)
+
+        return self
+
+    def __exit__(self, *_):
+        """Stop to profile importations."""
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+        if self.__started_tracing:
+            tracemalloc.stop()
+            self.__started_tracing = False
+
+    def find_spec(self, fullname: str, path: list, target: object = None):
+        """Find the module specification with the other finders, then wrap its
+        loader to measure its execution.
+
+        Parameters
+        ----------
+        fullname : `str`
+            The full module name.
+
+        path : `list`
+            The package `__path__`, or `None` for top level modules.
+
+        target : `object`, optional
+            The module to reload, if any. By default None.
+
+        Returns
+        -------
+        `ModuleSpec`
+            The wrapped module specification, or `None` if no finder
+            succeed.
+        """
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+
+            spec = finder.find_spec(fullname, path, target)
+
+            if spec is None:
+                continue
+
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _ProfiledLoader(loader=spec.loader,
+                                              profiler=self)
+
+            return spec
+
+        return None
+
+    def execute_module(self, spec: object, module: object):
+        """Execute a module while measuring it. Used for modules loaded outside
+        of the import system, like with `spec_from_file_location()`.
+
+        Parameters
+        ----------
+        spec : `ModuleSpec`
+            The module specification.
+
+        module : `ModuleType`
+            The module to execute.
+        """
+        self.measure(name=spec.name, function=spec.loader.exec_module,
+                     module=module)
+
+    def measure(self, name: str, function: object, module: object):
+        """Execute a module with the given function while measuring it.
+
+        Parameters
+        ----------
+        name : `str`
+            The module name.
+
+        function : `Callable`
+            The function executing the module.
+
+        module : `ModuleType`
+            The module to execute.
+        """
+        index: int = len(self.__record)
+        self.__record += [[name, len(self.__stack), 0, 0, 0, 0]]
+        self.__stack += [[index, perf_counter(), self.__size(), 0, 0]]
+
+        try:
+            function(module)
+        finally:
+            _, start_time, start_size, child_time, child_size = \
+                self.__stack.pop()
+
+            time: float = perf_counter() - start_time
+            size: int = self.__size() - start_size
+
+            self.__record[index][2:] = [time - child_time, time,
+                                        size - child_size, size]
+
+            # Give the cumulative values to the parent importation.
+            if self.__stack:
+                self.__stack[-1][3] += time
+                self.__stack[-1][4] += size
+
+    def __size(self) -> int:
+        """Get the current traced memory size.
+
+        Returns
+        -------
+        `int`
+            The traced memory, in bytes.
+        """
+        if not self.__do_memory or not tracemalloc.is_tracing():
+            return 0
+
+        return tracemalloc.get_traced_memory()[0]
+
+    def data(self) -> dict:
+        """Get computed data.
+
+        Returns
+        -------
+        `dict`
+            Computed data about importations, with "head", "label" and "data"
+            keys.
+
+        Raises
+        ------
+        `ValueError`
+            If no importation was profiled.
+        """
+        if not self.__record:
+            raise ValueError("[Err##] No importation was profiled. Use the "
+                             "profiler as a context manager before getting "
+                             "data.")
+
+        numeric_data: np.array = np.array(
+            [record[1:] for record in self.__record],
+            dtype=float
+        )
+
+        return {
+            "head": np.array(["self time (s)", "cumulative time (s)",
+                              "self size (Kib)", "cumulative size (Kib)",
+                              "depth", "module"]),
+            "label": np.array([record[0] for record in self.__record]),
+            "data": np.hstack((
+                numeric_data[:, 1:3],
+                numeric_data[:, 3:5] / 1024,
+                numeric_data[:, :1]
+            ))
+        }
+
+
+class _ProfiledLoader:
+    """A loader proxy measuring the module execution of the wrapped loader.
+    """
+
+    def __init__(self, loader: object, profiler: ImportProfiler):
+        """Initialize a _ProfiledLoader object.
+
+        Parameters
+        ----------
+        loader : `Loader`
+            The wrapped loader.
+
+        profiler : `ImportProfiler`
+            The profiler receiving the measures.
+        """
+        self.__loader: object = loader
+        self.__profiler: ImportProfiler = profiler
+
+    def __getattr__(self, name: str) -> object:
+        """Give access to the wrapped loader attributes.
+
+        Parameters
+        ----------
+        name : `str`
+            The attribute name.
+
+        Returns
+        -------
+        `object`
+            The wrapped loader attribute.
+
+        Raises
+        ------
+        `AttributeError`
+            If the proxy itself is not initialized yet.
+        """
+        if name.startswith("_ProfiledLoader__"):
+            raise AttributeError(name)
+
+        return getattr(self.__loader, name)
+
+    def create_module(self, spec: object) -> object:
+        """Create the module with the wrapped loader.
+
+        Parameters
+        ----------
+        spec : `ModuleSpec`
+            The module specification.
+
+        Returns
+        -------
+        `ModuleType`
+            The created module, or `None` for the default creation.
+        """
+        return self.__loader.create_module(spec)
+
+    def exec_module(self, module: object):
+        """Execute the module with the wrapped loader while measuring it, then
+        give back the original loader to the module.
+
+        Parameters
+        ----------
+        module : `ModuleType`
+            The module to execute.
+        """
+        try:
+            self.__profiler.measure(name=module.__spec__.name,
+                                    function=self.__loader.exec_module,
+                                    module=module)
+        finally:
+            module.__loader__ = self.__loader
+
+            if getattr(module, "__spec__", None) is not None:
+                module.__spec__.loader = self.__loader
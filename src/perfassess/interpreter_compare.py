@@ -0,0 +1,359 @@
+r"""Profile the same target under many python interpreters, then compare them.
+
+Usage
+-----
+Give the interpreters to `--python`, with the usual options:
+
+```sh
+$ perfassess -s script.py -f function -o output_directory/ \
+    --python python3.10 python3.12 python3.13
+```
+
+Each interpreter profiles the target in a subprocess, with the same options,
+writing its report in "output_directory/<interpreter>/". perfassess has to be
+importable by each interpreter, with its dependencies. The first interpreter
+is the reference of the speedups.
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [O]
+import os
+from os.path import dirname, exists, isdir, join
+# [S]
+import subprocess
+
+# [N]
+import numpy as np
+
+# [C]
+from .class_performance_assessor import PerformanceAssessor
+# [R]
+from .result_io import load_result, save_result
+
+
+# Directory to put in "PYTHONPATH", so that subprocesses import this package.
+PACKAGE_ROOT: str = dirname(dirname(__file__))
+for _ in __package__.split(".")[1:]:
+    PACKAGE_ROOT = dirname(PACKAGE_ROOT)
+
+
+def interpreter_tag(executable: str) -> str:
+    """Name an interpreter by its implementation and version.
+
+    Parameters
+    ----------
+    executable : `str`
+        The interpreter executable, like "python3.12".
+
+    Returns
+    -------
+    `str`
+        The interpreter name, like "cpython-3.12.1".
+
+    Raises
+    ------
+    `ValueError`
+        If the interpreter cannot be launched.
+    """
+    try:
+        answer: object = subprocess.run(
+            [executable, "-c", "import platform; print(f\"{platform."
+             "python_implementation().lower()}-"
+             "{platform.python_version()}\")"],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+    except (OSError, subprocess.CalledProcessError) as error:
+        raise ValueError(f"[Err##] Given interpreter \"{executable}\" cannot "
+                         f"be launched: {error}") from error
+
+    return answer.stdout.strip()
+
+
+def strip_option(argv: list, option: tuple, n_value: int = None) -> list:
+    """Remove an option and its values from command line arguments.
+
+    Parameters
+    ----------
+    argv : `list`
+        The command line arguments, without the program name.
+
+    option : `tuple`
+        The option names, like `("-o", "--output")`.
+
+    n_value : `int`, optional
+        The number of values of the option. By default None, removing every
+        value until the next option.
+
+    Returns
+    -------
+    `list`
+        The arguments without the option.
+    """
+    kept: list = []
+    skip: int = 0
+
+    for argument in argv:
+        if skip != 0 and not argument.startswith("-"):
+            skip -= 1
+            continue
+
+        skip = 0
+
+        if argument in option:
+            skip = -1 if n_value is None else n_value
+        elif not argument.startswith(tuple(f"{name}=" for name in option)):
+            kept += [argument]
+
+    return kept
+
+
+def run_interpreter(executable: str, argv: list, output: str) -> dict:
+    """Profile the target with an interpreter, in a subprocess.
+
+    Parameters
+    ----------
+    executable : `str`
+        The interpreter executable.
+
+    argv : `list`
+        The command line arguments, without the output and the interpreters.
+
+    output : `str`
+        The output directory of this interpreter.
+
+    Returns
+    -------
+    `dict`
+        Computed data, like given by `PerformanceAssessor.data()`.
+
+    Raises
+    ------
+    `RuntimeError`
+        If the subprocess fails.
+    """
+    os.makedirs(output, exist_ok=True)
+
+    environment: dict = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(
+        [PACKAGE_ROOT] + [path for path in
+                          [environment.get("PYTHONPATH")] if path]
+    )
+
+    answer: object = subprocess.run(
+        [executable, "-m", f"{__package__}.main", *argv, "-o", output,
+         "--export"],
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=False
+    )
+
+    if answer.returncode != 0:
+        raise RuntimeError(f"[Err##] Interpreter \"{executable}\" failed "
+                           f"with:\n{answer.stderr.strip()}")
+
+    return load_result(path=join(output, "result.json"))
+
+
+def column(evaluation: dict, index: int) -> np.array:
+    """Get a data column of an evaluation, even without rows.
+
+    Parameters
+    ----------
+    evaluation : `dict`
+        The evaluation.
+
+    index : `int`
+        The column index.
+
+    Returns
+    -------
+    `np.array`
+        The column values.
+    """
+    data: np.array = evaluation["data"]
+
+    # Loaded empty evaluations have lost their number of columns.
+    if data.ndim != 2:
+        return np.zeros(0)
+
+    return data[:, index]
+
+
+def total_of(data: dict) -> list:
+    """Get the total time and memory of a run, like the budgets of the
+    suites.
+
+    Parameters
+    ----------
+    data : `dict`
+        Computed data, like given by `PerformanceAssessor.data()`.
+
+    Returns
+    -------
+    `list`
+        The "tottime" sum (s) and the allocated memory (Kib), `nan` when not
+        evaluated.
+    """
+    # Not rounded by the cProfile printing, unlike "time_evaluation".
+    if "function_evaluation" in data:
+        return [np.sum(column(evaluation=data["function_evaluation"],
+                              index=index)) for index in (1, 3)]
+
+    return [
+        np.sum(column(evaluation=data[key], index=index))
+        if key in data else np.nan
+        for key, index in (("time_evaluation", 1), ("memory_evaluation", 0))
+    ]
+
+
+def compare_result(result: dict) -> dict:
+    """Compare the data computed by many interpreters, by function.
+
+    Parameters
+    ----------
+    result : `dict`
+        The computed data of each interpreter, by interpreter name. The first
+        one is the reference.
+
+    Returns
+    -------
+    `dict`
+        Computed data, with an "interpreter_evaluation" giving the cumulative
+        time, the allocated memory and the speedup of each function with each
+        interpreter, and an "interpreter_summary" giving the total time
+        ("tottime" sum) and memory of each interpreter. Functions missing
+        for an interpreter have `nan` values.
+    """
+    tag_list: list = list(result)
+    # cumtime (s) and size (Kib) of each function, by interpreter.
+    value_dict: dict = {}
+
+    for tag in tag_list:
+        data: dict = result[tag]
+
+        if "function_evaluation" in data:
+            evaluation: dict = data["function_evaluation"]
+            value: np.array = np.array([
+                column(evaluation=evaluation, index=2),
+                column(evaluation=evaluation, index=3)
+            ]).T
+        else:
+            # Only time, or only memory, was evaluated.
+            evaluation = data.get("time_evaluation",
+                                  data.get("memory_evaluation"))
+            value = np.full((len(evaluation["label"]), 2), np.nan)
+            value[:, 0 if "time_evaluation" in data else 1] = column(
+                evaluation=evaluation,
+                index=3 if "time_evaluation" in data else 0
+            )
+
+        value_dict[tag] = dict(zip(map(str, evaluation["label"]), value))
+
+    label: list = list(dict.fromkeys(
+        label_i for tag in tag_list for label_i in value_dict[tag]
+    ))
+    # Values by function, interpreter and (cumtime, size).
+    value = np.array([
+        [value_dict[tag].get(label_i, [np.nan, np.nan]) for tag in tag_list]
+        for label_i in label
+    ], dtype=float).reshape(len(label), len(tag_list), 2)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        speedup: np.array = value[:, :1, 0] / value[:, 1:, 0]
+
+    total: np.array = np.array([
+        total_of(data=result[tag]) for tag in tag_list
+    ], dtype=float)
+
+    return {
+        "interpreter_evaluation": {
+            "head": np.array([
+                *[f"cumtime {tag} (s)" for tag in tag_list],
+                *[f"size {tag} (Kib)" for tag in tag_list],
+                *[f"speedup {tag}" for tag in tag_list[1:]],
+                "filename:lineno(function)"
+            ]),
+            "label": np.array(label, dtype=str),
+            "data": np.hstack((value[:, :, 0], value[:, :, 1], speedup))
+        },
+        "interpreter_summary": {
+            "head": np.array(["time (s)", "memory (Kib)", "speedup",
+                              "interpreter"]),
+            "label": np.array(tag_list, dtype=str),
+            "data": np.array([
+                total[:, 0],
+                total[:, 1],
+                np.divide(total[0, 0], total[:, 0],
+                          out=np.full(len(tag_list), np.nan),
+                          where=total[:, 0] > 0)
+            ]).T
+        }
+    }
+
+
+def main(argument: object, argv: list) -> int:
+    """Profile the target with each interpreter, then write the comparison
+    report and result file ("interpreter_result.json").
+
+    Parameters
+    ----------
+    argument : `ArgumentParser`
+        The parsed arguments, with "python" and "output".
+
+    argv : `list`
+        The command line arguments, without the program name.
+
+    Returns
+    -------
+    `int`
+        The exit status, 0.
+
+    Raises
+    ------
+    `FileNotFoundError`
+        If the output directory does not exist.
+
+    `ValueError`
+        If the output path is not a directory.
+    """
+    if not exists(argument.output):
+        raise FileNotFoundError("[Err##] In output, directory "
+                                f"\"{argument.output}\" does not exist.")
+    if not isdir(argument.output):
+        raise ValueError("[Err##] In output, the given path is not a "
+                         "directory.")
+
+    argv = strip_option(argv=argv, option=("--python",))
+    argv = strip_option(argv=argv, option=("-o", "--output"), n_value=1)
+
+    result: dict = {}
+
+    for executable in argument.python:
+        tag: str = interpreter_tag(executable=executable)
+
+        # The same interpreter may be given twice, like to check the noise.
+        if tag in result:
+            tag = f"{tag}_{len(result)}"
+
+        result[tag] = run_interpreter(executable=executable, argv=argv,
+                                      output=join(argument.output, tag))
+
+    compared: dict = compare_result(result=result)
+    assessor: PerformanceAssessor = PerformanceAssessor(main=None)
+
+    for key, evaluation in compared.items():
+        assessor.add_evaluation(key=key, evaluation=evaluation)
+
+    assessor.plot(path=argument.output)
+    save_result(data=compared,
+                path=join(argument.output, "interpreter_result.json"))
+
+    print(f"Compared {len(result)} interpreters into \"{argument.output}\".")
+
+    return 0
@@ -0,0 +1,228 @@
+r"""An object to find memory leaks, by calling a function many times.
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [G]
+import gc
+# [O]
+from os.path import basename
+# [T]
+import tracemalloc
+from typing import Callable
+
+# [N]
+import numpy as np
+
+
+class LeakDetector:
+    """A class to call a function many times, taking a `tracemalloc` snapshot
+    after each call. A linear regression of the retained size of each
+    allocation site over the calls tells a leak, growing steadily, from a
+    cache, filled once.
+
+    A garbage collection is done before each snapshot, so that unreachable
+    cycles are not taken for leaks.
+    """
+
+    # pylint: disable=too-many-arguments
+    # A detection needs a lot of options.
+    def __init__(
+        self,
+        function: Callable,
+        n_call: int = 10,
+        n_frame: int = 10,
+        min_slope: float = 0.1,
+        min_r2: float = 0.9,
+        **kwargs
+    ):
+        """Initialize a LeakDetector object.
+
+        Parameters
+        ----------
+        function : `Callable`
+            The function to check.
+
+        n_call : `int`, optional
+            The number of calls, at least 3. By default 10.
+
+        n_frame : `int`, optional
+            The number of frames kept in tracebacks. By default 10.
+
+        min_slope : `float`, optional
+            The minimal growth of a leaking site, in Kib per call. By default
+            0.1.
+
+        min_r2 : `float`, optional
+            The minimal coefficient of determination of a leaking site, to
+            only keep steady growths. By default 0.9.
+
+        kwargs
+            All possible arguments for the function to check.
+
+        Raises
+        ------
+        `ValueError`
+            If `n_call` is lower than 3.
+        """
+        if n_call < 3:
+            raise ValueError(f"[Err##] Given n_call \"{n_call}\" should be at"
+                             " least 3.")
+
+        self.__function: Callable = function
+        self.__function_argument: dict = dict(kwargs)
+        self.__n_call: int = n_call
+        self.__n_frame: int = n_frame
+        self.__min_slope: float = min_slope
+        self.__min_r2: float = min_r2
+
+        # Sizes, in Kib, by site and by call.
+        self.__site: np.array = np.array([], dtype=str)
+        self.__size: np.array = np.zeros((0, n_call))
+        # Traceback of each site, in the last snapshot.
+        self.__traceback: dict = {}
+
+    # pylint: enable=too-many-arguments
+
+    def launch(self):
+        """Call the function, taking a snapshot after each call."""
+        started: bool = not tracemalloc.is_tracing()
+
+        if started:
+            tracemalloc.start(self.__n_frame)
+
+        # Do not count this file, nor tracemalloc itself.
+        trace_filter: list = [tracemalloc.Filter(False, __file__),
+                              tracemalloc.Filter(False, tracemalloc.__file__)]
+        size_list: list = []
+
+        try:
+            for _ in range(self.__n_call):
+                self.__function(**self.__function_argument)
+                gc.collect()
+
+                snapshot: object = tracemalloc.take_snapshot().filter_traces(
+                    trace_filter
+                )
+                size_list += [{
+                    stat.traceback[0]: stat.size
+                    for stat in snapshot.statistics("lineno")
+                }]
+        finally:
+            if started:
+                tracemalloc.stop()
+
+        # Sites of every snapshot, with a size of 0 when missing.
+        site_list: list = list(dict.fromkeys(
+            frame for size in size_list for frame in size
+        ))
+
+        self.__site = np.array([f"{frame.filename}:{frame.lineno}"
+                                for frame in site_list], dtype=str)
+        self.__size = np.array([
+            [size.get(frame, 0) for size in size_list]
+            for frame in site_list
+        ], dtype=float).reshape(-1, self.__n_call) / 1024
+
+        # Largest traceback of each site, in the last snapshot.
+        self.__traceback = {}
+
+        for stat in snapshot.statistics("traceback"):
+            frame: object = stat.traceback[-1]
+            key: str = f"{frame.filename}:{frame.lineno}"
+
+            if key in self.__traceback:
+                continue
+
+            frame_list: list = []
+
+            # Most recent frame first, until this detector.
+            for frame_i in reversed(stat.traceback):
+                if frame_i.filename == __file__:
+                    break
+
+                frame_list += [f"{basename(frame_i.filename)}:"
+                               f"{frame_i.lineno}"]
+
+            self.__traceback[key] = " <- ".join(frame_list)
+
+    def regression(self) -> tuple:
+        """Fit a line on the size of each site over the calls.
+
+        Returns
+        -------
+        `tuple`
+            The slope (Kib per call), the coefficient of determination and the
+            fraction of calls growing the size, of each site.
+        """
+        call: np.array = np.arange(1, self.__n_call + 1, dtype=float)
+        call_center: np.array = call - call.mean()
+        size_center: np.array = self.__size - \
+            self.__size.mean(axis=1, keepdims=True)
+
+        slope: np.array = size_center @ call_center / \
+            np.sum(call_center ** 2)
+        residual: np.array = size_center - slope[:, None] * call_center
+        total: np.array = np.sum(size_center ** 2, axis=1)
+
+        r2: np.array = np.divide(
+            total - np.sum(residual ** 2, axis=1), total,
+            out=np.zeros_like(total),
+            where=total > 0
+        )
+        growth: np.array = np.mean(np.diff(self.__size, axis=1) > 0, axis=1)
+
+        return slope, r2, growth
+
+    def data(self) -> dict:
+        """Get computed data.
+
+        Returns
+        -------
+        `dict`
+            Computed data, with a "leak_evaluation" of every growing site, a
+            "leak_timeline" of the size of leaking sites over the calls and a
+            "leak_traceback" of leaking sites. All have "head", "label" and
+            "data" keys.
+        """
+        slope, r2, growth = self.regression()
+        leak: np.array = (slope >= self.__min_slope) & (r2 >= self.__min_r2)
+        # Biggest growths first.
+        order: np.array = np.argsort(-slope)
+        order = order[slope[order] > 0]
+        leak_order: np.array = order[leak[order]]
+
+        return {
+            "leak_evaluation": {
+                "head": np.array(["growth (Kib/call)", "r2", "growing calls",
+                                  "final size (Kib)", "leak", "site"]),
+                "label": self.__site[order],
+                "data": np.array([
+                    slope[order],
+                    r2[order],
+                    growth[order],
+                    self.__size[order, -1],
+                    leak[order]
+                ], dtype=float).T.reshape(-1, 5)
+            },
+            "leak_timeline": {
+                "head": np.array(["call", "size (Kib)", "site"]),
+                "label": np.repeat(self.__site[leak_order], self.__n_call),
+                "data": np.array([
+                    np.tile(np.arange(1, self.__n_call + 1),
+                            len(leak_order)),
+                    self.__size[leak_order].reshape(-1)
+                ], dtype=float).T.reshape(-1, 2)
+            },
+            "leak_traceback": {
+                "head": np.array(["growth (Kib/call)", "r2", "traceback"]),
+                "label": np.array([
+                    self.__traceback.get(site, site)
+                    for site in self.__site[leak_order]
+                ], dtype=str),
+                "data": np.array([slope[leak_order], r2[leak_order]],
+                                 dtype=float).T.reshape(-1, 2)
+            }
+        }
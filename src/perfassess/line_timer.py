@@ -0,0 +1,332 @@
+r"""An object to compute the time spent on each line of chosen functions.
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [I]
+from inspect import getsourcelines, unwrap
+# [O]
+from os.path import basename
+# [S]
+import sys
+# [T]
+from threading import get_ident
+from time import perf_counter
+from typing import Callable
+
+# [N]
+import numpy as np
+
+# [M]
+from .monitoring import HAS_MONITORING, acquire_tool_id, release_tool_id
+
+
+class LineTimer:
+    """A class to record the hits and the time of each line of chosen
+    functions. Only these functions are instrumented, so the overhead stays
+    low for the rest of the program.
+
+    `sys.monitoring` is used when it exists (python 3.12 or higher), else
+    `sys.settrace()`. The time of a line includes the time of the functions it
+    calls, except the nested calls of its own function: a recursive function
+    has its time counted once, by its innermost call. Each thread has its own
+    stack of running functions.
+
+    `sys.settrace()` only follows the thread starting the timer, and calls
+    its global trace function at each call of this thread, not only of the
+    chosen functions: the whole run is slower than with `sys.monitoring`.
+    """
+
+    def __init__(self, function_list: "list[Callable]"):
+        """Initialize a LineTimer object.
+
+        Parameters
+        ----------
+        function_list : `list[Callable]`
+            The functions to time, line by line.
+
+        Raises
+        ------
+        `ValueError`
+            If a given object is not a python function.
+        """
+        self.__code: dict = {}
+
+        for function in function_list:
+            code: object = getattr(unwrap(function), "__code__", None)
+
+            if code is None:
+                raise ValueError(f"[Err##] \"{function}\" is not a python "
+                                 "function, its lines cannot be timed.")
+
+            self.__code[code] = function
+
+        # Hits and time by (code, line).
+        self.__hit: dict = {}
+        self.__time: dict = {}
+        # Running frames by thread: [code, last line, last line start time],
+        # the start time being None while a nested call of the code runs.
+        self.__stack: dict = {}
+        self.__tool_id: int = None
+        self.__old_trace: Callable = None
+
+    def start(self):
+        """Start to record lines."""
+        self.__stack = {}
+
+        if HAS_MONITORING:
+            self.__tool_id = acquire_tool_id(name="perfassess line timer")
+            event: object = sys.monitoring.events
+
+            for event_i, callback in (
+                (event.PY_START, self.__enter),
+                (event.PY_RESUME, self.__enter),
+                (event.PY_THROW, self.__enter),
+                (event.LINE, self.__line),
+                (event.PY_RETURN, self.__exit),
+                (event.PY_YIELD, self.__exit),
+                (event.PY_UNWIND, self.__exit)
+            ):
+                sys.monitoring.register_callback(self.__tool_id, event_i,
+                                                 callback)
+
+            # Only the chosen functions are instrumented.
+            for code in self.__code:
+                sys.monitoring.set_local_events(
+                    self.__tool_id,
+                    code,
+                    event.PY_START | event.PY_RESUME | event.LINE
+                    | event.PY_RETURN | event.PY_YIELD
+                )
+
+            # Throwing into a generator and unwinding can only be followed
+            # globally.
+            sys.monitoring.set_events(self.__tool_id,
+                                      event.PY_THROW | event.PY_UNWIND)
+        else:
+            self.__old_trace = sys.gettrace()
+            sys.settrace(self.__trace)
+
+    def stop(self):
+        """Stop to record lines."""
+        if HAS_MONITORING:
+            if self.__tool_id is not None:
+                release_tool_id(tool_id=self.__tool_id,
+                                code_list=list(self.__code))
+                self.__tool_id = None
+        else:
+            sys.settrace(self.__old_trace)
+
+    def __enter(self, code: object, *_):
+        """Record a function start, resume or throw, pausing the outer call
+        of the same function.
+
+        Parameters
+        ----------
+        code : `CodeType`
+            The started code.
+        """
+        if code not in self.__code:
+            return
+
+        now: float = perf_counter()
+        stack: list = self.__stack.setdefault(get_ident(), [])
+        outer: list = self.__outer(stack=stack, code=code)
+
+        # Its current line time goes on in the nested call.
+        if outer is not None and outer[2] is not None:
+            if outer[1] is not None:
+                key: tuple = (code, outer[1])
+                self.__time[key] = self.__time.get(key, 0) + now - outer[2]
+
+            outer[2] = None
+
+        stack.append([code, None, perf_counter()])
+
+    @staticmethod
+    def __outer(stack: list, code: object) -> list:
+        """Get the innermost running frame of a code.
+
+        Parameters
+        ----------
+        stack : `list`
+            The running frames of a thread.
+
+        code : `CodeType`
+            The code to find.
+
+        Returns
+        -------
+        `list`
+            The frame, or None when the code is not running.
+        """
+        for frame in reversed(stack):
+            if frame[0] is code:
+                return frame
+
+        return None
+
+    def __line(self, code: object, line: int):
+        """Record a line start, giving the elapsed time to the previous line.
+
+        Parameters
+        ----------
+        code : `CodeType`
+            The running code.
+
+        line : `int`
+            The started line number.
+        """
+        now: float = perf_counter()
+        stack: list = self.__stack.get(get_ident())
+
+        if not stack or stack[-1][0] is not code:
+            return
+
+        frame: list = stack[-1]
+
+        if frame[1] is not None:
+            key: tuple = (code, frame[1])
+            self.__time[key] = self.__time.get(key, 0) + now - frame[2]
+
+        key = (code, line)
+        self.__hit[key] = self.__hit.get(key, 0) + 1
+        frame[1:] = [line, perf_counter()]
+
+    def __exit(self, code: object, *_):
+        """Record a function return, yield or unwind, giving the elapsed time
+        to the last line.
+
+        Parameters
+        ----------
+        code : `CodeType`
+            The exited code.
+        """
+        now: float = perf_counter()
+        stack: list = self.__stack.get(get_ident())
+
+        if not stack or stack[-1][0] is not code:
+            return
+
+        _, line, start = stack.pop()
+
+        if line is not None:
+            key: tuple = (code, line)
+            self.__time[key] = self.__time.get(key, 0) + now - start
+
+        outer: list = self.__outer(stack=stack, code=code)
+
+        # The outer call of the same function goes on.
+        if outer is not None:
+            outer[2] = perf_counter()
+
+    def __trace(self, frame: object, event: str, _) -> Callable:
+        """Global trace function, only following the chosen functions.
+
+        Parameters
+        ----------
+        frame : `FrameType`
+            The called frame.
+
+        event : `str`
+            The trace event.
+
+        Returns
+        -------
+        `Callable`
+            The local trace function, or `None` for other functions.
+        """
+        if event != "call" or frame.f_code not in self.__code:
+            return None
+
+        self.__enter(frame.f_code)
+
+        return self.__local_trace
+
+    def __local_trace(self, frame: object, event: str, _) -> Callable:
+        """Local trace function, recording lines and returns.
+
+        Parameters
+        ----------
+        frame : `FrameType`
+            The running frame.
+
+        event : `str`
+            The trace event.
+
+        Returns
+        -------
+        `Callable`
+            This function, to keep tracing the frame.
+        """
+        if event == "line":
+            self.__line(frame.f_code, frame.f_lineno)
+        elif event == "return":
+            self.__exit(frame.f_code)
+
+        return self.__local_trace
+
+    def data(self) -> dict:
+        """Get computed data.
+
+        Returns
+        -------
+        `dict`
+            Computed data, with a "line_evaluation" of every hit line and a
+            "line_source" with the annotated source of every function. Both
+            have "head", "label" and "data" keys.
+        """
+        line_key: list = sorted(self.__hit, key=lambda key: (
+            key[0].co_filename, key[1]
+        ))
+
+        hit: np.array = np.array([self.__hit[key] for key in line_key],
+                                 dtype=float)
+        time: np.array = np.array([self.__time.get(key, 0)
+                                   for key in line_key], dtype=float)
+
+        line_evaluation: dict = {
+            "head": np.array(["time (s)", "hits", "time per hit (s)",
+                              "line"]),
+            "label": np.array([
+                f"{basename(code.co_filename)}:{line}({code.co_name})"
+                for code, line in line_key
+            ], dtype=str),
+            "data": np.array([
+                time,
+                hit,
+                np.divide(time, hit, out=np.zeros_like(time), where=hit > 0)
+            ]).T.reshape(-1, 3)
+        }
+
+        # Annotated source, function by function.
+        source_label: list = []
+        source_data: list = []
+        total: float = max(float(np.sum(time)), sys.float_info.min)
+
+        for code in self.__code:
+            try:
+                source, first_line = getsourcelines(code)
+            except OSError:
+                continue
+
+            for i, source_line in enumerate(source):
+                line: int = first_line + i
+                source_label += [f"{basename(code.co_filename)}:{line} | "
+                                 f"{source_line.rstrip()}"]
+                source_data += [[
+                    self.__hit.get((code, line), 0),
+                    self.__time.get((code, line), 0),
+                    100 * self.__time.get((code, line), 0) / total
+                ]]
+
+        return {
+            "line_evaluation": line_evaluation,
+            "line_source": {
+                "head": np.array(["hits", "time (s)", "time (%)", "source"]),
+                "label": np.array(source_label, dtype=str),
+                "data": np.array(source_data, dtype=float).reshape(-1, 3)
+            }
+        }
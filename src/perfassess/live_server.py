@@ -0,0 +1,259 @@
+r"""A local HTTP server giving the current evaluations of a running process.
+
+Usage
+-----
+```py
+from perfassess.live_server import serve
+from perfassess.sampled_profiler import SampledProfiler
+
+sampler: SampledProfiler = SampledProfiler(rate=0.01)
+server = serve(source=sampler, port=8080)
+```
+
+Then, while the process runs, open "http://127.0.0.1:8080/" for the Plotly
+report, or get "http://127.0.0.1:8080/data.json" for the evaluations. With
+`serve(source=sampler, socket_path="/tmp/perfassess.sock")`, use
+`curl --unix-socket /tmp/perfassess.sock http://localhost/data.json`.
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [H]
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+# [J]
+import json
+# [O]
+import os
+from os.path import exists
+# [S]
+from socketserver import ThreadingMixIn, UnixStreamServer
+# [T]
+from threading import Thread
+# [U]
+from urllib.parse import urlsplit
+
+# [N]
+import numpy as np
+
+# [C]
+from .class_performance_assessor import PerformanceAssessor
+# [R]
+from .result_io import data_to_json
+# [S]
+from .session_server import remove_stale_socket
+
+
+class LiveServer(ThreadingHTTPServer):
+    """A HTTP server, on a TCP port, giving the evaluations of a source."""
+
+    daemon_threads: bool = True
+
+    def __init__(self, source: object, host: str = "127.0.0.1",
+                 port: int = 0):
+        """Initialize a LiveServer object.
+
+        Parameters
+        ----------
+        source : `object`
+            The evaluations source, with a `data()` method, like a
+            `PerformanceAssessor` or a `SampledProfiler`.
+
+        host : `str`, optional
+            The address to listen on. By default "127.0.0.1", so that only
+            the local machine can connect.
+
+        port : `int`, optional
+            The port to listen on. By default 0, letting the system choose.
+        """
+        self.source: object = source
+
+        super().__init__((host, port), _LiveHandler)
+
+
+class UnixLiveServer(ThreadingMixIn, UnixStreamServer):
+    """A HTTP server, on a Unix socket, giving the evaluations of a source.
+    Only the current user can connect.
+    """
+
+    daemon_threads: bool = True
+
+    def __init__(self, source: object, socket_path: str):
+        """Initialize a UnixLiveServer object.
+
+        Parameters
+        ----------
+        source : `object`
+            The evaluations source, with a `data()` method, like a
+            `PerformanceAssessor` or a `SampledProfiler`.
+
+        socket_path : `str`
+            The Unix socket path. A stale socket file is replaced.
+        """
+        self.source: object = source
+
+        remove_stale_socket(socket_path=socket_path)
+
+        super().__init__(socket_path, _LiveHandler)
+
+        os.chmod(socket_path, 0o600)
+
+    def server_close(self):
+        """Close the server and remove the socket file."""
+        super().server_close()
+
+        if exists(self.server_address):
+            os.unlink(self.server_address)
+
+
+class _LiveHandler(BaseHTTPRequestHandler):
+    """Answer "GET" requests: "/" gives the Plotly report, "/data.json" every
+    evaluation and "/data/<key>.json" one evaluation.
+    """
+
+    def do_GET(self):
+        """Answer a "GET" request."""
+        path: str = urlsplit(self.path).path
+
+        try:
+            data: dict = self.server.source.data()
+        except ValueError as error:
+            # Nothing computed yet.
+            self.__send(code=503, body={"status": "error",
+                                        "error": str(error)})
+            return
+
+        if path in ("/", "/index.html"):
+            self.__send(code=200, body=self.__report())
+        elif path == "/data.json":
+            self.__send(code=200, body=to_json(data=data))
+        elif path.startswith("/data/") and path.endswith(".json") \
+                and path[6:-5] in data:
+            key: str = path[6:-5]
+            self.__send(code=200, body=to_json(data={key: data[key]})[key])
+        else:
+            self.__send(code=404, body={"status": "error",
+                                        "error": f"Unknown path \"{path}\"."})
+
+    def __report(self) -> str:
+        """Draw every evaluation in one HTML page.
+
+        Returns
+        -------
+        `str`
+            The HTML page.
+        """
+        source: object = self.server.source
+
+        if not isinstance(source, PerformanceAssessor):
+            source = source.assessor()
+
+        html: str = ("<!DOCTYPE html><html><head><meta charset=\"utf-8\">"
+                     "<title>perfassess</title></head><body>")
+
+        for i, (key, plot_i) in enumerate(source.get_plot().items()):
+            # Plotly is only included once.
+            html += f"<h2>{escape(key)}</h2>" + plot_i.to_html(
+                full_html=False,
+                include_plotlyjs=i == 0
+            )
+
+        return html + "</body></html>"
+
+    def __send(self, code: int, body: object):
+        """Send an answer.
+
+        Parameters
+        ----------
+        code : `int`
+            The HTTP status code.
+
+        body : `object`
+            A HTML page as `str`, else an object sent as JSON.
+        """
+        if isinstance(body, str):
+            content_type: str = "text/html; charset=utf-8"
+        else:
+            content_type = "application/json"
+            body = json.dumps(body)
+
+        body = body.encode("utf-8")
+
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_):
+        """Do not log requests, to not mix them with the process output."""
+
+
+def to_json(data: dict) -> dict:
+    """Convert computed data into a strict JSON serializable dictionary, with
+    `None` instead of `nan` or infinite values.
+
+    Parameters
+    ----------
+    data : `dict`
+        Computed data, like given by `PerformanceAssessor.data()`.
+
+    Returns
+    -------
+    `dict`
+        The same data, with lists instead of `np.array`.
+    """
+    json_data: dict = data_to_json(data=data)
+
+    for key, evaluation in data.items():
+        value: np.array = np.asarray(evaluation["data"], dtype=float)
+        json_data[key]["data"] = np.where(np.isfinite(value),
+                                          value.astype(object),
+                                          None).tolist()
+
+    return json_data
+
+
+def serve(
+    source: object,
+    host: str = "127.0.0.1",
+    port: int = 0,
+    socket_path: str = None
+) -> object:
+    """Start a HTTP server in a background thread, while the process keeps
+    running.
+
+    Parameters
+    ----------
+    source : `object`
+        The evaluations source, with a `data()` method, like a
+        `PerformanceAssessor` or a `SampledProfiler`.
+
+    host : `str`, optional
+        The address to listen on. By default "127.0.0.1".
+
+    port : `int`, optional
+        The port to listen on. By default 0, letting the system choose. Read
+        the chosen one with `server.server_address`.
+
+    socket_path : `str`, optional
+        A Unix socket path, used instead of `host` and `port`. By default
+        None.
+
+    Returns
+    -------
+    `LiveServer` or `UnixLiveServer`
+        The started server. Stop it with `server.shutdown()`, then
+        `server.server_close()`.
+    """
+    if socket_path is None:
+        server: object = LiveServer(source=source, host=host, port=port)
+    else:
+        server = UnixLiveServer(source=source, socket_path=socket_path)
+
+    Thread(target=server.serve_forever, daemon=True,
+           name="perfassess live server").start()
+
+    return server
@@ -43,16 +43,76 @@ __date__ = "22/03/2024"
 __copyright__ = "MIT License"
 
 
-# [C]
-from .class_performance_assessor import PerformanceAssessor
-# [P]
-from .parse_argument.parse_argument import parse_argument
+# [O]
+import os
+# [S]
+import sys
+
+# [D]
+from .parse_argument.define_argument import (define_argument,
+                                             define_merge_argument,
+                                             define_suite_argument)
+# [S]
+from .session_client import request_session
 
 
 def main():
     """Main function.
     """
-    __argument = parse_argument(version=__version__)
+    # Imported here, so a session request does not pay for NumPy, Plotly
+    # and the profilers.
+    # pylint: disable=import-outside-toplevel
+    # Commands are given as the first argument.
+    if sys.argv[1:2] == ["suite"]:
+        from .suite import main as suite_main
+
+        sys.exit(suite_main(argument=define_suite_argument(
+            version=__version__
+        )))
+
+    if sys.argv[1:2] == ["merge"]:
+        from .merge import main as merge_main
+
+        sys.exit(merge_main(argument=define_merge_argument(
+            version=__version__
+        )))
+
+    __argument = define_argument(version=__version__)
+
+    # Let a running session server profile the function.
+    if __argument.session is not None:
+        request_session(argument=__argument)
+        return
+
+    from .class_performance_assessor import PerformanceAssessor
+    from .interpreter_compare import main as interpreter_main
+    from .parse_argument.check_argument import check_argument
+    from .result_cache import ResultCache, changed_file, file_state, run_key
+    from .result_io import save_result
+    # pylint: enable=import-outside-toplevel
+
+    # Checked once here, before any interpreter is launched.
+    __argument = check_argument(__argument)
+
+    # Let each interpreter profile the function, in a subprocess.
+    if __argument.python is not None:
+        sys.exit(interpreter_main(argument=__argument, argv=sys.argv[1:]))
+
+    cache: ResultCache = None
+
+    # Reuse the results of an unchanged target.
+    if __argument.cache is not None:
+        cache = ResultCache(path=__argument.cache,
+                            max_size=__argument.cache_size)
+        key: str = run_key(argument=__argument)
+
+        if not __argument.force and cache.get(key=key,
+                                              output=__argument.output):
+            print("Unchanged target, results reused from the cache "
+                  f"\"{__argument.cache}\".")
+            return
+
+        state: dict = file_state(path=__argument.output)
 
     assessor: PerformanceAssessor = PerformanceAssessor(
         main=__argument.function,
@@ -60,9 +120,49 @@ def main():
         **__argument.argument
     )
 
-    assessor.launch_profiling()
+    assessor.launch_profiling(
+        do_gc=__argument.gc_trace,
+        do_object=__argument.object,
+        gc_mode=__argument.gc_mode,
+        line_function=__argument.line,
+        time_backend=__argument.time_backend,
+        include=__argument.include,
+        exclude=__argument.exclude,
+        sample_interval=__argument.sample_interval,
+        do_noise=__argument.noise,
+        cpu=__argument.cpu,
+        priority=__argument.priority,
+        reset_peak=__argument.reset_peak,
+        max_noise=__argument.max_noise,
+        n_retry=__argument.retry
+    )
+
+    if __argument.leak is not None:
+        assessor.launch_leak_detection(n_call=__argument.leak)
+
+    if __argument.throughput is not None:
+        assessor.launch_throughput(
+            max_concurrency=__argument.throughput,
+            duration=__argument.throughput_duration,
+            worker_type=tuple(__argument.throughput_worker)
+        )
+
+    if __argument.import_profiling is not None:
+        assessor.add_evaluation(
+            key="import_evaluation",
+            evaluation=__argument.import_profiling
+        )
+
     assessor.plot(path=__argument.output)
 
+    if __argument.export:
+        save_result(data=assessor.data(),
+                    path=os.path.join(__argument.output, "result.json"))
+
+    if cache is not None:
+        cache.put(key=key, path_list=changed_file(path=__argument.output,
+                                                  state=state))
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,182 @@
+r"""An object to sample the memory used over time, in a background thread.
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [A]
+from array import array
+# [I]
+from inspect import unwrap
+# [O]
+import os
+# [S]
+import sys
+# [T]
+from threading import Event, Thread, get_ident
+from time import perf_counter
+import tracemalloc
+from typing import Callable
+
+# [N]
+import numpy as np
+
+
+def read_rss() -> float:
+    """Read the current resident memory (RSS) from `/proc/self/statm`.
+
+    Returns
+    -------
+    `float`
+        The RSS in Kib, `nan` when `/proc` does not exist.
+    """
+    try:
+        with open("/proc/self/statm", "rb") as file:
+            page: int = int(file.read().split()[1])
+    except OSError:
+        return np.nan
+
+    return page * os.sysconf("SC_PAGE_SIZE") / 1024
+
+
+class MemorySampler:
+    """A class to sample, at a fixed interval, the traced memory, the RSS and
+    the function currently run by the tested one, called a phase.
+
+    Samples are kept in compact `array.array` buffers. The sampling thread
+    needs the GIL, so an interval under `sys.getswitchinterval()` (5 ms by
+    default) is not always kept while pure python code runs.
+    """
+
+    def __init__(self, function: Callable = None, interval: float = 0.01):
+        """Initialize a MemorySampler object.
+
+        Parameters
+        ----------
+        function : `Callable`, optional
+            The tested function, which children give the phases. By default
+            None, the phases being the running functions.
+
+        interval : `float`, optional
+            The time between two samples, in seconds. By default 0.01.
+
+        Raises
+        ------
+        `ValueError`
+            If the interval is not strictly positive.
+        """
+        if interval <= 0:
+            raise ValueError(f"[Err##] Given sampling interval \"{interval}\""
+                             " should be strictly positive.")
+
+        self.__code: object = getattr(unwrap(function), "__code__", None)
+        self.__name: str = getattr(function, "__name__", str(function))
+        self.__interval: float = interval
+
+        # One value per sample.
+        self.__time: array = array("d")
+        self.__traced: array = array("d")
+        self.__rss: array = array("d")
+        # Unsigned ints: more than 65_535 phase names may be seen.
+        self.__phase: array = array("I")
+        # Phase names, indexed by the phase buffer.
+        self.__phase_name: dict = {}
+
+        self.__origin: float = 0
+        self.__thread_id: int = None
+        self.__stop_event: Event = Event()
+        self.__thread: Thread = None
+
+    def start(self):
+        """Start to sample memory, from the thread running the tested
+        function.
+        """
+        self.__thread_id = get_ident()
+        self.__origin = perf_counter()
+        self.__stop_event.clear()
+        self.__sample()
+
+        self.__thread = Thread(target=self.__run, daemon=True,
+                               name="perfassess memory sampler")
+        self.__thread.start()
+
+    def stop(self):
+        """Stop to sample memory, taking a last sample."""
+        self.__stop_event.set()
+
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+        self.__sample()
+
+    def __run(self):
+        """Sample memory until stopped."""
+        while not self.__stop_event.wait(self.__interval):
+            self.__sample()
+
+    def __sample(self):
+        """Take one sample."""
+        self.__time.append(perf_counter() - self.__origin)
+        self.__traced.append(tracemalloc.get_traced_memory()[0] / 1024
+                             if tracemalloc.is_tracing() else np.nan)
+        self.__rss.append(read_rss())
+
+        phase: str = self.__get_phase()
+        self.__phase.append(self.__phase_name.setdefault(
+            phase,
+            len(self.__phase_name)
+        ))
+
+    def __get_phase(self) -> str:
+        """Get the function currently run by the tested one.
+
+        Returns
+        -------
+        `str`
+            The running child of the tested function, the tested function
+            itself when it runs its own code, or "outside" when it is not
+            running. Without tested function, the running function.
+        """
+        # pylint: disable=protected-access
+        # The only way to read the stack of another thread.
+        frame: object = sys._current_frames().get(self.__thread_id)
+        # pylint: enable=protected-access
+        child: object = None
+
+        if self.__code is None:
+            return "outside" if frame is None else frame.f_code.co_name
+
+        # Go up the stack until the tested function.
+        while frame is not None:
+            if frame.f_code is self.__code:
+                return self.__name if child is None else child.f_code.co_name
+
+            child = frame
+            frame = frame.f_back
+
+        return "outside"
+
+    def data(self) -> dict:
+        """Get computed data.
+
+        Returns
+        -------
+        `dict`
+            Computed data, with "head", "label" and "data" keys. There is one
+            row per sample, labelled by its phase.
+        """
+        phase_name: np.array = np.array(list(self.__phase_name), dtype=str)
+
+        return {
+            "head": np.array(["time (s)", "traced (Kib)", "rss (Kib)",
+                              "phase"]),
+            "label": phase_name[np.frombuffer(self.__phase, dtype=np.uintc)]
+            if len(self.__phase) else np.array([], dtype=str),
+            "data": np.array([
+                np.frombuffer(self.__time, dtype=float),
+                np.frombuffer(self.__traced, dtype=float),
+                np.frombuffer(self.__rss, dtype=float)
+            ]).T.reshape(-1, 3)
+        }
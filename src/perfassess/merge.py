@@ -0,0 +1,355 @@
+r"""Merge results of many runs, processes or hosts into one report.
+
+Usage
+-----
+Export results with `perfassess ... --export`, then launch:
+
+```sh
+$ perfassess merge node_*/result.json -o output_directory/ --n_field 2
+```
+
+Input files are read one by one: only one result and the merged values are
+in memory at a time, so thousands of inputs can be merged.
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [O]
+import os
+from os.path import isdir, join
+# [T]
+from typing import Iterable, Iterator
+# [W]
+from warnings import warn
+
+# [N]
+import numpy as np
+
+# [C]
+from .class_performance_assessor import PerformanceAssessor
+# [R]
+from .result_io import load_result, save_result, trim_label
+
+
+# How the columns of the sources are merged in "sum" mode, by head name.
+# Other columns are summed.
+REDUCTION: dict = {
+    **dict.fromkeys((
+        "max pause (s)", "rss peak (Kib)", "traced peak (Kib)",
+        "peak memory (Kib)"
+    ), "max"),
+    **dict.fromkeys((
+        "cpu / wall", "rss start (Kib)", "rss end (Kib)", "r2",
+        "time (%)", "latency (s)", "latency p95 (s)", "speedup",
+        "efficiency", "concurrency", "depth", "noise (%)",
+        "calibration min (s)", "calibration median (s)", "load 1 min",
+        "load 5 min", "load 15 min", "cpu frequency (MHz)", "pinned cpus",
+        "priority", "time budget (s)", "memory budget (Kib)",
+        "peak memory budget (Kib)"
+    ), "mean")
+}
+# Columns computed again after a sum: (column, numerator, denominator,
+# numerator factor).
+RATIO: tuple = (
+    ("average size (b)", "size (Kib)", "allocations", 1024),
+    ("time per hit (s)", "time (s)", "hits", 1)
+)
+
+
+def iter_path(path_list: Iterable) -> Iterator[str]:
+    """Go through result files, a directory giving all its `.json` files.
+
+    Parameters
+    ----------
+    path_list : `Iterable`
+        The result files or directories.
+
+    Yields
+    ------
+    `str`
+        A result file path.
+    """
+    for path in path_list:
+        if isdir(path):
+            yield from sorted(join(path, name) for name in os.listdir(path)
+                              if name.endswith(".json"))
+        else:
+            yield path
+
+
+class _Merger:
+    """Merge one evaluation over the sources, keeping for each label the sum,
+    the number of sources and, with Welford's algorithm, the mean and the
+    spread of the per source values. In "sum" mode, the columns of
+    `REDUCTION` give their maximum or their mean instead of their sum.
+    """
+
+    def __init__(self, head: np.array):
+        """Initialize a _Merger object.
+
+        Parameters
+        ----------
+        head : `np.array`
+            The evaluation header.
+        """
+        self.head: np.array = head
+        self.index: dict = {}
+        self.size: int = 0
+
+        reduction: np.array = np.array([REDUCTION.get(str(head_i), "sum")
+                                        for head_i in head[:-1]])
+        self.maximum_column: np.array = reduction == "max"
+        self.mean_column: np.array = reduction == "mean"
+
+        n_column: int = len(head) - 1
+
+        self.total: np.array = np.zeros((16, n_column))
+        self.mean: np.array = np.zeros((16, n_column))
+        self.m2: np.array = np.zeros((16, n_column))
+        self.minimum: np.array = np.full((16, n_column), np.inf)
+        self.maximum: np.array = np.full((16, n_column), -np.inf)
+        self.count: np.array = np.zeros(16)
+
+    def __grow(self):
+        """Double the arrays size, to add new labels."""
+        for name, fill in (("total", 0), ("mean", 0), ("m2", 0),
+                           ("minimum", np.inf), ("maximum", -np.inf),
+                           ("count", 0)):
+            array: np.array = getattr(self, name)
+            setattr(self, name, np.concatenate(
+                (array, np.full(array.shape, fill, dtype=float))
+            ))
+
+    def add(self, label: np.array, data: np.array):
+        """Add the evaluation of one source.
+
+        Parameters
+        ----------
+        label : `np.array`
+            The normalized labels.
+
+        data : `np.array`
+            The numerical data.
+        """
+        index: np.array = np.empty(len(label), dtype=int)
+
+        for i, label_i in enumerate(label):
+            if label_i not in self.index:
+                if self.size == len(self.count):
+                    self.__grow()
+
+                self.index[label_i] = self.size
+                self.size += 1
+
+            index[i] = self.index[label_i]
+
+        # Labels trimmed to the same name are merged in the source first.
+        index, inverse = np.unique(index, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        value: np.array = np.zeros((len(index), data.shape[1]))
+        np.add.at(value, inverse, data)
+
+        if self.maximum_column.any():
+            maximum: np.array = np.full(value.shape, -np.inf)
+            np.maximum.at(maximum, inverse, data)
+            value[:, self.maximum_column] = maximum[:, self.maximum_column]
+
+        if self.mean_column.any():
+            value[:, self.mean_column] /= np.bincount(inverse)[:, None]
+
+        self.total[index] += value
+        self.count[index] += 1
+        self.minimum[index] = np.minimum(self.minimum[index], value)
+        self.maximum[index] = np.maximum(self.maximum[index], value)
+
+        delta: np.array = value - self.mean[index]
+        self.mean[index] += delta / self.count[index, None]
+        self.m2[index] += delta * (value - self.mean[index])
+
+    def data(self, mode: str) -> tuple:
+        """Get the merged evaluation and its spread.
+
+        Parameters
+        ----------
+        mode : `str`
+            "sum" or "mean".
+
+        Returns
+        -------
+        `tuple`
+            The merged evaluation, and the spread evaluation, with the
+            minimum, the maximum and the standard deviation of each column
+            over the sources, plus the number of sources.
+        """
+        size: int = self.size
+        label: np.array = np.array(list(self.index), dtype=str)
+        value: np.array = (self.total if mode == "sum" else self.mean)[:size]
+        value = value.copy()
+        head: list = list(self.head)
+
+        # Peaks, ratios or machine states are not added up.
+        if mode == "sum":
+            value[:, self.maximum_column] = \
+                self.maximum[:size, self.maximum_column]
+            value[:, self.mean_column] = self.mean[:size, self.mean_column]
+
+        # Per call values have to be computed again after a sum.
+        if mode == "sum" and "ncalls" in head:
+            ncalls: np.array = value[:, head.index("ncalls")]
+
+            for i, head_i in enumerate(head[:-1]):
+                if head_i.startswith("percall") and i > 0:
+                    value[:, i] = np.divide(value[:, i - 1], ncalls,
+                                            out=np.zeros(size),
+                                            where=ncalls > 0)
+
+        # Like the average allocation size.
+        for column, numerator, denominator, factor in RATIO:
+            if mode != "sum" or column not in head:
+                continue
+
+            total: np.array = value[:, head.index(denominator)]
+            value[:, head.index(column)] = np.divide(
+                value[:, head.index(numerator)] * factor, total,
+                out=np.zeros(size), where=total > 0
+            )
+
+        count: np.array = self.count[:size, None]
+        std: np.array = np.sqrt(np.divide(
+            self.m2[:size], count - 1,
+            out=np.zeros_like(self.m2[:size]),
+            where=count > 1
+        ))
+
+        spread_head: list = [
+            f"{head_i} {stat}" for head_i in head[:-1]
+            for stat in ("min", "max", "std")
+        ]
+
+        return (
+            {"head": self.head, "label": label, "data": value},
+            {
+                "head": np.array(spread_head + ["sources", head[-1]]),
+                "label": label,
+                "data": np.hstack((
+                    np.stack((self.minimum[:size], self.maximum[:size], std),
+                             axis=2).reshape(size, -1),
+                    count
+                ))
+            }
+        )
+
+
+def merge_result(
+    path_list: Iterable,
+    n_field: int = 0,
+    mode: str = "sum"
+) -> dict:
+    """Merge exported results, reading them one by one.
+
+    Parameters
+    ----------
+    path_list : `Iterable`
+        The result files, like written by `save_result()`, or directories
+        containing them.
+
+    n_field : `int`, optional
+        The number of label fields to keep, to align functions of different
+        hosts. By default 0, keeping everything.
+
+    mode : `str`, optional
+        "sum" to add the sources values, or "mean" to average them over the
+        sources having the label. By default "sum".
+
+    Returns
+    -------
+    `dict`
+        Merged data, with each merged evaluation, a "<key>_spread" evaluation
+        for each one, and a "merge_evaluation" with the number of sources
+        per evaluation.
+
+    Raises
+    ------
+    `ValueError`
+        If `mode` is not "sum" or "mean", or if no result is given.
+    """
+    if mode not in ("sum", "mean"):
+        raise ValueError(f"[Err##] Given mode \"{mode}\" should be \"sum\" "
+                         "or \"mean\".")
+
+    merger_dict: dict = {}
+    n_source: dict = {}
+
+    for path in iter_path(path_list=path_list):
+        for key, evaluation in load_result(path=path).items():
+            data: np.array = evaluation["data"]
+
+            # Timelines have one row per event, not per label.
+            if key.endswith("_timeline") or data.ndim != 2:
+                continue
+
+            head: np.array = evaluation["head"]
+
+            if key not in merger_dict:
+                merger_dict[key] = _Merger(head=head)
+            elif not np.array_equal(merger_dict[key].head, head):
+                warn(f"[Warn##] Evaluation \"{key}\" of \"{path}\" has "
+                     "another header, it is skipped.", RuntimeWarning)
+                continue
+
+            merger_dict[key].add(
+                label=[trim_label(label=str(label), n_field=n_field)
+                       for label in evaluation["label"]],
+                data=data
+            )
+            n_source[key] = n_source.get(key, 0) + 1
+
+    if not merger_dict:
+        raise ValueError("[Err##] No result to merge.")
+
+    merged: dict = {
+        "merge_evaluation": {
+            "head": np.array(["sources", "evaluation"]),
+            "label": np.array(list(n_source), dtype=str),
+            "data": np.array([list(n_source.values())], dtype=float).T
+        }
+    }
+
+    for key, merger in merger_dict.items():
+        merged[key], merged[f"{key}_spread"] = merger.data(mode=mode)
+
+    return merged
+
+
+def main(argument: object) -> int:
+    """Merge results from parsed command line arguments, then write the
+    report and the merged result file.
+
+    Parameters
+    ----------
+    argument : `ArgumentParser`
+        The parsed arguments, with "result", "output", "n_field" and "mode".
+
+    Returns
+    -------
+    `int`
+        The exit status, 0.
+    """
+    merged: dict = merge_result(path_list=argument.result,
+                                n_field=argument.n_field,
+                                mode=argument.mode)
+
+    assessor: PerformanceAssessor = PerformanceAssessor(main=None)
+
+    for key, evaluation in merged.items():
+        assessor.add_evaluation(key=key, evaluation=evaluation)
+
+    assessor.plot(path=argument.output)
+    save_result(data=merged, path=join(argument.output, "merge_result.json"))
+
+    print(f"Merged {len(merged) // 2} evaluations into "
+          f"\"{argument.output}\".")
+
+    return 0
@@ -0,0 +1,80 @@
+r"""Contains functions to share `sys.monitoring` (PEP 669) tools.
+
+`sys.monitoring` only exists since python 3.12. On older interpreters,
+`HAS_MONITORING` is `False` and callers have to use another method.
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [S]
+import sys
+
+
+HAS_MONITORING: bool = hasattr(sys, "monitoring")
+
+
+def acquire_tool_id(name: str) -> int:
+    """Reserve a free `sys.monitoring` tool identifier.
+
+    Parameters
+    ----------
+    name : `str`
+        The tool name.
+
+    Returns
+    -------
+    `int`
+        The reserved tool identifier.
+
+    Raises
+    ------
+    `RuntimeError`
+        If `sys.monitoring` does not exist, or if every tool identifier is
+        already used.
+    """
+    if not HAS_MONITORING:
+        raise RuntimeError("[Err##] sys.monitoring needs python 3.12 or "
+                           "higher.")
+
+    # Identifiers without a standard role first, as cProfile itself uses the
+    # profiler one since python 3.12.
+    for tool_id in (3, 4, *range(6)):
+        if sys.monitoring.get_tool(tool_id) is None:
+            sys.monitoring.use_tool_id(tool_id, name)
+
+            return tool_id
+
+    raise RuntimeError("[Err##] Every sys.monitoring tool identifier is "
+                       "already used.")
+
+
+def release_tool_id(tool_id: int, code_list: list = ()):
+    """Remove every event and callback of a tool, then free its identifier.
+
+    Parameters
+    ----------
+    tool_id : `int`
+        The tool identifier.
+
+    code_list : `list`, optional
+        The code objects with local events to remove. By default ().
+    """
+    sys.monitoring.set_events(tool_id, sys.monitoring.events.NO_EVENTS)
+
+    for code in code_list:
+        sys.monitoring.set_local_events(tool_id, code,
+                                        sys.monitoring.events.NO_EVENTS)
+
+    for event in (
+        "PY_START", "PY_RESUME", "PY_RETURN", "PY_YIELD", "PY_UNWIND",
+        "PY_THROW", "LINE", "CALL", "C_RETURN", "C_RAISE"
+    ):
+        sys.monitoring.register_callback(
+            tool_id,
+            getattr(sys.monitoring.events, event),
+            None
+        )
+
+    sys.monitoring.free_tool_id(tool_id)
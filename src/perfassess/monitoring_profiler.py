@@ -0,0 +1,327 @@
+r"""A deterministic time profiler based on `sys.monitoring` (PEP 669).
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [C]
+import contextlib
+# [O]
+from os.path import basename, dirname, join
+# [S]
+import sys
+# [T]
+from threading import get_ident
+from time import perf_counter
+
+# [N]
+import numpy as np
+
+# [C]
+from .code_filter import CodeFilter
+# [M]
+from . import monitoring
+from .monitoring import acquire_tool_id, release_tool_id
+
+
+# The profiler own files, never profiled. "contextlib" runs the profiled code
+# blocks, the memory sampler runs in its own thread, and the other ones call
+# the profiled code.
+OWN_FILE: set = {
+    __file__,
+    monitoring.__file__,
+    contextlib.__file__
+} | {
+    join(dirname(__file__), name)
+    for name in ("block_profiling.py", "class_performance_assessor.py",
+                 "leak_detector.py", "memory_sampler.py", "pytest_plugin.py",
+                 "sampled_profiler.py", "throughput.py")
+}
+
+
+class MonitoringProfiler:
+    """A class to profile python functions with `sys.monitoring`, needing
+    python 3.12 or higher.
+
+    The profiler own code is switched off with `sys.monitoring.DISABLE` on
+    its first event, so it costs nothing afterwards. Code removed by the
+    filter is not switched off, as it would stay off for the later runs with
+    other filters: its events only check a cached decision. Its time is
+    given to the nearest kept caller "tottime". Built-in functions are not
+    profiled, their time is also given to their caller.
+
+    Each kept event calls a python function, which is slower than the C hooks
+    of cProfile. This profiler is so the cheapest when a filter keeps only
+    the code of interest. Each thread has its own stack of running frames.
+    """
+
+    def __init__(self, code_filter: CodeFilter = None):
+        """Initialize a MonitoringProfiler object.
+
+        Parameters
+        ----------
+        code_filter : `CodeFilter`, optional
+            The filter choosing which code is profiled. By default None,
+            profiling everything.
+        """
+        self.__code_filter: CodeFilter = code_filter or CodeFilter()
+        # [ncalls, tottime, cumtime] by code.
+        self.__stat: dict = {}
+        # If each code is profiled.
+        self.__kept: dict = {}
+        # Running frames by thread: [code, start time, time spent in
+        # children].
+        self.__stack: dict = {}
+        # Number of running frames by thread and code, to not count
+        # recursion twice.
+        self.__depth: dict = {}
+        self.__tool_id: int = None
+
+    def enable(self):
+        """Start to profile."""
+        self.__tool_id = acquire_tool_id(name="perfassess profiler")
+        event: object = sys.monitoring.events
+
+        for event_i, callback in (
+            (event.PY_START, self.__start),
+            (event.PY_RESUME, self.__resume),
+            (event.PY_RETURN, self.__return),
+            (event.PY_YIELD, self.__return),
+            (event.PY_THROW, self.__throw),
+            (event.PY_UNWIND, self.__unwind)
+        ):
+            sys.monitoring.register_callback(self.__tool_id, event_i,
+                                             callback)
+
+        sys.monitoring.set_events(
+            self.__tool_id,
+            event.PY_START | event.PY_RESUME | event.PY_RETURN
+            | event.PY_YIELD | event.PY_THROW | event.PY_UNWIND
+        )
+
+    def disable(self):
+        """Stop to profile."""
+        if self.__tool_id is not None:
+            release_tool_id(tool_id=self.__tool_id)
+            self.__tool_id = None
+
+    def __start(self, code: object, _) -> object:
+        """Record a function call.
+
+        Parameters
+        ----------
+        code : `CodeType`
+            The called code.
+
+        Returns
+        -------
+        `object`
+            `sys.monitoring.DISABLE` for the profiler own code, else `None`.
+        """
+        if not self.__keep(code=code):
+            return self.__skip(code=code)
+
+        self.__stat.setdefault(code, [0, 0, 0])[0] += 1
+        self.__push(code=code)
+
+        return None
+
+    def __resume(self, code: object, _) -> object:
+        """Record a generator or coroutine resume.
+
+        Parameters
+        ----------
+        code : `CodeType`
+            The resumed code.
+
+        Returns
+        -------
+        `object`
+            `sys.monitoring.DISABLE` for the profiler own code, else `None`.
+        """
+        if not self.__keep(code=code):
+            return self.__skip(code=code)
+
+        self.__stat.setdefault(code, [0, 0, 0])
+        self.__push(code=code)
+
+        return None
+
+    def __throw(self, code: object, *_):
+        """Record a generator or coroutine resumed by a thrown exception.
+        This event cannot be disabled.
+
+        Parameters
+        ----------
+        code : `CodeType`
+            The resumed code.
+        """
+        if self.__keep(code=code):
+            self.__stat.setdefault(code, [0, 0, 0])
+            self.__push(code=code)
+
+    def __return(self, code: object, *_) -> object:
+        """Record a function return or yield.
+
+        Parameters
+        ----------
+        code : `CodeType`
+            The exited code.
+
+        Returns
+        -------
+        `object`
+            `sys.monitoring.DISABLE` for the profiler own code, else `None`.
+        """
+        if not self.__keep(code=code):
+            return self.__skip(code=code)
+
+        self.__pop(code=code)
+
+        return None
+
+    def __unwind(self, code: object, *_):
+        """Record a function exited by an exception. This event cannot be
+        disabled.
+
+        Parameters
+        ----------
+        code : `CodeType`
+            The exited code.
+        """
+        self.__pop(code=code)
+
+    def __keep(self, code: object) -> bool:
+        """Check if a code is profiled.
+
+        Parameters
+        ----------
+        code : `CodeType`
+            The code to check.
+
+        Returns
+        -------
+        `bool`
+            `True` if the code is profiled.
+        """
+        kept: bool = self.__kept.get(code)
+
+        if kept is None:
+            kept = (code.co_filename not in OWN_FILE
+                    and self.__code_filter.match(code.co_filename))
+            self.__kept[code] = kept
+
+        return kept
+
+    @staticmethod
+    def __skip(code: object) -> object:
+        """Choose how to skip a code which is not profiled.
+
+        Parameters
+        ----------
+        code : `CodeType`
+            The skipped code.
+
+        Returns
+        -------
+        `object`
+            `sys.monitoring.DISABLE` for the profiler own code, never
+            profiled, else `None`.
+        """
+        if code.co_filename in OWN_FILE:
+            return sys.monitoring.DISABLE
+
+        return None
+
+    def __push(self, code: object):
+        """Add a running frame.
+
+        Parameters
+        ----------
+        code : `CodeType`
+            The running code.
+        """
+        thread: int = get_ident()
+
+        self.__depth[thread, code] = self.__depth.get((thread, code), 0) + 1
+        self.__stack.setdefault(thread, []).append([code, perf_counter(), 0])
+
+    def __pop(self, code: object):
+        """Remove a running frame, giving its time to the statistics.
+
+        Parameters
+        ----------
+        code : `CodeType`
+            The exited code.
+        """
+        now: float = perf_counter()
+        thread: int = get_ident()
+        stack: list = self.__stack.get(thread)
+
+        # Frames started before the profiler are not followed.
+        if not stack or stack[-1][0] is not code:
+            return
+
+        _, start, child = stack.pop()
+        elapsed: float = now - start
+        stat: list = self.__stat[code]
+
+        stat[1] += elapsed - child
+        self.__depth[thread, code] -= 1
+
+        # Recursive calls are already in the outer call time.
+        if self.__depth[thread, code] == 0:
+            stat[2] += elapsed
+
+        if stack:
+            stack[-1][2] += elapsed
+
+    def stat(self) -> dict:
+        """Get the raw statistics.
+
+        Returns
+        -------
+        `dict`
+            The `[ncalls, tottime, cumtime]` by `(filename, lineno, function)`,
+            like `pstats` keys.
+        """
+        return {
+            (code.co_filename, code.co_firstlineno, code.co_name): list(stat)
+            for code, stat in self.__stat.items()
+        }
+
+    def data(self) -> dict:
+        """Get computed data.
+
+        Returns
+        -------
+        `dict`
+            Computed data, with "head", "label" and "data" keys, like the
+            cProfile time evaluation.
+        """
+        code_list: list = list(self.__stat)
+        stat: np.array = np.array([self.__stat[code] for code in code_list],
+                                  dtype=float).reshape(-1, 3)
+        ncalls: np.array = stat[:, 0]
+
+        # Resumed only generators have no calls.
+        per_call: np.array = np.where(ncalls > 0, ncalls, 1)
+
+        return {
+            "head": np.array(["ncalls", "tottime (s)", "percall (s)",
+                              "cumtime (s)", "percall (s)",
+                              "filename:lineno(function)"]),
+            "label": np.array([
+                f"{basename(code.co_filename)}:{code.co_firstlineno}"
+                f"({code.co_name})"
+                for code in code_list
+            ], dtype=str),
+            "data": np.array([
+                ncalls,
+                stat[:, 1],
+                stat[:, 1] / per_call,
+                stat[:, 2],
+                stat[:, 2] / per_call
+            ]).T.reshape(-1, 5)
+        }
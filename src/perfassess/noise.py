@@ -0,0 +1,335 @@
+r"""An object to reduce and to measure the noise of the machine during a run.
+
+The run can be pinned to some CPUs and given a higher priority. The load, the
+CPU frequency and the governor are read from `/proc` and `/sys` when they are
+readable. The noise is the spread of the times of a short calibration loop,
+run before and after the measure: a busy or throttled machine gives spread
+times.
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [O]
+import os
+# [T]
+from time import perf_counter
+# [W]
+from warnings import warn
+
+# [N]
+import numpy as np
+
+
+# Header of the noise evaluation, the last one being the label column.
+HEAD: np.array = np.array([
+    "noise (%)", "calibration min (s)", "calibration median (s)",
+    "load 1 min", "load 5 min", "load 15 min", "cpu frequency (MHz)",
+    "pinned cpus", "priority", "governor"
+])
+# Directory of the CPUs frequency scaling, by CPU.
+CPUFREQ_DIR: str = "/sys/devices/system/cpu/cpu{cpu}/cpufreq"
+
+
+def read_file(path: str) -> str:
+    """Read a small system file.
+
+    Parameters
+    ----------
+    path : `str`
+        The file path, like in `/proc` or `/sys`.
+
+    Returns
+    -------
+    `str`
+        The stripped content, or `None` when the file is not readable.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            return file.read().strip()
+    except OSError:
+        return None
+
+
+def read_load() -> list:
+    """Read the load averages of `/proc/loadavg`.
+
+    Returns
+    -------
+    `list`
+        The 1, 5 and 15 minutes load averages, `nan` when not readable.
+    """
+    content: str = read_file(path="/proc/loadavg")
+
+    if content is None:
+        return [np.nan] * 3
+
+    return [float(value) for value in content.split()[:3]]
+
+
+def read_frequency(cpu: list) -> float:
+    """Read the mean current frequency of CPUs, from `/sys`, else from
+    `/proc/cpuinfo`.
+
+    Parameters
+    ----------
+    cpu : `list`
+        The CPU numbers.
+
+    Returns
+    -------
+    `float`
+        The mean frequency in MHz, `nan` when not readable.
+    """
+    frequency: list = []
+
+    for cpu_i in cpu:
+        content: str = read_file(path=f"{CPUFREQ_DIR.format(cpu=cpu_i)}"
+                                 "/scaling_cur_freq")
+
+        if content is not None:
+            # Given in kHz.
+            frequency += [float(content) / 1000]
+
+    # Virtual machines often have no frequency scaling.
+    if not frequency:
+        content = read_file(path="/proc/cpuinfo") or ""
+        frequency = [float(line.partition(":")[2])
+                     for line in content.split("\n")
+                     if line.startswith("cpu MHz")]
+
+    return float(np.mean(frequency)) if frequency else np.nan
+
+
+def read_governor(cpu: list) -> str:
+    """Read the frequency governors of CPUs, from `/sys`.
+
+    Parameters
+    ----------
+    cpu : `list`
+        The CPU numbers.
+
+    Returns
+    -------
+    `str`
+        The governors, like "performance", comma separated when they differ,
+        or "unknown" when not readable.
+    """
+    governor: list = [
+        read_file(path=f"{CPUFREQ_DIR.format(cpu=cpu_i)}/scaling_governor")
+        for cpu_i in cpu
+    ]
+    governor = sorted({governor_i for governor_i in governor if governor_i})
+
+    return ",".join(governor) or "unknown"
+
+
+def calibrate(n_loop: int = 20, size: int = 20_000) -> np.array:
+    """Time a short pure python loop many times.
+
+    Parameters
+    ----------
+    n_loop : `int`, optional
+        The number of timed loops. By default 20.
+
+    size : `int`, optional
+        The number of iterations of each loop. By default 20_000.
+
+    Returns
+    -------
+    `np.array`
+        The time of each loop, in seconds.
+    """
+    time: np.array = np.zeros(n_loop)
+
+    # The first loop warms the caches up, and is not kept.
+    for index in range(-1, n_loop):
+        start: float = perf_counter()
+        total: int = 0
+
+        for value in range(size):
+            total += value
+
+        time[max(index, 0)] = perf_counter() - start
+
+    return time
+
+
+def noise_score(time: np.array) -> float:
+    """Compute the noise of calibration times.
+
+    Parameters
+    ----------
+    time : `np.array`
+        The calibration times.
+
+    Returns
+    -------
+    `float`
+        The coefficient of variation of the times, in %.
+    """
+    return float(np.std(time) / np.mean(time) * 100)
+
+
+class NoiseMonitor:
+    """A class to pin a run to some CPUs, to change its priority, and to
+    measure the noise of the machine around it.
+
+    Pinning uses `os.sched_setaffinity()` and the priority
+    `os.setpriority()`. When they are not available, or not allowed, a
+    warning is given and the run goes on without them. Both are given back
+    after the run.
+    """
+
+    def __init__(self, cpu: list = None, priority: int = None):
+        """Initialize a NoiseMonitor object.
+
+        Parameters
+        ----------
+        cpu : `list`, optional
+            The CPUs to run on. By default None, keeping the current ones.
+
+        priority : `int`, optional
+            The "nice" value of the process, from -20 (the highest priority,
+            often needing privileges) to 19. By default None, keeping the
+            current one.
+        """
+        self.__cpu: list = cpu
+        self.__priority: int = priority
+        self.__previous_cpu: set = None
+        self.__previous_priority: int = None
+        self.__time: np.array = np.zeros(0)
+        self.__environment: list = []
+
+    def __pin(self):
+        """Pin the process to the given CPUs.
+
+        Raises
+        ------
+        `ValueError`
+            If the given CPUs do not exist or are not available.
+        """
+        if not hasattr(os, "sched_setaffinity"):
+            warn("[Warn##] CPU pinning needs os.sched_setaffinity(), not "
+                 "available on this system. The run is not pinned.",
+                 RuntimeWarning)
+            return
+
+        self.__previous_cpu = os.sched_getaffinity(0)
+
+        try:
+            os.sched_setaffinity(0, self.__cpu)
+        except OSError as error:
+            self.__previous_cpu = None
+            raise ValueError(f"[Err##] Given cpu \"{self.__cpu}\" cannot be "
+                             f"used: {error}") from error
+
+    def __set_priority(self):
+        """Set the priority of the process."""
+        if not hasattr(os, "setpriority"):
+            warn("[Warn##] Priority needs os.setpriority(), not available "
+                 "on this system. The priority is not changed.",
+                 RuntimeWarning)
+            return
+
+        previous: int = os.getpriority(os.PRIO_PROCESS, 0)
+
+        try:
+            os.setpriority(os.PRIO_PROCESS, 0, self.__priority)
+        except OSError as error:
+            warn(f"[Warn##] Priority \"{self.__priority}\" cannot be set "
+                 f"({error}), the priority is not changed.", RuntimeWarning)
+            return
+
+        self.__previous_priority = previous
+
+    @staticmethod
+    def __read_environment() -> list:
+        """Read the load, the frequency, the number and the governor of the
+        used CPUs, and the priority.
+
+        Returns
+        -------
+        `list`
+            The load averages, the CPU frequency, the number of CPUs, the
+            priority and the governor.
+        """
+        if hasattr(os, "sched_getaffinity"):
+            cpu: list = sorted(os.sched_getaffinity(0))
+        else:
+            cpu = list(range(os.cpu_count() or 1))
+
+        priority: float = np.nan
+
+        if hasattr(os, "getpriority"):
+            priority = os.getpriority(os.PRIO_PROCESS, 0)
+
+        return [*read_load(), read_frequency(cpu=cpu), len(cpu), priority,
+                read_governor(cpu=cpu)]
+
+    def start(self):
+        """Pin the process, set its priority, then run the first calibration.
+        """
+        if self.__cpu is not None:
+            self.__pin()
+
+        if self.__priority is not None:
+            self.__set_priority()
+
+        self.__environment = self.__read_environment()
+        self.__time = calibrate()
+
+    def stop(self):
+        """Run the second calibration, then give back the CPUs and the
+        priority.
+        """
+        self.__time = np.concatenate((self.__time, calibrate()))
+
+        if self.__previous_cpu is not None:
+            os.sched_setaffinity(0, self.__previous_cpu)
+            self.__previous_cpu = None
+
+        if self.__previous_priority is not None:
+            # Raising it back, after a lower priority, may not be allowed.
+            try:
+                os.setpriority(os.PRIO_PROCESS, 0, self.__previous_priority)
+            except OSError as error:
+                warn(f"[Warn##] Priority \"{self.__previous_priority}\" "
+                     f"cannot be given back ({error}), the process keeps "
+                     f"the priority \"{self.__priority}\".", RuntimeWarning)
+
+            self.__previous_priority = None
+
+    def score(self) -> float:
+        """Get the noise of the last run.
+
+        Returns
+        -------
+        `float`
+            The noise, in %.
+        """
+        return noise_score(time=self.__time)
+
+    def data(self) -> dict:
+        """Get computed data.
+
+        Returns
+        -------
+        `dict`
+            Computed data, with "head", "label" and "data" keys. There is one
+            row, labelled by the CPUs governor. Not readable values are
+            `nan`.
+        """
+        *environment, governor = self.__environment
+
+        return {
+            "head": HEAD,
+            "label": np.array([governor]),
+            "data": np.array([[
+                self.score(),
+                np.min(self.__time),
+                np.median(self.__time),
+                *environment
+            ]], dtype=float)
+        }
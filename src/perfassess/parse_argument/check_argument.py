@@ -9,13 +9,18 @@ __copyright__ = "MIT License"
 # [I]
 from importlib.util import module_from_spec, spec_from_file_location
 # [O]
-from os.path import exists, isdir
+from os.path import dirname, exists, isdir
 # [S]
 from sys import modules
 
 # [Y]
 from yaml import safe_load
 
+# [G]
+from .generate_argument import generate_argument, rebase_argument
+# [I]
+from ..import_profiler import ImportProfiler
+
 
 def check_argument(argument: object) -> object:
     """Check if the different given arguments are good or not.
@@ -32,19 +37,55 @@ def check_argument(argument: object) -> object:
     """
     # Check errors linked to given files.
     __file_errors(argument=argument)
+
     # Check errors linked to module importations.
-    argument = __module_importation_error(argument=argument)
+    if argument.import_profiling:
+        # Measure the importations of the script and its packages.
+        with ImportProfiler() as profiler:
+            argument = __module_importation_error(argument=argument,
+                                                  profiler=profiler)
 
-    # Parse the ".yml" file.
-    if argument.argument is not None:
-        # Parsing user file.
-        with open(argument.argument, "r", encoding="utf-8") as file:
-            argument.argument = safe_load(file)
+        argument.import_profiling = profiler.data()
     else:
-        argument.argument = {}
+        argument.import_profiling = None
+        argument = __module_importation_error(argument=argument)
+
+    # Parse the ".yml" file.
+    argument.argument_file = argument.argument
+    argument.argument = load_argument(path=argument.argument)
 
     return argument
 
+
+def load_argument(path: str = None) -> dict:
+    """Load the arguments of the function to test from a YAML file, building
+    the generated ones.
+
+    Parameters
+    ----------
+    path : `str`, optional
+        The YAML file path. By default None, giving no arguments.
+
+    Returns
+    -------
+    `dict`
+        The arguments of the function to test.
+    """
+    if path is None:
+        return {}
+
+    # Parsing user file.
+    with open(path, "r", encoding="utf-8") as file:
+        argument: dict = safe_load(file)
+
+    # An empty file gives no arguments.
+    if argument is None:
+        return {}
+
+    # Build generated values, before any measure starts, with files relative
+    # to the YAML file.
+    return generate_argument(rebase_argument(argument, root=dirname(path)))
+
 # pylint: disable=too-many-branches
 # We have to check if different parameters are good or not. Implying a lot of
 # branches.
@@ -153,7 +194,10 @@ def __file_errors(argument: object):
 # pylint: enable=too-many-branches
 
 
-def __module_importation_error(argument: object) -> object:
+def __module_importation_error(
+    argument: object,
+    profiler: ImportProfiler = None
+) -> object:
     """Try to import the given file in a module and do some modifications.
 
     Parameters
@@ -161,6 +205,9 @@ def __module_importation_error(argument: object) -> object:
     argument : `ArgumentParser`
         The parsed argument to check.
 
+    profiler : `ImportProfiler`, optional
+        A started profiler measuring the module executions. By default None.
+
     Returns
     -------
     `ArgumentParser`
@@ -173,6 +220,9 @@ def __module_importation_error(argument: object) -> object:
 
     `ValueError`
         The given function name is not found in the given module.
+
+    `ValueError`
+        A function to time line by line is not found in the given module.
     """
     # =============
     #
@@ -190,7 +240,7 @@ def __module_importation_error(argument: object) -> object:
         module = module_from_spec(spec=module_spec)
 
         # "Launch" the module inside the python environment.
-        module_spec.loader.exec_module(module=module)
+        __execute_module(spec=module_spec, module=module, profiler=profiler)
     # =======
     #
     # PACKAGE
@@ -208,7 +258,8 @@ def __module_importation_error(argument: object) -> object:
         modules[package_name] = package
 
         # "Launch" the package.
-        package_spec.loader.exec_module(package)
+        __execute_module(spec=package_spec, module=package,
+                         profiler=profiler)
 
         # Set the module name.
         module_name: list = []
@@ -230,7 +281,7 @@ def __module_importation_error(argument: object) -> object:
         modules[package_name + ".None"] = module
 
         # "Launch" the script.
-        module_spec.loader.exec_module(module)
+        __execute_module(spec=module_spec, module=module, profiler=profiler)
     # ==========
     #
     # SUBPACKAGE
@@ -248,7 +299,8 @@ def __module_importation_error(argument: object) -> object:
         modules[package_name] = package
 
         # "Launch" the package.
-        package_spec.loader.exec_module(package)
+        __execute_module(spec=package_spec, module=package,
+                         profiler=profiler)
 
         # Set the module name.
         module_name: list = []
@@ -281,7 +333,7 @@ def __module_importation_error(argument: object) -> object:
         modules[subpackage_name] = module
 
         # "Launch" the script.
-        module_spec.loader.exec_module(module)
+        __execute_module(spec=module_spec, module=module, profiler=profiler)
     else:
         raise ValueError("[Err##] If --subpackage is specified, --package "
                          "must be specified too.")
@@ -294,4 +346,44 @@ def __module_importation_error(argument: object) -> object:
                          "inside the given script "
                          f"\"{argument.script}\".") from error
 
+    # Get the functions to time line by line, like "function" or
+    # "Class.method".
+    if argument.line is not None:
+        line_function: list = []
+
+        for name in argument.line:
+            function: object = module
+
+            for attribute in name.split("."):
+                if not hasattr(function, attribute):
+                    raise ValueError(f"[Err##] In line, \"{name}\" is not "
+                                     "present inside the given script "
+                                     f"\"{argument.script}\".")
+
+                function = getattr(function, attribute)
+
+            line_function += [function]
+
+        argument.line = line_function
+
     return argument
+
+
+def __execute_module(spec: object, module: object, profiler: ImportProfiler):
+    """Execute a module, measuring it when a profiler is given.
+
+    Parameters
+    ----------
+    spec : `ModuleSpec`
+        The module specification.
+
+    module : `ModuleType`
+        The module to execute.
+
+    profiler : `ImportProfiler`
+        A started profiler measuring the module execution, or `None`.
+    """
+    if profiler is None:
+        spec.loader.exec_module(module)
+    else:
+        profiler.execute_module(spec=spec, module=module)
@@ -7,12 +7,19 @@ __contact__ = ["lucas.rouaud@gmail.com"]
 __copyright__ = "MIT License"
 
 
+# [O]
+import os
+# [S]
+import sys
 # [T]
 from textwrap import dedent
 
 # [A]
 from argparse import ArgumentParser, RawTextHelpFormatter
 
+# [R]
+from ..result_cache import CACHE_DIR
+
 
 def define_argument(version: str = None) -> ArgumentParser:
     """Parse user given arguments.
@@ -221,6 +228,518 @@ def define_argument(version: str = None) -> ArgumentParser:
               "test. By default None.")
     )
 
+    parser.add_argument(
+        "--import_profiling",
+        dest="import_profiling",
+        required=False,
+        action="store_true",
+        help=("    > Assess the time and memory used to import the script,\n"
+              "the package and the subpackage, with every module they\n"
+              "import. By default False.")
+    )
+
+    parser.add_argument(
+        "--gc",
+        dest="gc_mode",
+        required=False,
+        default="enable",
+        choices=["enable", "disable", "freeze"],
+        type=str,
+        metavar="[enable|disable|freeze]",
+        help=("    > The garbage collector state during the measure:\n"
+              "\"enable\" keeps it, \"disable\" switches it off and\n"
+              "\"freeze\" only collects objects created by the tested\n"
+              "function. By default \"enable\".")
+    )
+
+    parser.add_argument(
+        "--gc_trace",
+        dest="gc_trace",
+        required=False,
+        action="store_true",
+        help=("    > Record the garbage collector pauses, by generation\n"
+              "and on a timeline. By default False.")
+    )
+
+    parser.add_argument(
+        "--object",
+        dest="object",
+        required=False,
+        action="store_true",
+        help=("    > Count the live objects by type, before and after\n"
+              "the run, to find object explosions. By default False.")
+    )
+
+    parser.add_argument(
+        "--line",
+        dest="line",
+        required=False,
+        default=None,
+        nargs="+",
+        type=str,
+        metavar="[str]",
+        help=("    > Functions of the script to time line by line, like\n"
+              "\"function\" or \"Class.method\". By default None.")
+    )
+
+    parser.add_argument(
+        "--time_backend",
+        dest="time_backend",
+        required=False,
+        default="cprofile",
+        choices=["cprofile", "monitoring"],
+        type=str,
+        metavar="[cprofile|monitoring]",
+        help=("    > The time profiler. \"monitoring\" has a lower\n"
+              "overhead, but needs python ≥ 3.12, else \"cprofile\" is\n"
+              "used. By default \"cprofile\".")
+    )
+
+    parser.add_argument(
+        "--include",
+        dest="include",
+        required=False,
+        default=None,
+        nargs="+",
+        type=str,
+        metavar="[str]",
+        help=("    > Module names (like \"numpy\") or path globs (like\n"
+              "\"*/src/*\") of the code to keep in the time and memory\n"
+              "evaluations. Removed code is given to its nearest kept\n"
+              "caller. By default None, keeping everything.")
+    )
+
+    parser.add_argument(
+        "--exclude",
+        dest="exclude",
+        required=False,
+        default=None,
+        nargs="+",
+        type=str,
+        metavar="[str]",
+        help=("    > Module names or path globs of the code to remove\n"
+              "from the time and memory evaluations. By default None,\n"
+              "removing nothing.")
+    )
+
+    parser.add_argument(
+        "--sample",
+        dest="sample_interval",
+        required=False,
+        default=None,
+        type=float,
+        metavar="[float]",
+        help=("    > Sample the memory every given seconds in a\nbackground "
+              "thread, to draw it over time. By default\nNone.")
+    )
+
+    parser.add_argument(
+        "--leak",
+        dest="leak",
+        required=False,
+        default=None,
+        type=int,
+        metavar="[int]",
+        help=("    > Call the function the given number of times (at\nleast "
+              "3) to find memory leaks. By default None.")
+    )
+
+    parser.add_argument(
+        "--throughput",
+        dest="throughput",
+        required=False,
+        default=None,
+        nargs="?",
+        const=os.cpu_count() or 1,
+        type=int,
+        metavar="[int]",
+        help=("    > Call the function from 1 to the given number of\n"
+              "concurrent threads, then processes, to measure how its\n"
+              "throughput scales. The number of CPUs when not given.\n"
+              "By default None.")
+    )
+
+    parser.add_argument(
+        "--throughput_duration",
+        dest="throughput_duration",
+        required=False,
+        default=1,
+        type=float,
+        metavar="[float|1]",
+        help=("    > The measured time of each concurrency level, in\n"
+              "seconds. By default 1.")
+    )
+
+    parser.add_argument(
+        "--throughput_worker",
+        dest="throughput_worker",
+        required=False,
+        default=["thread", "process"],
+        nargs="+",
+        choices=["thread", "process"],
+        type=str,
+        metavar="[WORKER]",
+        help=("    > The kinds of workers, \"thread\" and/or\n"
+              "\"process\". By default both.")
+    )
+
+    parser.add_argument(
+        "--noise",
+        dest="noise",
+        required=False,
+        action="store_true",
+        help=("    > Measure the noise of the machine with a short\n"
+              "calibration loop, and report the load, the CPU\n"
+              "frequency and the governor. By default False.")
+    )
+
+    parser.add_argument(
+        "--max_noise",
+        dest="max_noise",
+        required=False,
+        default=None,
+        type=float,
+        metavar="[float]",
+        help=("    > The maximal noise, in %%, implying \"--noise\". A\n"
+              "noisier run is launched again \"--retry\" times, then\n"
+              "a warning is given. By default None.")
+    )
+
+    parser.add_argument(
+        "--retry",
+        dest="retry",
+        required=False,
+        default=0,
+        type=int,
+        metavar="[int|0]",
+        help=("    > The number of new runs when the noise is over\n"
+              "\"--max_noise\". By default 0.")
+    )
+
+    parser.add_argument(
+        "--cpu",
+        dest="cpu",
+        required=False,
+        default=None,
+        nargs="+",
+        type=int,
+        metavar="[CPU]",
+        help=("    > Pin the run to the given CPUs, like \"--cpu 2 3\".\n"
+              "Linux only. By default None.")
+    )
+
+    parser.add_argument(
+        "--priority",
+        dest="priority",
+        required=False,
+        default=None,
+        type=int,
+        metavar="[int]",
+        help=("    > The \"nice\" value of the run, from -20 (the\n"
+              "highest priority, often needing privileges) to 19.\n"
+              "By default None.")
+    )
+
+    parser.add_argument(
+        "--reset_peak",
+        dest="reset_peak",
+        required=False,
+        action="store_true",
+        help=("    > Reset the RSS peak of the process before the run,\n"
+              "Linux only, to only give the peak of the run. This\n"
+              "writes \"/proc/self/clear_refs\". By default False.")
+    )
+
+    parser.add_argument(
+        "--export",
+        dest="export",
+        required=False,
+        action="store_true",
+        help=("    > Also save the computed data to \"result.json\" in\nthe "
+              "output folder, to merge it later with\n\"perfassess merge\". "
+              "By default False.")
+    )
+
+    parser.add_argument(
+        "--cache",
+        dest="cache",
+        required=False,
+        default=None,
+        nargs="?",
+        const=CACHE_DIR,
+        type=str,
+        metavar="[DIRECTORY]",
+        help=("    > Reuse the results of a previous run when the\n"
+              "script, its imported modules, the arguments file, the\n"
+              "python version and the options did not change. The\n"
+              "cache directory is \"~/.cache/perfassess\" when not\n"
+              "given. By default None, not caching.")
+    )
+
+    parser.add_argument(
+        "--cache_size",
+        dest="cache_size",
+        required=False,
+        default=512,
+        type=float,
+        metavar="[float|512]",
+        help=("    > The maximal cache size, in Mib. The least recently\n"
+              "used results are removed first. By default 512.")
+    )
+
+    parser.add_argument(
+        "--force",
+        dest="force",
+        required=False,
+        action="store_true",
+        help=("    > With \"--cache\", run again even if a cached result\n"
+              "exists, then replace it. By default False.")
+    )
+
+    parser.add_argument(
+        "--python",
+        dest="python",
+        required=False,
+        default=None,
+        nargs="+",
+        type=str,
+        metavar="[EXECUTABLE]",
+        help=("    > Profile the function with each given python\n"
+              "interpreter, in subprocesses, then compare them by\n"
+              "function. The first one is the speedups reference. By\n"
+              "default None.")
+    )
+
+    parser.add_argument(
+        "--session",
+        dest="session",
+        required=False,
+        default=None,
+        type=str,
+        metavar="[FILE]",
+        help=("    > The Unix socket of a running \"perfassess-server\".\n"
+              "The function is profiled by this server, which keeps\nthe "
+              "target loaded between runs. By default None.")
+    )
+
     argument: ArgumentParser = parser.parse_args()
 
     return argument
+
+
+def define_suite_argument(version: str = None) -> ArgumentParser:
+    """Parse user given arguments of the "suite" command.
+
+    Parameters
+    ----------
+    version : `str`, optional
+        The script version. By default None.
+
+    Returns
+    -------
+    `ArgumentParser`
+        The object with unchecked parsed arguments.
+    """
+    description: str = """
+    Run every target of a suite file, then write one consolidated report
+    ("suite_evaluation.html") and one result file ("suite_result.json"). To
+    use it, launch:
+
+        $ perfassess suite perfassess.yml -o output_directory/ -w 4
+
+    Without a suite file, "perfassess.yml" then a "pyproject.toml" with a
+    [tool.perfassess] table are searched in the current directory. The exit
+    status is 1 when a target fails or goes over its budget.
+    """
+
+    parser: object = ArgumentParser(
+        prog="perfassess suite",
+        description=dedent(description)[1:-1],
+        formatter_class=RawTextHelpFormatter,
+        add_help=False
+    )
+
+    # == REQUIRED.
+    parser.add_argument(
+        "-o",
+        "--output",
+        dest="output",
+        required=True,
+        type=str,
+        metavar="[DIRECTORY]",
+        help=("\033[7m [[MANDATORY]] \033[0m\n    > A folder where the "
+              "report and the result file\nwill be stored.")
+    )
+
+    # == OPTIONAL.
+    parser.add_argument(
+        "suite",
+        nargs="?",
+        default=None,
+        type=str,
+        metavar="[FILE][\".yml\"|\".toml\"]",
+        help=("    > The suite file. By default, searched in the current\n"
+              "directory.")
+    )
+
+    parser.add_argument(
+        "-h",
+        "--help",
+        action="help",
+        help="    > Display this help message, then exit the program."
+    )
+
+    parser.add_argument(
+        "-v",
+        "--version",
+        action="version",
+        version=f"Program version is {version}",
+        help="    > Display the program's version, then exit the\nprogram."
+    )
+
+    parser.add_argument(
+        "-w",
+        "--worker",
+        dest="worker",
+        required=False,
+        default=None,
+        type=int,
+        metavar="[int|None]",
+        help=("    > The number of worker processes. By default, the\n"
+              "suite file one, or 1.")
+    )
+
+    parser.add_argument(
+        "--cache",
+        dest="cache",
+        required=False,
+        default=None,
+        nargs="?",
+        const=CACHE_DIR,
+        type=str,
+        metavar="[DIRECTORY]",
+        help=("    > Reuse the results of the targets which did not\n"
+              "change. The cache directory is \"~/.cache/perfassess\"\n"
+              "when not given. By default None, not caching.")
+    )
+
+    parser.add_argument(
+        "--cache_size",
+        dest="cache_size",
+        required=False,
+        default=512,
+        type=float,
+        metavar="[float|512]",
+        help=("    > The maximal cache size, in Mib. The least recently\n"
+              "used results are removed first. By default 512.")
+    )
+
+    parser.add_argument(
+        "--force",
+        dest="force",
+        required=False,
+        action="store_true",
+        help=("    > With \"--cache\", run every target again, then\n"
+              "replace their cached results. By default False.")
+    )
+
+    argument: ArgumentParser = parser.parse_args(args=sys.argv[2:])
+
+    return argument
+
+
+def define_merge_argument(version: str = None) -> ArgumentParser:
+    """Parse user given arguments of the "merge" command.
+
+    Parameters
+    ----------
+    version : `str`, optional
+        The script version. By default None.
+
+    Returns
+    -------
+    `ArgumentParser`
+        The object with unchecked parsed arguments.
+    """
+    description: str = """
+    Merge results exported with "--export", from many runs, processes or
+    hosts, then write one report and one result file ("merge_result.json").
+    To use it, launch:
+
+        $ perfassess merge node_*/result.json -o output_directory/
+
+    Functions are aligned by their name, trimmed with "--n_field". Each
+    merged evaluation comes with a "_spread" one, giving the minimum, the
+    maximum and the standard deviation over the sources.
+    """
+
+    parser: object = ArgumentParser(
+        prog="perfassess merge",
+        description=dedent(description)[1:-1],
+        formatter_class=RawTextHelpFormatter,
+        add_help=False
+    )
+
+    # == REQUIRED.
+    parser.add_argument(
+        "-o",
+        "--output",
+        dest="output",
+        required=True,
+        type=str,
+        metavar="[DIRECTORY]",
+        help=("\033[7m [[MANDATORY]] \033[0m\n    > A folder where the "
+              "report and the result file\nwill be stored.")
+    )
+
+    parser.add_argument(
+        "result",
+        nargs="+",
+        type=str,
+        metavar="[FILE][\".json\"]|[DIRECTORY]",
+        help=("\033[7m [[MANDATORY]] \033[0m\n    > The result files, or "
+              "directories containing them.")
+    )
+
+    # == OPTIONAL.
+    parser.add_argument(
+        "-h",
+        "--help",
+        action="help",
+        help="    > Display this help message, then exit the program."
+    )
+
+    parser.add_argument(
+        "-v",
+        "--version",
+        action="version",
+        version=f"Program version is {version}",
+        help="    > Display the program's version, then exit the\nprogram."
+    )
+
+    parser.add_argument(
+        "--n_field",
+        dest="n_field",
+        required=False,
+        default=0,
+        type=int,
+        metavar="[int|0]",
+        help=("    > The number of label fields to keep, to align the\n"
+              "functions of different hosts. By default 0.")
+    )
+
+    parser.add_argument(
+        "--mode",
+        dest="mode",
+        required=False,
+        default="sum",
+        choices=["sum", "mean"],
+        type=str,
+        metavar="[sum|mean]",
+        help=("    > \"sum\" adds the sources values, \"mean\" averages\n"
+              "them. By default \"sum\".")
+    )
+
+    argument: ArgumentParser = parser.parse_args(args=sys.argv[2:])
+
+    return argument
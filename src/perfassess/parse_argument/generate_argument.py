@@ -0,0 +1,319 @@
+r"""Contains a function to build generated arguments.
+
+Any mapping of the YAML argument file with a "$generator" key is replaced by
+the value it describes. Generated values are built when the arguments are
+loaded, so before the memory and time measures start: their construction and
+the memory they hold are not part of the report.
+
+```yml
+# A seeded random NumPy array.
+array: {$generator: random, shape: [1000, 3], dtype: float32, seed: 42}
+# A list, or a NumPy array with "numpy: true".
+index: {$generator: range, start: 0, stop: 1000000, step: 2}
+# A string (or a list, for other values) repeated "count" times.
+text: {$generator: repeat, value: "ab", count: 1000}
+# The value returned by a user function, with its own arguments.
+table: {$generator: factory, script: fixture.py, function: build,
+        argument: {n_row: 1000}}
+# A memory-mapped ".npy" file, or raw binary file with "dtype" and "shape".
+matrix: {$generator: fixture, path: matrix.npy}
+```
+
+Relative files, like "fixture.py" or "matrix.npy", are relative to the file
+declaring the arguments.
+"""
+
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+
+# [I]
+from importlib import import_module
+from importlib.util import module_from_spec, spec_from_file_location
+# [O]
+from os.path import isabs, join
+
+# [N]
+import numpy as np
+
+# [L]
+from .load_fixture import load_fixture
+
+
+# The file parameter of the generators reading one.
+FILE_PARAMETER: dict = {"factory": "script", "fixture": "path"}
+
+
+def rebase_argument(argument: object, root: str) -> object:
+    """Make the relative files of the generators, like a factory "script" or
+    a fixture "path", relative to a directory instead of the current one.
+
+    Parameters
+    ----------
+    argument : `object`
+        The loaded arguments. Lists and dictionaries are searched
+        recursively.
+
+    root : `str`
+        The directory of the file declaring the arguments.
+
+    Returns
+    -------
+    `object`
+        The arguments with rebased files.
+    """
+    if isinstance(argument, list):
+        return [rebase_argument(value, root=root) for value in argument]
+
+    if not isinstance(argument, dict):
+        return argument
+
+    argument = {key: rebase_argument(value, root=root)
+                for key, value in argument.items()}
+    generator: object = argument.get("$generator")
+    key: str = FILE_PARAMETER.get(generator) \
+        if isinstance(generator, str) else None
+
+    if isinstance(argument.get(key), str) and not isabs(argument[key]):
+        argument[key] = join(root, argument[key])
+
+    return argument
+
+
+def generator_file(argument: object) -> list:
+    """Get the files read by the generators, like a factory "script" or a
+    fixture "path", without building anything.
+
+    Parameters
+    ----------
+    argument : `object`
+        The loaded arguments. Lists and dictionaries are searched
+        recursively.
+
+    Returns
+    -------
+    `list`
+        The `(generator, file)` pairs.
+    """
+    if isinstance(argument, list):
+        return [pair for value in argument for pair in generator_file(value)]
+
+    if not isinstance(argument, dict):
+        return []
+
+    pair_list: list = [pair for value in argument.values()
+                       for pair in generator_file(value)]
+    generator: object = argument.get("$generator")
+    key: str = FILE_PARAMETER.get(generator) \
+        if isinstance(generator, str) else None
+
+    if isinstance(argument.get(key), str):
+        pair_list += [(generator, argument[key])]
+
+    return pair_list
+
+
+def generate_argument(argument: object) -> object:
+    """Replace every generator description by the value it describes.
+
+    Parameters
+    ----------
+    argument : `object`
+        The loaded arguments. Lists and dictionaries are searched
+        recursively.
+
+    Returns
+    -------
+    `object`
+        The arguments with generated values.
+    """
+    if isinstance(argument, list):
+        return [generate_argument(value) for value in argument]
+
+    if not isinstance(argument, dict):
+        return argument
+
+    # Generator parameters can also be generated.
+    argument = {key: generate_argument(value)
+                for key, value in argument.items()}
+
+    if "$generator" not in argument:
+        return argument
+
+    parameter: dict = dict(argument)
+    generator: str = parameter.pop("$generator")
+
+    if generator not in GENERATOR:
+        raise ValueError(f"[Err##] Argument generator \"{generator}\" does "
+                         "not exist. Available ones are: "
+                         f"{', '.join(GENERATOR)}.")
+
+    try:
+        return GENERATOR[generator](**parameter)
+    except TypeError as error:
+        raise ValueError(f"[Err##] Wrong parameters for argument generator "
+                         f"\"{generator}\": {error}") from error
+
+
+def __random(
+    shape: list,
+    dtype: str = "float64",
+    seed: int = 0,
+    low: float = 0,
+    high: float = 1
+) -> np.ndarray:
+    """Build a seeded random NumPy array.
+
+    Parameters
+    ----------
+    shape : `list`
+        The array shape.
+
+    dtype : `str`, optional
+        The array type. By default "float64".
+
+    seed : `int`, optional
+        The random seed. By default 0.
+
+    low : `float`, optional
+        The lowest value, included. By default 0.
+
+    high : `float`, optional
+        The highest value, excluded. By default 1.
+
+    Returns
+    -------
+    `np.ndarray`
+        The random array.
+    """
+    generator: np.random.Generator = np.random.default_rng(seed=seed)
+    dtype: np.dtype = np.dtype(dtype)
+
+    if dtype.kind in "iu":
+        return generator.integers(low=low, high=high, size=shape, dtype=dtype)
+
+    if dtype.kind == "b":
+        return generator.random(size=shape) < 0.5
+
+    return generator.uniform(low=low, high=high, size=shape).astype(dtype)
+
+
+def __range(
+    stop: int,
+    start: int = 0,
+    step: int = 1,
+    numpy: bool = False,
+    dtype: str = None
+) -> object:
+    """Build a range of values.
+
+    Parameters
+    ----------
+    stop : `int`
+        The last value, excluded.
+
+    start : `int`, optional
+        The first value. By default 0.
+
+    step : `int`, optional
+        The step between two values. By default 1.
+
+    numpy : `bool`, optional
+        Give a NumPy array instead of a list. By default False.
+
+    dtype : `str`, optional
+        The NumPy array type. By default None, chosen by NumPy.
+
+    Returns
+    -------
+    `list` or `np.ndarray`
+        The range of values.
+    """
+    if numpy:
+        return np.arange(start, stop, step, dtype=dtype)
+
+    return list(range(start, stop, step))
+
+
+def __repeat(value: object, count: int) -> object:
+    """Repeat a value.
+
+    Parameters
+    ----------
+    value : `object`
+        The value to repeat.
+
+    count : `int`
+        The number of repetitions.
+
+    Returns
+    -------
+    `str` or `list`
+        A string if the value is a string, a list else.
+    """
+    if isinstance(value, str):
+        return value * count
+
+    return [value] * count
+
+
+def __factory(
+    function: str,
+    script: str = None,
+    module: str = None,
+    argument: dict = None
+) -> object:
+    """Call a user function building the value.
+
+    Parameters
+    ----------
+    function : `str`
+        The function name.
+
+    script : `str`, optional
+        The ".py" file containing the function. By default None.
+
+    module : `str`, optional
+        The importable module containing the function, used when no script
+        is given. By default None.
+
+    argument : `dict`, optional
+        The function arguments. By default None.
+
+    Returns
+    -------
+    `object`
+        The value given by the function.
+
+    Raises
+    ------
+    `ValueError`
+        If neither a script nor a module is given, or if the function does not
+        exist.
+    """
+    if script is not None:
+        module_spec = spec_from_file_location(name=function, location=script)
+        loaded_module = module_from_spec(spec=module_spec)
+        module_spec.loader.exec_module(module=loaded_module)
+    elif module is not None:
+        loaded_module = import_module(module)
+    else:
+        raise ValueError("[Err##] The \"factory\" generator needs a \"script\" "
+                         "or a \"module\".")
+
+    if not hasattr(loaded_module, function):
+        raise ValueError(f"[Err##] \"{function}\" is not present inside the "
+                         f"factory \"{script or module}\".")
+
+    return getattr(loaded_module, function)(**(argument or {}))
+
+
+GENERATOR: dict = {
+    "random": __random,
+    "range": __range,
+    "repeat": __repeat,
+    "factory": __factory,
+    "fixture": load_fixture
+}
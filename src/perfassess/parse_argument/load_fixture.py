@@ -0,0 +1,118 @@
+r"""Contains a function to open memory-mapped input fixtures.
+
+Fixtures are opened with `np.load(mmap_mode=...)` for ".npy" files, or with
+`np.memmap()` for raw binary files. Nothing is copied: the pages are read from
+the file when the function to test touches them, and are shared through the
+system page cache by every process opening the same file.
+
+Read-only fixtures are cached for the whole process life, so repeated runs
+(like in a suite or a session server) and forked workers reuse the same
+mapping. A fixture is opened again when its file is modified.
+"""
+
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+
+# [O]
+import os
+from os.path import exists, realpath
+
+# [N]
+import numpy as np
+
+
+# Opened fixtures, by file and opening parameters.
+FIXTURE_CACHE: dict = {}
+
+
+# pylint: disable=too-many-arguments
+# A raw binary file needs all of its layout to be described.
+
+def load_fixture(
+    path: str,
+    dtype: str = None,
+    shape: list = None,
+    offset: int = 0,
+    order: str = "C",
+    mode: str = "r"
+) -> np.ndarray:
+    """Open a memory-mapped fixture, without copying it.
+
+    Parameters
+    ----------
+    path : `str`
+        A ".npy" file, or a raw binary file.
+
+    dtype : `str`, optional
+        The type of a raw binary file values. Mandatory for raw binary files,
+        ignored for ".npy" files. By default None.
+
+    shape : `list`, optional
+        The shape of a raw binary file. By default None, giving a flat array.
+
+    offset : `int`, optional
+        The number of bytes to skip at the start of a raw binary file. By
+        default 0.
+
+    order : `str`, optional
+        The memory layout of a raw binary file, "C" or "F". By default "C".
+
+    mode : `str`, optional
+        "r" for a read-only mapping, or "c" for a copy-on-write one, where
+        modifications are kept in memory and never written to the file. By
+        default "r".
+
+    Returns
+    -------
+    `np.ndarray`
+        The memory-mapped array.
+
+    Raises
+    ------
+    `FileNotFoundError`
+        If the fixture file does not exist.
+
+    `ValueError`
+        If the mode is not "r" or "c", if the file is a ".npz" one or if a raw
+        binary file has no type.
+    """
+    if not exists(path):
+        raise FileNotFoundError(f"[Err##] Fixture file \"{path}\" does not "
+                                "exist.")
+
+    if mode not in ("r", "c"):
+        raise ValueError(f"[Err##] Fixture mode \"{mode}\" should be \"r\" or "
+                         "\"c\", fixture files are never written.")
+
+    if path.endswith(".npz"):
+        raise ValueError(f"[Err##] Fixture file \"{path}\" is compressed and "
+                         "cannot be memory-mapped. Use \".npy\" files.")
+
+    status: os.stat_result = os.stat(path)
+    key: tuple = (realpath(path), status.st_mtime_ns, status.st_size, dtype,
+                  None if shape is None else tuple(shape), offset, order,
+                  mode)
+
+    if key in FIXTURE_CACHE:
+        return FIXTURE_CACHE[key]
+
+    if path.endswith(".npy"):
+        fixture: np.ndarray = np.load(path, mmap_mode=mode)
+    elif dtype is None:
+        raise ValueError(f"[Err##] Raw binary fixture file \"{path}\" needs a "
+                         "\"dtype\".")
+    else:
+        fixture = np.memmap(path, dtype=dtype, mode=mode, offset=offset,
+                            shape=None if shape is None else tuple(shape),
+                            order=order)
+
+    # Copy-on-write modifications must not leak from one run to the next.
+    if mode == "r":
+        FIXTURE_CACHE[key] = fixture
+
+    return fixture
+
+# pylint: enable=too-many-arguments
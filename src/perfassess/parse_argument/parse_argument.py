@@ -28,8 +28,9 @@ def parse_argument(version: str = None) -> object:
     """
     # Parse the arguments.
     argument = define_argument(version=version)
-    # Test the arguments.
-    argument = check_argument(argument)
+    # Test the arguments, unless a session server does it.
+    if argument.session is None:
+        argument = check_argument(argument)
 
     return argument
 
@@ -43,3 +44,27 @@ if __name__ == "__main__":
     print(f"{__argument.argument=}")
     print(f"{__argument.package=}")
     print(f"{__argument.subpackage=}")
+    print(f"{__argument.import_profiling=}")
+    print(f"{__argument.gc_mode=}")
+    print(f"{__argument.gc_trace=}")
+    print(f"{__argument.object=}")
+    print(f"{__argument.line=}")
+    print(f"{__argument.time_backend=}")
+    print(f"{__argument.include=}")
+    print(f"{__argument.exclude=}")
+    print(f"{__argument.sample_interval=}")
+    print(f"{__argument.leak=}")
+    print(f"{__argument.throughput=}")
+    print(f"{__argument.throughput_duration=}")
+    print(f"{__argument.throughput_worker=}")
+    print(f"{__argument.noise=}")
+    print(f"{__argument.max_noise=}")
+    print(f"{__argument.retry=}")
+    print(f"{__argument.cpu=}")
+    print(f"{__argument.priority=}")
+    print(f"{__argument.reset_peak=}")
+    print(f"{__argument.export=}")
+    print(f"{__argument.cache=}")
+    print(f"{__argument.cache_size=}")
+    print(f"{__argument.force=}")
+    print(f"{__argument.python=}")
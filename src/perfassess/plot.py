@@ -0,0 +1,769 @@
+r"""Contains functions to draw Plotly plots from computed evaluations.
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [N]
+import numpy as np
+# [P]
+import plotly.graph_objects as go
+
+
+# Above this number of points, a trace is drawn with WebGL and downsampled,
+# and a bar plot only keeps its largest bars. Change it to draw more points.
+MAX_POINT: int = 50_000
+
+# Script added to the pages of downsampled plots, loading the full data from
+# their sidecar file when it can be fetched (on a local server, not from the
+# disk). "{plot_id}" is set by Plotly.
+SIDECAR_SCRIPT: str = """
+fetch("SIDECAR_PATH").then(function (answer) {
+    if (!answer.ok) {
+        throw new Error(answer.statusText);
+    }
+
+    return answer.arrayBuffer();
+}).then(function (buffer) {
+    var plot = document.getElementById("{plot_id}");
+    var value = new Float64Array(buffer);
+    var n_column = N_COLUMN;
+    var update = {x: [], y: []};
+    var index = [];
+
+    plot.data.forEach(function (trace, i) {
+        if (!trace.meta || trace.meta.y === undefined) {
+            return;
+        }
+
+        var x = [];
+        var y = [];
+
+        for (var row = 0; row < value.length; row += n_column) {
+            if (trace.meta.group === null
+                    || value[row + n_column - 1] === trace.meta.group) {
+                x.push(value[row + trace.meta.x]);
+                y.push(value[row + trace.meta.y]);
+            }
+        }
+
+        update.x.push(x);
+        update.y.push(y);
+        index.push(i);
+    });
+
+    if (index.length > 0) {
+        Plotly.restyle(plot, update, index);
+    }
+}).catch(function () {
+    // Opened from the disk: the downsampled data is kept.
+});
+"""
+
+
+def downsample(value: np.array, n_point: int) -> np.array:
+    """Choose the points to draw, keeping the first and the last ones, then
+    the minimum and the maximum of equal buckets in between, so that peaks are
+    never lost.
+
+    Parameters
+    ----------
+    value : `np.array`
+        The values, in drawing order.
+
+    n_point : `int`
+        The maximal number of kept points.
+
+    Returns
+    -------
+    `np.array`
+        The sorted indices of the kept points.
+    """
+    size: int = len(value)
+
+    if size <= n_point:
+        return np.arange(size)
+
+    n_bucket: int = max((n_point - 2) // 2, 1)
+    # Ceiling division, then the buckets really needed.
+    bucket: int = -(-(size - 2) // n_bucket)
+    n_bucket = -(-(size - 2) // bucket)
+
+    inner: np.array = np.full(n_bucket * bucket, np.nan)
+    inner[:size - 2] = np.asarray(value, dtype=float)[1:-1]
+    inner = inner.reshape(n_bucket, bucket)
+
+    offset: np.array = 1 + np.arange(n_bucket) * bucket
+    lowest: np.array = offset + np.argmin(
+        np.where(np.isnan(inner), np.inf, inner), axis=1
+    )
+    highest: np.array = offset + np.argmax(
+        np.where(np.isnan(inner), -np.inf, inner), axis=1
+    )
+
+    return np.unique(np.minimum(
+        np.concatenate(([0, size - 1], lowest, highest)), size - 1
+    ))
+
+
+def scatter_trace(
+    x: np.array,
+    y: np.array,
+    text: np.array = None,
+    max_point: int = None,
+    meta: dict = None,
+    **kwargs
+) -> object:
+    """Set a scatter trace, downsampled and drawn with WebGL when it has more
+    than `max_point` points.
+
+    Parameters
+    ----------
+    x : `np.array`
+        The x values.
+
+    y : `np.array`
+        The y values.
+
+    text : `np.array`, optional
+        The text of each point. By default None.
+
+    max_point : `int`, optional
+        The maximal number of drawn points. By default None, using
+        `MAX_POINT`.
+
+    meta : `dict`, optional
+        The sidecar columns of the trace, kept when downsampled: "x" and "y"
+        data columns, and the "group" of its rows. By default None.
+
+    kwargs
+        Other `go.Scatter` properties.
+
+    Returns
+    -------
+    `go.Scatter` or `go.Scattergl`
+        The trace.
+    """
+    max_point = MAX_POINT if max_point is None else max_point
+
+    if len(x) <= max_point:
+        return go.Scatter(x=x, y=y, text=text, **kwargs)
+
+    index: np.array = downsample(value=y, n_point=max_point)
+
+    return go.Scattergl(
+        x=np.asarray(x)[index],
+        y=np.asarray(y)[index],
+        text=None if text is None else np.asarray(text)[index],
+        meta=meta,
+        **kwargs
+    )
+
+
+def sidecar_data(label: np.array, data: np.array) -> np.array:
+    """Get the full data of a downsampled plot, written in its sidecar file:
+    the data columns, then the group of each row, which is the index of its
+    label in the sorted unique labels.
+
+    Parameters
+    ----------
+    label : `np.array`
+        The data label.
+
+    data : `np.array`
+        The numerical data.
+
+    Returns
+    -------
+    `np.array`
+        The sidecar data, as little endian 64 bits floats.
+    """
+    group: np.array = np.unique(label, return_inverse=True)[1]
+
+    return np.column_stack((data, group.reshape(-1))).astype("<f8")
+
+
+def is_downsampled(plot: go.Figure) -> bool:
+    """Check if a plot has downsampled traces, to complete from a sidecar.
+
+    Parameters
+    ----------
+    plot : `go.Figure`
+        The plot.
+
+    Returns
+    -------
+    `bool`
+        `True` if a trace was downsampled.
+    """
+    return any(trace.meta is not None for trace in plot.data
+               if isinstance(trace, go.Scattergl))
+
+
+# pylint: disable=too-many-arguments
+# Plots need a lot of data to be set up.
+
+def set_plot(
+    head: np.array,
+    label: np.array,
+    data: np.array,
+    foreground: str = "#2E2E3E",
+    background: str = "rgba(0, 0, 0, 0)",
+    max_point: int = None
+) -> go.Figure:
+    """Set a Plotly bar plot based on computed evaluation. Only the
+    `max_point` largest bars are drawn.
+
+    Parameters
+    ----------
+    head : `np.array`
+        The data header (like ncall). Or like one label per column.
+
+    label : `np.array`
+        The data label (like functions names). Or like one label per row.
+
+    data : `np.array`
+        The numerical data.
+
+    foreground : `str`, optional
+        The "foreground" color. By default "#2E2E3E".
+
+    background : `str`, optional
+        The "background" color. By default "rgba(0, 0, 0, 0)".
+
+    max_point : `int`, optional
+        The maximal number of bars. By default None, using `MAX_POINT`.
+
+    Returns
+    -------
+    `go.Figure`
+        The setted Plotly bar plot.
+    """
+    plot: object = go.Figure()
+    max_point = MAX_POINT if max_point is None else max_point
+
+    sort_i: np.array = np.flip(np.argsort(data.T[0]))[:max_point]
+
+    # Trace the barplot
+    plot.add_trace(go.Bar(
+        x=label[sort_i],
+        y=data.T[0][sort_i],
+        marker_line_color=foreground,
+        marker_color=foreground
+    ))
+
+    # Modify general plot properties.
+    set_layout(
+        plot=plot,
+        x_title=f"Tested function ({head[-1]})",
+        y_title=head[0].capitalize(),
+        foreground=foreground,
+        background=background
+    )
+
+    plot.update_traces()
+
+    # Adding the dropdown menu in the case of multiple datas.
+    if data.T.shape[0] != 1:
+        # Add the dropdown to the plot.
+        plot.update_layout(updatemenus=add_dropdown(
+            foreground=foreground,
+            head=head,
+            label=label,
+            data=data,
+            max_point=max_point
+        ))
+
+    return plot
+
+
+def add_dropdown(
+    head: np.array,
+    label: np.array,
+    data: np.array,
+    foreground: str,
+    max_point: int = None
+) -> list:
+    """Add a dropdown to the Plotly plot, in order to select different
+    assessed values.
+
+    Parameters
+    ----------
+    head : `np.array`
+        The data header (like ncall). Or like one label per column.
+
+    label : `np.array`
+        The data label (like functions names). Or like one label per row.
+
+    data : `np.array`
+        The numerical data.
+
+    foreground : `str`
+        The "foreground" color.
+
+    max_point : `int`, optional
+        The maximal number of bars. By default None, using `MAX_POINT`.
+
+    Returns
+    -------
+    `list`
+        The dropdown menu, which is a `update_menu`.
+    """
+    button: list = []
+    max_point = MAX_POINT if max_point is None else max_point
+
+    for i, label_i in enumerate(head[:-1]):
+        sort_i: np.array = np.flip(np.argsort(data.T[i]))[:max_point]
+
+        # Add a element in the dropdown. By selecting it, it will modify
+        # the plot.
+        button += [{
+            "method": "update",
+            "label": label_i,
+            "args": [
+                # Restyling.
+                {"x": [label[sort_i]], "y": [data.T[i][sort_i]]},
+                # Updating.
+                {"yaxis": {
+                    "showline": True,
+                    "linewidth": 1,
+                    "showgrid": False,
+                    "title": {
+                        "text": f"<b>{label_i.capitalize()}</b>",
+                        "font": {"family": "Roboto Black"}
+                    },
+                    "tickfont": {"size": 12}
+                }}
+            ],
+        }]
+
+    # Create the dropdown menu.
+    update_menu: list = [{
+        "buttons": button,
+        "type": "dropdown",
+        "direction": "down",
+        "showactive": True,
+        "x": 1,
+        "xanchor": "right",
+        "y": 1.01,
+        "yanchor": "bottom",
+        "bgcolor": "#FFF",
+        "bordercolor": foreground,
+        "borderwidth": 2,
+        "font_color": foreground
+    }]
+
+    return update_menu
+
+
+def set_timeline(
+    head: np.array,
+    label: np.array,
+    data: np.array,
+    mode: str = "markers",
+    foreground: str = "#2E2E3E",
+    background: str = "rgba(0, 0, 0, 0)",
+    max_point: int = None
+) -> go.Figure:
+    """Set a Plotly timeline plot based on computed evaluation. The first data
+    column is the time, the second one the plotted value. One trace is drawn
+    for each different label, downsampled above `max_point` points.
+
+    Parameters
+    ----------
+    head : `np.array`
+        The data header (like time). Or like one label per column.
+
+    label : `np.array`
+        The data label (like a generation). Or like one label per row.
+
+    data : `np.array`
+        The numerical data.
+
+    mode : `str`, optional
+        The Plotly scatter mode, like "markers" or "lines". By default
+        "markers".
+
+    foreground : `str`, optional
+        The "foreground" color. By default "#2E2E3E".
+
+    background : `str`, optional
+        The "background" color. By default "rgba(0, 0, 0, 0)".
+
+    max_point : `int`, optional
+        The maximal number of drawn points by trace. By default None, using
+        `MAX_POINT`.
+
+    Returns
+    -------
+    `go.Figure`
+        The setted Plotly timeline plot.
+    """
+    plot: object = go.Figure()
+
+    # Trace one scatter by label.
+    for i, label_i in enumerate(np.unique(label)):
+        mask: np.array = label == label_i
+
+        plot.add_trace(scatter_trace(
+            x=data.T[0][mask],
+            y=data.T[1][mask],
+            max_point=max_point,
+            meta={"x": 0, "y": 1, "group": i},
+            mode=mode,
+            name=str(label_i)
+        ))
+
+    # Modify general plot properties.
+    set_layout(
+        plot=plot,
+        x_title=head[0].capitalize(),
+        y_title=head[1].capitalize(),
+        foreground=foreground,
+        background=background
+    )
+
+    return plot
+
+
+def set_table(
+    head: np.array,
+    label: np.array,
+    data: np.array,
+    foreground: str = "#2E2E3E",
+    background: str = "rgba(0, 0, 0, 0)"
+) -> go.Figure:
+    """Set a Plotly table based on computed evaluation, keeping the row order.
+    The label column is the last one.
+
+    Parameters
+    ----------
+    head : `np.array`
+        The data header (like hits). Or like one label per column.
+
+    label : `np.array`
+        The data label (like source lines). Or like one label per row.
+
+    data : `np.array`
+        The numerical data.
+
+    foreground : `str`, optional
+        The "foreground" color. By default "#2E2E3E".
+
+    background : `str`, optional
+        The "background" color. By default "rgba(0, 0, 0, 0)".
+
+    Returns
+    -------
+    `go.Figure`
+        The setted Plotly table.
+    """
+    plot: object = go.Figure()
+
+    plot.add_trace(go.Table(
+        columnwidth=[1] * (len(head) - 1) + [6],
+        header={
+            "values": [f"<b>{head_i.capitalize()}</b>" for head_i in head],
+            "line_color": foreground,
+            "fill_color": foreground,
+            "font": {"color": "#FFF", "family": "Roboto Black"},
+            "align": "left"
+        },
+        cells={
+            "values": [*[np.round(column, 6) for column in data.T], label],
+            "line_color": foreground,
+            "fill_color": background,
+            "font": {"family": "Roboto Mono, monospace"},
+            "align": ["right"] * (len(head) - 1) + ["left"]
+        }
+    ))
+
+    plot.update_layout(
+        template="plotly_white",
+        margin={"r": 5},
+        font={"size": 12, "family": "Roboto Light"},
+        plot_bgcolor=background,
+        paper_bgcolor=background
+    )
+
+    return plot
+
+
+def set_phase_timeline(
+    head: np.array,
+    label: np.array,
+    data: np.array,
+    y_title: str = "Value",
+    foreground: str = "#2E2E3E",
+    background: str = "rgba(0, 0, 0, 0)",
+    max_point: int = None
+) -> go.Figure:
+    """Set a Plotly timeline plot with annotated phases. The first data column
+    is the time, each other one is drawn as a line. Each run of consecutive
+    rows with the same label is a phase, shown as a shaded area. Lines are
+    downsampled above `max_point` points, and neighbouring phases merged
+    above `max_point` phases.
+
+    Parameters
+    ----------
+    head : `np.array`
+        The data header (like time). Or like one label per column.
+
+    label : `np.array`
+        The data label (like a phase). Or like one label per row.
+
+    data : `np.array`
+        The numerical data.
+
+    y_title : `str`, optional
+        The y axis title, shared by every line. By default "Value".
+
+    foreground : `str`, optional
+        The "foreground" color. By default "#2E2E3E".
+
+    background : `str`, optional
+        The "background" color. By default "rgba(0, 0, 0, 0)".
+
+    max_point : `int`, optional
+        The maximal number of drawn points by line, and of drawn phases. By
+        default None, using `MAX_POINT`.
+
+    Returns
+    -------
+    `go.Figure`
+        The setted Plotly timeline plot.
+    """
+    plot: object = go.Figure()
+    time: np.array = data.T[0]
+
+    # Trace one line by column.
+    for i, (head_i, column) in enumerate(zip(head[1:-1], data.T[1:])):
+        plot.add_trace(scatter_trace(
+            x=time,
+            y=column,
+            max_point=max_point,
+            meta={"x": 0, "y": i + 1, "group": None},
+            mode="lines",
+            name=str(head_i),
+            text=label,
+            hovertemplate="%{y}<br>%{text}"
+        ))
+
+    # Where a phase starts, and where it stops.
+    start: np.array = np.flatnonzero(np.append(True, label[1:] != label[:-1]))
+    start = start[start < len(label)]
+    max_point = MAX_POINT if max_point is None else max_point
+
+    # Above `max_point` phases, neighbouring ones are merged in one area.
+    first: np.array = np.arange(0, len(start), max(
+        -(-len(start) // max_point), 1
+    ))
+    n_merged: np.array = np.diff(np.append(first, len(start)))
+    start = start[first]
+    stop: np.array = np.append(start[1:], len(label)) - 1
+
+    shape: list = []
+    annotation: list = []
+
+    # Set all at once: each `add_vrect()` copies the whole layout, so that
+    # the plot would take minutes to build with hundreds of phases.
+    for i, (start_i, stop_i, n_merged_i) in enumerate(zip(start, stop,
+                                                          n_merged)):
+        x_start: float = time[start_i]
+        text: str = str(label[start_i])
+
+        if n_merged_i > 1:
+            text += f" (+{n_merged_i - 1} phases)"
+
+        shape += [{
+            "type": "rect",
+            "xref": "x",
+            "yref": "paper",
+            "x0": x_start,
+            "x1": time[min(stop_i + 1, len(time) - 1)],
+            "y0": 0,
+            "y1": 1,
+            "fillcolor": foreground,
+            "opacity": 0.05 + 0.05 * (i % 2),
+            "line": {"width": 0}
+        }]
+        annotation += [{
+            "xref": "x",
+            "yref": "paper",
+            "x": x_start,
+            "y": 1,
+            "xanchor": "left",
+            "yanchor": "top",
+            "text": text,
+            "showarrow": False
+        }]
+
+    # Modify general plot properties.
+    set_layout(
+        plot=plot,
+        x_title=head[0].capitalize(),
+        y_title=y_title,
+        foreground=foreground,
+        background=background
+    )
+
+    # After the border, so that the phases are not copied again.
+    plot.update_layout(shapes=[*plot.layout.shapes, *shape],
+                       annotations=annotation)
+
+    return plot
+
+
+def set_quadrant(
+    head: np.array,
+    label: np.array,
+    data: np.array,
+    x_column: int = 0,
+    y_column: int = 1,
+    foreground: str = "#2E2E3E",
+    highlight: str = "#D1495B",
+    background: str = "rgba(0, 0, 0, 0)"
+) -> go.Figure:
+    """Set a Plotly scatter plot of two data columns, split in quadrants by
+    their medians. Rows above both medians, expensive on both axes, are
+    highlighted and named.
+
+    Parameters
+    ----------
+    head : `np.array`
+        The data header (like tottime). Or like one label per column.
+
+    label : `np.array`
+        The data label (like functions names). Or like one label per row.
+
+    data : `np.array`
+        The numerical data.
+
+    x_column : `int`, optional
+        The data column on the x axis. By default 0.
+
+    y_column : `int`, optional
+        The data column on the y axis. By default 1.
+
+    foreground : `str`, optional
+        The "foreground" color. By default "#2E2E3E".
+
+    highlight : `str`, optional
+        The color of rows above both medians. By default "#D1495B".
+
+    background : `str`, optional
+        The "background" color. By default "rgba(0, 0, 0, 0)".
+
+    Returns
+    -------
+    `go.Figure`
+        The setted Plotly quadrant plot.
+    """
+    plot: object = go.Figure()
+    x_data: np.array = data.T[x_column]
+    y_data: np.array = data.T[y_column]
+
+    x_median: float = float(np.median(x_data)) if len(x_data) else 0
+    y_median: float = float(np.median(y_data)) if len(y_data) else 0
+    # Null values are never expensive, even with a null median.
+    hot: np.array = (x_data >= x_median) & (y_data >= y_median) & \
+        (x_data > 0) & (y_data > 0)
+
+    # Points are not ordered, so many points are only drawn with WebGL.
+    trace: object = go.Scattergl if len(x_data) > MAX_POINT else go.Scatter
+
+    for mask, color, name, mode in ((~hot, foreground, "other", "markers"),
+                                    (hot, highlight, "time and memory",
+                                     "markers+text")):
+        plot.add_trace(trace(
+            x=x_data[mask],
+            y=y_data[mask],
+            text=label[mask],
+            mode=mode,
+            textposition="top center",
+            marker_color=color,
+            name=name,
+            hovertemplate="%{text}<br>%{x}, %{y}<extra></extra>"
+        ))
+
+    # Draw the quadrants.
+    plot.add_vline(x=x_median, line_dash="dash", line_color=foreground)
+    plot.add_hline(y=y_median, line_dash="dash", line_color=foreground)
+
+    # Modify general plot properties.
+    set_layout(
+        plot=plot,
+        x_title=head[x_column].capitalize(),
+        y_title=head[y_column].capitalize(),
+        foreground=foreground,
+        background=background
+    )
+
+    return plot
+
+# pylint: enable=too-many-arguments
+
+
+def set_layout(
+    plot: go.Figure,
+    x_title: str,
+    y_title: str,
+    foreground: str,
+    background: str
+):
+    """Set the general properties of a Plotly plot.
+
+    Parameters
+    ----------
+    plot : `go.Figure`
+        The plot to modify.
+
+    x_title : `str`
+        The x axis title.
+
+    y_title : `str`
+        The y axis title.
+
+    foreground : `str`
+        The "foreground" color.
+
+    background : `str`
+        The "background" color.
+    """
+    plot.update_layout(
+        template="plotly_white",
+        margin={"r": 5},
+        font={"size": 12, "family": "Roboto Light"},
+        xaxis={
+            "title": f"<b>{x_title}</b>",
+            "showline": True,
+            "linewidth": 1,
+            "showgrid": False,
+            "title_font": {"family": "Roboto Black"},
+            "tickfont": {"size": 12}
+        },
+        yaxis={
+            "title": f"<b>{y_title}</b>",
+            "showline": True,
+            "linewidth": 1,
+            "showgrid": False,
+            "title_font": {"family": "Roboto Black"},
+            "tickfont": {"size": 12}
+        },
+        title_font={"family": "Roboto Black"},
+        plot_bgcolor=background,
+        paper_bgcolor=background,
+    )
+
+    # Add the rectangle border.
+    plot.add_shape(
+        type="rect",
+        xref="paper",
+        yref="paper",
+        x0=0,
+        y0=0,
+        x1=1,
+        y1=1,
+        line={"width": 2, "color": foreground}
+    )
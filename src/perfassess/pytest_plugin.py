@@ -0,0 +1,378 @@
+r"""A pytest plugin to fail tests going over a time or a memory budget.
+
+Usage
+-----
+The plugin is loaded by pytest once perfassess is installed. Mark a test
+with a budget:
+
+```py
+import pytest
+
+
+@pytest.mark.perf_budget(time=0.5, peak_memory=10_000, repeat=3)
+def test_function():
+    function_to_test()
+```
+
+"time" is the total profiled time, in seconds, "memory" the retained
+memory and "peak_memory" the traced memory peak, both in Kib. The test body
+is run `repeat` times and the fastest run is kept. To collect every result in
+one report file, launch:
+
+```sh
+$ pytest --perfassess-report perfassess_report.json
+```
+
+When the report file already exists, failing tests show the difference of
+each function with it.
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [F]
+from functools import wraps
+# [O]
+from os.path import exists
+# [T]
+from typing import Callable
+
+# [N]
+import numpy as np
+# [P]
+import pytest
+
+# [R]
+from .result_io import load_result, save_result
+
+
+# Results of the session, by test identifier.
+RESULT_KEY: pytest.StashKey = pytest.StashKey()
+# Results of a previous session, to compare with.
+BASELINE_KEY: pytest.StashKey = pytest.StashKey()
+
+
+def pytest_addoption(parser: pytest.Parser):
+    """Add the plugin options.
+
+    Parameters
+    ----------
+    parser : `pytest.Parser`
+        The pytest options parser.
+    """
+    group: object = parser.getgroup("perfassess")
+
+    group.addoption(
+        "--perfassess-report",
+        dest="perfassess_report",
+        default=None,
+        metavar="[FILE][\".json\"]",
+        help=("Write the results of the tests marked with \"perf_budget\" to "
+              "this file. An existing file is used to show differences.")
+    )
+
+
+def pytest_configure(config: pytest.Config):
+    """Declare the marker, and load the previous report.
+
+    Parameters
+    ----------
+    config : `pytest.Config`
+        The pytest configuration.
+    """
+    config.addinivalue_line(
+        "markers",
+        "perf_budget(time=None, memory=None, peak_memory=None, repeat=1): "
+        "fail the test when it goes over a time (s) or a memory (Kib) budget."
+    )
+
+    path: str = config.getoption("perfassess_report", default=None)
+
+    config.stash[RESULT_KEY] = {}
+    config.stash[BASELINE_KEY] = load_result(path=path) \
+        if path is not None and exists(path) else {}
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_pyfunc_call(pyfuncitem: pytest.Function) -> object:
+    """Run a test marked with "perf_budget" under the profilers. The test
+    function is wrapped, then called by pytest or by the other plugins as
+    usual.
+
+    Parameters
+    ----------
+    pyfuncitem : `pytest.Function`
+        The test to run.
+
+    Returns
+    -------
+    `object`
+        The result of the other implementations.
+    """
+    marker: pytest.Mark = pyfuncitem.get_closest_marker("perf_budget")
+
+    if marker is None:
+        return (yield)
+
+    # Only imported by profiled tests, to keep pytest start up fast.
+    # pylint: disable=import-outside-toplevel
+    from .class_performance_assessor import PerformanceAssessor
+    # pylint: enable=import-outside-toplevel
+
+    budget: dict = dict(marker.kwargs)
+    repeat: int = budget.pop("repeat", 1)
+    function: Callable = pyfuncitem.obj
+    run_list: list = []
+
+    @wraps(function)
+    def profiled(*args, **kwargs) -> object:
+        for _ in range(repeat):
+            assessor: PerformanceAssessor = PerformanceAssessor(main=None)
+
+            with assessor.profiling():
+                result: object = function(*args, **kwargs)
+
+            run_list.append(assessor.data())
+
+        return result
+
+    pyfuncitem.obj = profiled
+
+    try:
+        result: object = yield
+    finally:
+        pyfuncitem.obj = function
+
+    # The test function was not called, like when skipped by another plugin.
+    if not run_list:
+        return result
+
+    # Keep the fastest run, the least disturbed one.
+    best: dict = min(run_list, key=lambda data: measure(data=data)["time"])
+
+    config: pytest.Config = pyfuncitem.config
+    config.stash[RESULT_KEY][pyfuncitem.nodeid] = (best, budget)
+
+    message: str = check_budget(
+        data=best,
+        budget=budget,
+        baseline=baseline_of(config=config, nodeid=pyfuncitem.nodeid)
+    )
+
+    if message:
+        pytest.fail(message, pytrace=False)
+
+    return result
+
+
+def measure(data: dict) -> dict:
+    """Compute the budgeted values of a run.
+
+    Parameters
+    ----------
+    data : `dict`
+        Computed data, like given by `PerformanceAssessor.data()`.
+
+    Returns
+    -------
+    `dict`
+        The total profiled "time" (s), the retained "memory" (Kib) and the
+        traced "peak_memory" (Kib).
+    """
+    resource: dict = data.get("resource_evaluation", {})
+    peak: float = np.nan
+
+    if resource:
+        peak = float(resource["data"][0][
+            list(resource["head"]).index("traced peak (Kib)")
+        ])
+
+    return {
+        "time": float(np.sum(data["time_evaluation"]["data"].T[1])),
+        "memory": float(np.sum(data["memory_evaluation"]["data"].T[0])),
+        "peak_memory": peak
+    }
+
+
+def baseline_of(config: pytest.Config, nodeid: str) -> dict:
+    """Get the data of a test in the previous report.
+
+    Parameters
+    ----------
+    config : `pytest.Config`
+        The pytest configuration.
+
+    nodeid : `str`
+        The test identifier.
+
+    Returns
+    -------
+    `dict`
+        The previous data of the test, empty without previous report.
+    """
+    prefix: str = f"{nodeid}."
+
+    return {
+        key[len(prefix):]: evaluation
+        for key, evaluation in config.stash[BASELINE_KEY].items()
+        if key.startswith(prefix)
+    }
+
+
+def check_budget(data: dict, budget: dict, baseline: dict = None) -> str:
+    """Check a run against its budget.
+
+    Parameters
+    ----------
+    data : `dict`
+        Computed data, like given by `PerformanceAssessor.data()`.
+
+    budget : `dict`
+        The budget, with optional "time", "memory" and "peak_memory" keys.
+
+    baseline : `dict`, optional
+        The data of a previous run, to show differences. By default None.
+
+    Returns
+    -------
+    `str`
+        A readable message about every exceeded budget, empty when the run is
+        in its budget.
+
+    Raises
+    ------
+    `ValueError`
+        If the budget has an unknown key.
+    """
+    value: dict = measure(data=data)
+    unknown: set = set(budget) - set(value)
+
+    if unknown:
+        raise ValueError(f"[Err##] Unknown perf_budget keys {sorted(unknown)}"
+                         ", use \"time\", \"memory\" or \"peak_memory\".")
+
+    message: list = [
+        f"perf_budget: {key} = {value[key]:.6g} > {limit:.6g}"
+        for key, limit in budget.items()
+        if limit is not None and value[key] > limit
+    ]
+
+    if not message:
+        return ""
+
+    for key, column, unit in (("time_evaluation", 1, "s"),
+                              ("memory_evaluation", 0, "Kib")):
+        if key in data:
+            message += [f"  {key}:"] + diff_table(
+                evaluation=data[key],
+                baseline=(baseline or {}).get(key),
+                column=column,
+                unit=unit
+            )
+
+    return "\n".join(message)
+
+
+def diff_table(
+    evaluation: dict,
+    column: int,
+    unit: str,
+    baseline: dict = None,
+    n_row: int = 10
+) -> list:
+    """Write the biggest functions of an evaluation, with their difference to
+    a previous run.
+
+    Parameters
+    ----------
+    evaluation : `dict`
+        The evaluation.
+
+    column : `int`
+        The compared data column.
+
+    unit : `str`
+        The column unit.
+
+    baseline : `dict`, optional
+        The previous evaluation. By default None.
+
+    n_row : `int`, optional
+        The number of written functions. By default 10.
+
+    Returns
+    -------
+    `list`
+        The table lines.
+    """
+    now: dict = {}
+
+    for label, row in zip(evaluation["label"], evaluation["data"]):
+        now[str(label)] = now.get(str(label), 0) + float(row[column])
+
+    before: dict = {}
+
+    if baseline is not None:
+        for label, row in zip(baseline["label"], baseline["data"]):
+            before[str(label)] = before.get(str(label), 0) + float(row[column])
+
+    # Biggest changes first with a baseline, else biggest values.
+    label_list: list = sorted(
+        set(now) | set(before),
+        key=lambda label: -abs(now.get(label, 0) - before.get(label, 0))
+    )[:n_row]
+
+    table: list = []
+
+    for label in label_list:
+        line: str = f"    {now.get(label, 0):>12.6g} {unit:<3}"
+
+        if baseline is not None:
+            line += f" ({now.get(label, 0) - before.get(label, 0):+.6g})"
+
+        table += [f"{line}  {label}"]
+
+    return table
+
+
+def pytest_sessionfinish(session: pytest.Session):
+    """Write every result of the session into the report file.
+
+    Parameters
+    ----------
+    session : `pytest.Session`
+        The pytest session.
+    """
+    config: pytest.Config = session.config
+    path: str = config.getoption("perfassess_report", default=None)
+    result: dict = config.stash.get(RESULT_KEY, {})
+
+    if path is None or not result:
+        return
+
+    summary: list = []
+    data: dict = {}
+
+    for nodeid, (test_data, budget) in result.items():
+        value: dict = measure(data=test_data)
+        summary += [[
+            value["time"],
+            value["memory"],
+            value["peak_memory"],
+            *[np.nan if budget.get(key) is None else budget[key]
+              for key in ("time", "memory", "peak_memory")]
+        ]]
+
+        for key, evaluation in test_data.items():
+            data[f"{nodeid}.{key}"] = evaluation
+
+    data["budget_evaluation"] = {
+        "head": np.array(["time (s)", "memory (Kib)", "peak memory (Kib)",
+                          "time budget (s)", "memory budget (Kib)",
+                          "peak memory budget (Kib)", "test"]),
+        "label": np.array(list(result), dtype=str),
+        "data": np.array(summary, dtype=float)
+    }
+
+    save_result(data=data, path=path)
@@ -0,0 +1,175 @@
+r"""An object to compute the operating system resources used by a run.
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [R]
+try:
+    import resource
+except ModuleNotFoundError:
+    # Not an Unix system: only the times and the traced memory are given.
+    resource = None
+# [T]
+from time import perf_counter, process_time
+import tracemalloc
+
+# [N]
+import numpy as np
+
+
+# Header of the resource evaluation, the last one being the label column.
+HEAD: np.array = np.array([
+    "wall time (s)", "cpu time (s)", "user time (s)", "system time (s)",
+    "cpu / wall", "rss start (Kib)", "rss end (Kib)", "rss peak (Kib)",
+    "traced peak (Kib)", "minor page faults", "major page faults",
+    "voluntary context switches", "involuntary context switches", "run"
+])
+
+
+def read_status() -> dict:
+    """Read the memory sizes of `/proc/self/status`.
+
+    Returns
+    -------
+    `dict`
+        The sizes in Kib, like "VmRSS" or "VmHWM". Empty when `/proc` does not
+        exist.
+    """
+    status: dict = {}
+
+    try:
+        with open("/proc/self/status", "r", encoding="utf-8") as file:
+            for line in file:
+                key, _, value = line.partition(":")
+                value = value.split()
+
+                if len(value) == 2 and value[1] == "kB":
+                    status[key] = float(value[0])
+    except OSError:
+        pass
+
+    return status
+
+
+class ResourceUsage:
+    """A class to compute the resources used by a run, with
+    `resource.getrusage()` and `/proc/self` before and after it: wall time
+    against CPU time, resident memory (RSS), page faults and context
+    switches.
+
+    The RSS includes the memory of C extensions and of the python allocator
+    arenas, missed by `tracemalloc`. The RSS peak is the one of the whole
+    process, unless it is reset before the run, on Linux only.
+    """
+
+    def __init__(self, reset_peak: bool = False):
+        """Initialize a ResourceUsage object.
+
+        Parameters
+        ----------
+        reset_peak : `bool`, optional
+            Reset the RSS peak ("VmHWM") at the start, by writing
+            `/proc/self/clear_refs`. This also clears the page referenced
+            bits of the whole process. By default False.
+        """
+        self.__reset_peak: bool = reset_peak
+        self.__start: dict = {}
+        self.__stop: dict = {}
+        self.__traced_peak: float = np.nan
+
+    @staticmethod
+    def __measure() -> dict:
+        """Measure the current resource usage.
+
+        Returns
+        -------
+        `dict`
+            The current usage.
+        """
+        measure: dict = {"wall": perf_counter(), "cpu": process_time()}
+        status: dict = read_status()
+
+        measure["rss"] = status.get("VmRSS", np.nan)
+        measure["rss_peak"] = status.get("VmHWM", np.nan)
+
+        if resource is not None:
+            usage: object = resource.getrusage(resource.RUSAGE_SELF)
+
+            measure.update({
+                "user": usage.ru_utime,
+                "system": usage.ru_stime,
+                "minor": usage.ru_minflt,
+                "major": usage.ru_majflt,
+                "voluntary": usage.ru_nvcsw,
+                "involuntary": usage.ru_nivcsw
+            })
+
+            # Without "/proc", the whole process peak, in Kib on Linux.
+            if np.isnan(measure["rss_peak"]):
+                measure["rss_peak"] = float(usage.ru_maxrss)
+
+        return measure
+
+    def start(self):
+        """Start to compute the resource usage."""
+        # Reset the RSS peak ("VmHWM"), Linux only.
+        if self.__reset_peak:
+            try:
+                with open("/proc/self/clear_refs", "w",
+                          encoding="utf-8") as file:
+                    file.write("5")
+            except OSError:
+                pass
+
+        self.__traced_peak = np.nan
+        self.__start = self.__measure()
+
+    def stop(self):
+        """Stop to compute the resource usage. To get the traced memory peak,
+        call it before stopping `tracemalloc`.
+        """
+        self.__stop = self.__measure()
+
+        if tracemalloc.is_tracing():
+            self.__traced_peak = tracemalloc.get_traced_memory()[1] / 1024
+
+    def data(self) -> dict:
+        """Get computed data.
+
+        Returns
+        -------
+        `dict`
+            Computed data, with "head", "label" and "data" keys. There is one
+            row, "run", with one column per resource. Not available resources
+            are `nan`.
+        """
+        delta: dict = {
+            key: self.__stop[key] - self.__start[key]
+            for key in ("wall", "cpu", "user", "system", "minor", "major",
+                        "voluntary", "involuntary")
+            if key in self.__start
+        }
+
+        wall: float = delta["wall"]
+
+        return {
+            "head": HEAD,
+            "label": np.array(["run"]),
+            "data": np.array([[
+                wall,
+                delta["cpu"],
+                delta.get("user", np.nan),
+                delta.get("system", np.nan),
+                delta["cpu"] / wall if wall > 0 else np.nan,
+                self.__start["rss"],
+                self.__stop["rss"],
+                self.__stop["rss_peak"],
+                self.__traced_peak,
+                delta.get("minor", np.nan),
+                delta.get("major", np.nan),
+                delta.get("voluntary", np.nan),
+                delta.get("involuntary", np.nan)
+            ]], dtype=float)
+        }
@@ -0,0 +1,522 @@
+r"""A local cache of results, to skip the targets which did not change.
+
+A result is found again by a hash of everything changing it: the source of
+the target and of the modules it imports, the arguments file and the files
+of its generators, the python interpreter and the perfassess options.
+Entries are removed from the least recently used one when the cache goes over
+its size.
+
+Usage
+-----
+```sh
+$ perfassess -s script.py -f function -o output_directory/ --cache
+```
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [A]
+import ast
+# [H]
+import hashlib
+# [I]
+from importlib.util import resolve_name
+# [J]
+import json
+# [O]
+import os
+from os.path import (abspath, dirname, expanduser, getmtime, isdir, isfile,
+                     join)
+# [P]
+import platform
+# [S]
+import shutil
+import sys
+import sysconfig
+from types import ModuleType
+
+
+# Default cache directory.
+CACHE_DIR: str = join(
+    os.environ.get("XDG_CACHE_HOME") or join(expanduser("~"), ".cache"),
+    "perfassess"
+)
+
+# Installed code, only changed by installations: hashed by size and time.
+INSTALLED_DIR: tuple = tuple({
+    sysconfig.get_path(name) for name in ("stdlib", "platstdlib", "purelib",
+                                          "platlib")
+    if sysconfig.get_path(name)
+})
+
+
+def imported_module(namespace: dict, path: str) -> list:
+    """Get the modules a module depends on: the ones of the objects of its
+    namespace, and the ones named by the import statements of its source,
+    anywhere in it.
+
+    Parameters
+    ----------
+    namespace : `dict`
+        The module namespace.
+
+    path : `str`
+        The module source file.
+
+    Returns
+    -------
+    `list`
+        The imported modules, found in `sys.modules`.
+    """
+    module_list: list = []
+
+    for name, value in list(namespace.items()):
+        # Like "__loader__" or "__spec__", set by the import system.
+        if name.startswith("__"):
+            continue
+
+        if not isinstance(value, ModuleType):
+            value = sys.modules.get(getattr(value, "__module__", None) or "")
+
+        if value is not None:
+            module_list += [value]
+
+    # Values like numbers do not give their module.
+    try:
+        with open(path, "rb") as file:
+            tree: ast.Module = ast.parse(file.read())
+    except (OSError, SyntaxError, ValueError):
+        return module_list
+
+    name_list: list = []
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                part: list = alias.name.split(".")
+                name_list += [".".join(part[:i + 1])
+                              for i in range(len(part))]
+        elif isinstance(node, ast.ImportFrom):
+            try:
+                base: str = resolve_name(
+                    "." * node.level + (node.module or ""),
+                    namespace.get("__package__") or ""
+                )
+            except (ImportError, ValueError):
+                continue
+
+            # Imported names may be submodules.
+            name_list += [base] + [f"{base}.{alias.name}"
+                                   for alias in node.names]
+
+    return module_list + [sys.modules[name] for name in name_list
+                          if name in sys.modules]
+
+
+def module_file(function: object) -> list:
+    """Get the source files a function depends on: its module, plus every
+    module it imports, directly or through the modules it imports. The
+    result does not depend on what was imported before. Installed modules
+    are kept, but not walked through.
+
+    Parameters
+    ----------
+    function : `Callable`
+        The profiled function.
+
+    Returns
+    -------
+    `list`
+        The sorted source files.
+    """
+    code: object = getattr(function, "__code__", None)
+
+    if code is None:
+        return []
+
+    # The module of a script is not always in "sys.modules".
+    return source_file(namespace=getattr(function, "__globals__", {}),
+                       path=code.co_filename)
+
+
+def source_file(namespace: dict, path: str) -> list:
+    """Get the source files a module depends on, like `module_file()`, from
+    its namespace and its source file.
+
+    Parameters
+    ----------
+    namespace : `dict`
+        The module namespace, empty for a source file which is not run.
+
+    path : `str`
+        The module source file.
+
+    Returns
+    -------
+    `list`
+        The sorted source files.
+    """
+    file_set: set = {abspath(path)}
+    todo: list = [(namespace, path)]
+    seen: set = set()
+
+    while todo:
+        namespace, path = todo.pop()
+
+        for module in imported_module(namespace=namespace, path=path):
+            if id(module) in seen:
+                continue
+
+            seen.add(id(module))
+            module_path: str = getattr(module, "__file__", None)
+
+            if not module_path:
+                continue
+
+            module_path = abspath(module_path)
+            file_set.add(module_path)
+
+            # Installed code only changes with installations.
+            if not module_path.startswith(INSTALLED_DIR):
+                todo += [(vars(module), module_path)]
+
+    return sorted(file_set)
+
+
+def argument_file(argument: object) -> list:
+    """Get the files the arguments of a run depend on: the YAML argument
+    file, and the files read by its generators, with the source files of
+    factory scripts.
+
+    Parameters
+    ----------
+    argument : `str` or `dict`
+        The YAML argument file, or the arguments themselves, with their
+        relative files already based on their declaring file. None gives no
+        files.
+
+    Returns
+    -------
+    `list`
+        The files.
+    """
+    # Imported here, as this module is imported by the command line parsing,
+    # which must stay fast.
+    # pylint: disable=import-outside-toplevel
+    from yaml import safe_load
+
+    from .parse_argument.generate_argument import (generator_file,
+                                                   rebase_argument)
+    # pylint: enable=import-outside-toplevel
+
+    path_list: list = []
+
+    if isinstance(argument, str):
+        path_list += [abspath(argument)]
+
+        with open(argument, "r", encoding="utf-8") as file:
+            argument = rebase_argument(safe_load(file),
+                                       root=dirname(argument))
+
+    for generator, path in generator_file(argument=argument):
+        if generator == "factory":
+            path_list += source_file(namespace={}, path=path)
+        else:
+            path_list += [abspath(path)]
+
+    return path_list
+
+
+def hash_file(path: str) -> str:
+    """Hash a file, by its content, or by its size and its modification time
+    for installed code.
+
+    Parameters
+    ----------
+    path : `str`
+        The file path.
+
+    Returns
+    -------
+    `str`
+        The file hash, empty for a missing file.
+    """
+    if not isfile(path):
+        return ""
+
+    if path.startswith(INSTALLED_DIR):
+        stat: os.stat_result = os.stat(path)
+
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    with open(path, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def cache_key(option: dict, path_list: list) -> str:
+    """Compute the cache key of a run.
+
+    Parameters
+    ----------
+    option : `dict`
+        The JSON serializable run options.
+
+    path_list : `list`
+        The source files of the run.
+
+    Returns
+    -------
+    `str`
+        The key, a hexadecimal hash.
+    """
+    # Imported here, as this module is imported by "main.py".
+    # pylint: disable=import-outside-toplevel
+    from .main import __version__
+    # pylint: enable=import-outside-toplevel
+
+    return hashlib.sha256(json.dumps({
+        "perfassess": __version__,
+        "python": sys.version,
+        "machine": platform.machine(),
+        "option": option,
+        "file": {path: hash_file(path=path) for path in sorted(path_list)}
+    }, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def run_option(argument: object) -> dict:
+    """Get the options changing the result of a run, from checked command
+    line arguments.
+
+    Parameters
+    ----------
+    argument : `ArgumentParser`
+        The checked arguments.
+
+    Returns
+    -------
+    `dict`
+        The JSON serializable options.
+    """
+    return {
+        "function": argument.function.__qualname__,
+        "n_field": argument.n_field,
+        "import_profiling": argument.import_profiling is not None,
+        "gc_mode": argument.gc_mode,
+        "gc_trace": argument.gc_trace,
+        "object": argument.object,
+        "line": [function.__qualname__ for function in argument.line or []],
+        "time_backend": argument.time_backend,
+        "include": argument.include,
+        "exclude": argument.exclude,
+        "sample_interval": argument.sample_interval,
+        "leak": argument.leak,
+        "throughput": [argument.throughput, argument.throughput_duration,
+                       argument.throughput_worker],
+        "noise": argument.noise or argument.max_noise is not None,
+        "cpu": argument.cpu,
+        "priority": argument.priority,
+        "reset_peak": argument.reset_peak,
+        "export": argument.export
+    }
+
+
+def run_key(argument: object) -> str:
+    """Compute the cache key of a run, from checked command line arguments.
+
+    Parameters
+    ----------
+    argument : `ArgumentParser`
+        The checked arguments.
+
+    Returns
+    -------
+    `str`
+        The key, a hexadecimal hash.
+    """
+    # Their content, not their path, changes the result.
+    path_list: list = module_file(function=argument.function) + \
+        argument_file(argument=argument.argument_file)
+
+    return cache_key(option=run_option(argument=argument),
+                     path_list=path_list)
+
+
+def file_state(path: str) -> dict:
+    """Get the size and the modification time of the files of a directory.
+
+    Parameters
+    ----------
+    path : `str`
+        The directory.
+
+    Returns
+    -------
+    `dict`
+        The `(size, modification time)` by file path.
+    """
+    state: dict = {}
+
+    for name in os.listdir(path):
+        file: str = join(path, name)
+
+        if isfile(file):
+            stat: os.stat_result = os.stat(file)
+            state[file] = (stat.st_size, stat.st_mtime_ns)
+
+    return state
+
+
+def changed_file(path: str, state: dict) -> list:
+    """Get the files of a directory written since a state.
+
+    Parameters
+    ----------
+    path : `str`
+        The directory.
+
+    state : `dict`
+        The previous state, like given by `file_state()`.
+
+    Returns
+    -------
+    `list`
+        The new or modified files.
+    """
+    return [file for file, value in file_state(path=path).items()
+            if state.get(file) != value]
+
+
+class ResultCache:
+    """A class to keep the output files of runs, by key, in a size bounded
+    directory. The least recently used entries are removed first.
+    """
+
+    def __init__(self, path: str = CACHE_DIR, max_size: float = 512):
+        """Initialize a ResultCache object.
+
+        Parameters
+        ----------
+        path : `str`, optional
+            The cache directory, created when missing. By default
+            "~/.cache/perfassess".
+
+        max_size : `float`, optional
+            The maximal cache size, in Mib. By default 512.
+
+        Raises
+        ------
+        `ValueError`
+            If `max_size` is negative.
+        """
+        if max_size < 0:
+            raise ValueError(f"[Err##] Given max_size \"{max_size}\" should "
+                             "be positive.")
+
+        self.__path: str = path
+        self.__max_size: float = max_size * 1024 ** 2
+
+        os.makedirs(path, exist_ok=True)
+
+    def find(self, key: str) -> str:
+        """Find a cached run, marking it as recently used.
+
+        Parameters
+        ----------
+        key : `str`
+            The run key.
+
+        Returns
+        -------
+        `str`
+            The directory of the cached files, or `None` if the run is not
+            cached.
+        """
+        entry: str = join(self.__path, key)
+
+        if not isdir(entry):
+            return None
+
+        os.utime(entry)
+
+        return entry
+
+    def get(self, key: str, output: str) -> bool:
+        """Copy the files of a cached run into a directory.
+
+        Parameters
+        ----------
+        key : `str`
+            The run key.
+
+        output : `str`
+            The directory receiving the files.
+
+        Returns
+        -------
+        `bool`
+            `True` if the run was cached.
+        """
+        entry: str = self.find(key=key)
+
+        if entry is None:
+            return False
+
+        for name in os.listdir(entry):
+            shutil.copy2(join(entry, name), join(output, name))
+
+        return True
+
+    def put(self, key: str, path_list: list):
+        """Cache the files of a run, then remove the least recently used
+        entries over the cache size.
+
+        Parameters
+        ----------
+        key : `str`
+            The run key.
+
+        path_list : `list`
+            The output files of the run.
+        """
+        entry: str = join(self.__path, key)
+        # Written aside, so that an entry is never read half written.
+        temporary: str = f"{entry}.{os.getpid()}.tmp"
+
+        os.makedirs(temporary, exist_ok=True)
+
+        for path in path_list:
+            shutil.copy2(path, temporary)
+
+        shutil.rmtree(entry, ignore_errors=True)
+        os.replace(temporary, entry)
+        os.utime(entry)
+
+        self.evict()
+
+    def evict(self):
+        """Remove the least recently used entries, until the cache fits in
+        its size.
+        """
+        entry_list: list = []
+
+        for name in os.listdir(self.__path):
+            entry: str = join(self.__path, name)
+
+            if name.endswith(".tmp") or not isdir(entry):
+                continue
+
+            size: int = sum(os.path.getsize(join(entry, file))
+                            for file in os.listdir(entry))
+            entry_list += [(getmtime(entry), size, entry)]
+
+        total: int = sum(size for _, size, _ in entry_list)
+
+        # Oldest first.
+        for _, size, entry in sorted(entry_list):
+            if total <= self.__max_size:
+                break
+
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
@@ -0,0 +1,125 @@
+r"""Contains functions to save, load and align computed data.
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [J]
+import json
+
+# [N]
+import numpy as np
+
+
+def trim_label(label: str, n_field: int = 0) -> str:
+    """Keep the last fields of a label path, like the `n_field` of an
+    assessor or of a merge.
+
+    Parameters
+    ----------
+    label : `str`
+        The label, like "/home/user/package/script.py:10".
+
+    n_field : `int`, optional
+        The number of "/" separated fields to keep. By default 0, keeping
+        everything.
+
+    Returns
+    -------
+    `str`
+        The trimmed label, like "package/script.py:10" with 2.
+    """
+    if n_field <= 0:
+        return label
+
+    return "/".join(label.split(sep="/")[-n_field:])
+
+
+def data_to_json(data: dict) -> dict:
+    """Convert computed data into a JSON serializable dictionary.
+
+    Parameters
+    ----------
+    data : `dict`
+        Computed data, like given by `PerformanceAssessor.data()`.
+
+    Returns
+    -------
+    `dict`
+        The same data, with lists instead of `np.array`.
+    """
+    return {
+        key: {
+            field: np.asarray(value).tolist()
+            for field, value in evaluation.items()
+        }
+        for key, evaluation in data.items()
+    }
+
+
+def data_from_json(data: dict) -> dict:
+    """Convert a JSON dictionary back into computed data.
+
+    Parameters
+    ----------
+    data : `dict`
+        The data, like given by `data_to_json()`.
+
+    Returns
+    -------
+    `dict`
+        Computed data, with `np.array` instead of lists.
+    """
+    evaluation_dict: dict = {}
+
+    for key, evaluation in data.items():
+        evaluation_dict[key] = {
+            field: np.array(value) for field, value in evaluation.items()
+        }
+
+        evaluation_dict[key]["data"] = np.array(evaluation["data"],
+                                                dtype=float)
+
+    return evaluation_dict
+
+
+def save_result(data: dict, path: str):
+    """Save computed data to a `.json` file.
+
+    Parameters
+    ----------
+    data : `dict`
+        Computed data, like given by `PerformanceAssessor.data()`.
+
+    path : `str`
+        The file path.
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(data_to_json(data=data), file)
+
+
+def load_result(path: str) -> dict:
+    """Load computed data from a `.json` file.
+
+    Parameters
+    ----------
+    path : `str`
+        The file path.
+
+    Returns
+    -------
+    `dict`
+        Computed data.
+
+    Raises
+    ------
+    `FileNotFoundError`
+        If the file does not exist.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            return data_from_json(data=json.load(file))
+    except FileNotFoundError as error:
+        raise FileNotFoundError(f"[Err##] Result file \"{path}\" does not "
+                                "exist.") from error
@@ -0,0 +1,387 @@
+r"""An object to profile a fraction of the calls of a function, always on,
+with a bounded rolling aggregation.
+
+Usage
+-----
+```py
+from perfassess.sampled_profiler import SampledProfiler
+
+sampler: SampledProfiler = SampledProfiler(rate=0.01, window=60)
+
+
+@sampler
+def handle_request(request):
+    ...
+
+
+# Later, on demand.
+sampler.plot(path="output_directory/")
+```
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [C]
+from collections import deque
+from cProfile import Profile
+# [F]
+from functools import wraps
+# [O]
+from os.path import basename
+# [P]
+from pstats import Stats
+# [R]
+from random import random
+# [S]
+import sys
+# [T]
+from threading import Lock
+from time import monotonic, time
+import tracemalloc
+from typing import Callable
+
+# [N]
+import numpy as np
+
+# [C]
+from .class_performance_assessor import PerformanceAssessor
+
+
+# Label of the functions or lines folded together over the cap.
+OTHER: str = "(other)"
+
+
+class SampledProfiler:
+    """A class to profile only some calls of decorated functions: a fraction
+    of them, or one every `period` seconds. Each sampled profile is added to
+    the current time window. Only the last `max_window` windows are kept,
+    each with at most `max_row` functions and lines, the smallest other ones
+    being folded into an "(other)" row. So the memory used stays bounded.
+
+    Only one call is profiled at a time, other calls running at the same time
+    are not sampled.
+    """
+
+    # pylint: disable=too-many-arguments
+    # A sampling needs a lot of options.
+    def __init__(
+        self,
+        rate: float = 0.01,
+        period: float = None,
+        window: float = 60,
+        max_window: int = 10,
+        max_row: int = 1000,
+        do_memory: bool = False
+    ):
+        """Initialize a SampledProfiler object.
+
+        Parameters
+        ----------
+        rate : `float`, optional
+            The fraction of calls to profile, between 0 and 1. By default
+            0.01.
+
+        period : `float`, optional
+            Profile one call every `period` seconds, instead of using `rate`.
+            By default None.
+
+        window : `float`, optional
+            The duration of an aggregation window, in seconds. By default 60.
+
+        max_window : `int`, optional
+            The number of windows kept. By default 10.
+
+        max_row : `int`, optional
+            The number of functions, and of memory lines, kept by window. By
+            default 1000.
+
+        do_memory : `bool`, optional
+            Also trace the memory of sampled calls with `tracemalloc`, only
+            when nothing else uses it. By default False.
+
+        Raises
+        ------
+        `ValueError`
+            If a parameter is out of its range.
+        """
+        if not 0 <= rate <= 1:
+            raise ValueError(f"[Err##] Given rate \"{rate}\" should be "
+                             "between 0 and 1.")
+
+        if period is not None and period < 0:
+            raise ValueError(f"[Err##] Given period \"{period}\" should be "
+                             "positive.")
+
+        if window <= 0 or max_window < 1 or max_row < 1:
+            raise ValueError("[Err##] Given window, max_window and max_row "
+                             "should be strictly positive.")
+
+        self.__rate: float = rate
+        self.__period: float = period
+        self.__window: float = window
+        self.__max_row: int = max_row
+        self.__do_memory: bool = do_memory
+
+        # Oldest windows are dropped first.
+        self.__window_list: deque = deque(maxlen=max_window)
+        self.__lock: Lock = Lock()
+        self.__busy: bool = False
+        self.__last_sample: float = -np.inf
+
+    # pylint: enable=too-many-arguments
+
+    def __call__(self, function: Callable) -> Callable:
+        """Decorate a function, to sample its calls.
+
+        Parameters
+        ----------
+        function : `Callable`
+            The function to sample.
+
+        Returns
+        -------
+        `Callable`
+            The sampled function.
+        """
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not self.__should_sample():
+                return function(*args, **kwargs)
+
+            try:
+                return self.__profile(function, *args, **kwargs)
+            finally:
+                self.__busy = False
+
+        return wrapper
+
+    def __current_window(self) -> dict:
+        """Get the current window, starting a new one when needed. The lock
+        has to be held.
+
+        Returns
+        -------
+        `dict`
+            The current window.
+        """
+        start: float = time() // self.__window * self.__window
+
+        if not self.__window_list or self.__window_list[-1]["start"] != start:
+            self.__window_list.append({"start": start, "call": 0,
+                                       "sample": 0, "time": {},
+                                       "memory": {}})
+
+        return self.__window_list[-1]
+
+    def __should_sample(self) -> bool:
+        """Count a call, then choose if it is profiled.
+
+        Returns
+        -------
+        `bool`
+            `True` if the call is profiled.
+        """
+        with self.__lock:
+            self.__current_window()["call"] += 1
+
+            if self.__busy:
+                return False
+
+            if self.__period is not None:
+                now: float = monotonic()
+                sample: bool = now - self.__last_sample >= self.__period
+
+                if sample:
+                    self.__last_sample = now
+            else:
+                sample = random() < self.__rate
+
+            self.__busy = sample
+
+            return sample
+
+    def __profile(self, function: Callable, *args, **kwargs) -> object:
+        """Profile a call, then add it to the current window.
+
+        Parameters
+        ----------
+        function : `Callable`
+            The function to call.
+
+        args, kwargs
+            The function arguments.
+
+        Returns
+        -------
+        `object`
+            The function result. When another profiler is running, the call
+            is not profiled, to not change it.
+        """
+        # Before python 3.12, cProfile would replace the running profiler.
+        if sys.getprofile() is not None:
+            return function(*args, **kwargs)
+
+        do_memory: bool = self.__do_memory and not tracemalloc.is_tracing()
+        profile: Profile = Profile()
+
+        if do_memory:
+            tracemalloc.start()
+
+        try:
+            profile.enable()
+        except ValueError:
+            # Since python 3.12, another profiler is using sys.monitoring.
+            if do_memory:
+                tracemalloc.stop()
+
+            return function(*args, **kwargs)
+
+        try:
+            return function(*args, **kwargs)
+        finally:
+            profile.disable()
+            stat_memory: list = []
+
+            if do_memory:
+                stat_memory = tracemalloc.take_snapshot().filter_traces([
+                    tracemalloc.Filter(False, __file__)
+                ]).statistics("lineno")
+                tracemalloc.stop()
+
+            self.__fold(stat_time=Stats(profile).stats,
+                        stat_memory=stat_memory)
+
+    def __fold(self, stat_time: dict, stat_memory: list):
+        """Add a sampled profile to the current window.
+
+        Parameters
+        ----------
+        stat_time : `dict`
+            The `pstats.Stats` statistics.
+
+        stat_memory : `list`
+            The `tracemalloc` statistics.
+        """
+        time_row: dict = {}
+
+        for (file, line, name), (_, ncalls, tottime, cumtime, _) \
+                in stat_time.items():
+            # Like "strip_dirs()", built-ins have no file.
+            label: str = name if file == "~" else \
+                f"{basename(file)}:{line}({name})"
+
+            if label != "<method 'disable' of '_lsprof.Profiler' objects>":
+                time_row[label] = np.array([ncalls, tottime, cumtime])
+
+        memory_row: dict = {
+            str(stat.traceback): np.array([stat.size / 1024])
+            for stat in stat_memory
+        }
+
+        with self.__lock:
+            window: dict = self.__current_window()
+            window["sample"] += 1
+
+            for key, row in (("time", time_row), ("memory", memory_row)):
+                for label, value in row.items():
+                    # Over the cap, new labels are folded together.
+                    if label not in window[key] and \
+                            len(window[key]) >= self.__max_row - 1:
+                        label = OTHER
+
+                    window[key][label] = window[key].get(label, 0) + value
+
+    def data(self) -> dict:
+        """Get the aggregation of the kept windows.
+
+        Returns
+        -------
+        `dict`
+            Computed data, with a "time_evaluation" like the cProfile one, a
+            "sample_evaluation" with the calls and the sampled calls of each
+            window and, with `do_memory`, a "memory_evaluation". All have
+            "head", "label" and "data" keys.
+        """
+        with self.__lock:
+            # Windows too old are dropped, even without new calls.
+            oldest: float = time() - self.__window * \
+                self.__window_list.maxlen
+            window_list: list = [window for window in self.__window_list
+                                 if window["start"] + self.__window > oldest]
+
+            total: dict = {"time": {}, "memory": {}}
+
+            for window in window_list:
+                for key, row in total.items():
+                    for label, value in window[key].items():
+                        row[label] = row.get(label, 0) + value
+
+        stat: np.array = np.array(list(total["time"].values()),
+                                  dtype=float).reshape(-1, 3)
+        per_call: np.array = np.where(stat[:, 0] > 0, stat[:, 0], 1)
+
+        data: dict = {
+            "time_evaluation": {
+                "head": np.array(["ncalls", "tottime (s)", "percall (s)",
+                                  "cumtime (s)", "percall (s)",
+                                  "filename:lineno(function)"]),
+                "label": np.array(list(total["time"]), dtype=str),
+                "data": np.array([
+                    stat[:, 0],
+                    stat[:, 1],
+                    stat[:, 1] / per_call,
+                    stat[:, 2],
+                    stat[:, 2] / per_call
+                ]).T.reshape(-1, 5)
+            },
+            "sample_evaluation": {
+                "head": np.array(["calls", "sampled calls", "window start"]),
+                "label": np.array([
+                    np.datetime_as_string(np.datetime64(int(window["start"]),
+                                                        "s"))
+                    for window in window_list
+                ], dtype=str),
+                "data": np.array([[window["call"], window["sample"]]
+                                  for window in window_list],
+                                 dtype=float).reshape(-1, 2)
+            }
+        }
+
+        if self.__do_memory:
+            data["memory_evaluation"] = {
+                "head": np.array(["size (Kib)", "function"]),
+                "label": np.array(list(total["memory"]), dtype=str),
+                "data": np.array(list(total["memory"].values()),
+                                 dtype=float).reshape(-1, 1)
+            }
+
+        return data
+
+    def assessor(self) -> PerformanceAssessor:
+        """Get the aggregation of the kept windows as an assessor.
+
+        Returns
+        -------
+        `PerformanceAssessor`
+            An assessor with the evaluations of `data()`.
+        """
+        assessor: PerformanceAssessor = PerformanceAssessor(main=None)
+
+        for key, evaluation in self.data().items():
+            assessor.add_evaluation(key=key, evaluation=evaluation)
+
+        return assessor
+
+    def plot(self, path: str = "./"):
+        """Save the plots of the aggregation of the kept windows to `.html`
+        files.
+
+        Parameters
+        ----------
+        path : `str`, optional
+            The path to save the files, which have to be a directory. By
+            default "./".
+        """
+        self.assessor().plot(path=path)
@@ -0,0 +1,177 @@
+r"""A thin client sending profiling requests to a session server.
+
+Only the standard library is imported here, so a request does not pay for
+importing NumPy, Plotly or the target modules.
+
+Usage
+-----
+```sh
+$ perfassess-client -s script.py \
+                    -f function_name \
+                    -o output_directory/ \
+                    -a argument.yml \
+                    --session /tmp/perfassess.sock
+```
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [I]
+from importlib.metadata import PackageNotFoundError, version
+# [J]
+import json
+# [O]
+from os.path import abspath
+# [S]
+import socket
+
+# [D]
+from .parse_argument.define_argument import define_argument
+
+
+class SessionClient:
+    """A client to send requests to a `SessionServer`.
+    """
+
+    def __init__(self, socket_path: str):
+        """Initialize a SessionClient object.
+
+        Parameters
+        ----------
+        socket_path : `str`
+            The Unix socket path of the server.
+        """
+        self.__socket_path: str = socket_path
+
+    def profile(self, **request) -> dict:
+        """Ask the server to profile a function.
+
+        Parameters
+        ----------
+        request
+            The request, with the same keys as the command line arguments:
+            "script", "function", "package", "subpackage", "argument",
+            "n_field", "output", "import_profiling".
+
+        Returns
+        -------
+        `dict`
+            The answer, with the computed "data" as lists. Use
+            `result_io.data_from_json()` to get `np.array` back.
+        """
+        # The server may not have the same working directory.
+        for key in ("script", "package", "subpackage", "argument", "output"):
+            if request.get(key) is not None:
+                request[key] = abspath(request[key])
+
+        return self.__send(request=request)
+
+    def ping(self) -> dict:
+        """Check that the server is answering.
+
+        Returns
+        -------
+        `dict`
+            The answer.
+        """
+        return self.__send(request={"command": "ping"})
+
+    def shutdown(self) -> dict:
+        """Ask the server to stop.
+
+        Returns
+        -------
+        `dict`
+            The answer.
+        """
+        return self.__send(request={"command": "shutdown"})
+
+    def __send(self, request: dict) -> dict:
+        """Send a request and wait for its answer.
+
+        Parameters
+        ----------
+        request : `dict`
+            The request.
+
+        Returns
+        -------
+        `dict`
+            The answer.
+
+        Raises
+        ------
+        `RuntimeError`
+            If the server answered with an error.
+        """
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(self.__socket_path)
+            client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+
+            with client.makefile("rb") as file:
+                answer: dict = json.loads(file.readline())
+
+        if answer["status"] != "ok":
+            raise RuntimeError(f"[Err##] Session server error: "
+                               f"{answer['error']}")
+
+        return answer
+
+
+def request_session(argument: object) -> dict:
+    """Send the parsed command line arguments to a session server.
+
+    Parameters
+    ----------
+    argument : `ArgumentParser`
+        The parsed arguments, with a "session" socket path.
+
+    Returns
+    -------
+    `dict`
+        The server answer.
+    """
+    answer: dict = SessionClient(socket_path=argument.session).profile(
+        script=argument.script,
+        function=argument.function,
+        package=argument.package,
+        subpackage=argument.subpackage,
+        argument=argument.argument,
+        n_field=argument.n_field,
+        output=argument.output,
+        import_profiling=argument.import_profiling
+    )
+
+    print(f"Profiled in {answer['elapsed']:.4f} s by the session server "
+          f"({'reloaded' if answer['reloaded'] else 'already loaded'} "
+          "target).")
+
+    return answer
+
+
+def main():
+    """Send the command line arguments to a session server.
+
+    Raises
+    ------
+    `ValueError`
+        If no session socket is given.
+    """
+    try:
+        program_version: str = version("perfassess")
+    except PackageNotFoundError:
+        program_version = None
+
+    argument = define_argument(version=program_version)
+
+    if argument.session is None:
+        raise ValueError("[Err##] A session server socket have to be given "
+                         "with --session.")
+
+    request_session(argument=argument)
+
+
+if __name__ == "__main__":
+    main()
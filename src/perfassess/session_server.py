@@ -0,0 +1,281 @@
+r"""A long-lived server keeping targets loaded between profiling requests.
+
+Usage
+-----
+Start the server with:
+
+```sh
+$ perfassess-server --socket /tmp/perfassess.sock
+```
+
+Then send profiling requests with `perfassess-client`, or `perfassess`, using
+the same arguments as a normal run plus `--session /tmp/perfassess.sock`.
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [A]
+from argparse import ArgumentParser, Namespace
+# [J]
+import json
+# [O]
+import os
+from os.path import abspath, exists, getmtime
+# [S]
+from socketserver import StreamRequestHandler, UnixStreamServer
+from stat import S_ISSOCK
+import sys
+# [T]
+from threading import Thread
+from time import perf_counter
+
+# [C]
+from .class_performance_assessor import PerformanceAssessor
+# [P]
+from .parse_argument.check_argument import check_argument, load_argument
+# [R]
+from .result_io import data_to_json
+
+
+def remove_stale_socket(socket_path: str):
+    """Remove a socket file left by a previous server.
+
+    Parameters
+    ----------
+    socket_path : `str`
+        The Unix socket path.
+
+    Raises
+    ------
+    `ValueError`
+        If the path exists and is not a socket.
+    """
+    if exists(socket_path):
+        if not S_ISSOCK(os.stat(socket_path).st_mode):
+            raise ValueError(f"[Err##] Given path \"{socket_path}\" exists "
+                             "and is not a socket.")
+
+        os.unlink(socket_path)
+
+
+class SessionServer(UnixStreamServer):
+    """A Unix socket server profiling functions without restarting the
+    interpreter.
+
+    Loaded targets are kept between requests. A target is only loaded again
+    when the source of the script, of its packages or of a module it imported
+    changed. In this case, only the changed modules are removed from
+    `sys.modules`, so unchanged dependencies are not executed again.
+    """
+
+    def __init__(self, socket_path: str):
+        """Initialize a SessionServer object.
+
+        Parameters
+        ----------
+        socket_path : `str`
+            The Unix socket path. A stale socket file is replaced.
+
+        Raises
+        ------
+        `ValueError`
+            If the path exists and is not a socket.
+        """
+        remove_stale_socket(socket_path=socket_path)
+
+        super().__init__(socket_path, _SessionHandler)
+
+        # Only the current user can send requests.
+        os.chmod(socket_path, 0o600)
+
+        self.__target: dict = {}
+
+    def server_close(self):
+        """Close the server and remove the socket file."""
+        super().server_close()
+
+        if exists(self.server_address):
+            os.unlink(self.server_address)
+
+    def profile(self, request: dict) -> dict:
+        """Profile a function as asked in a request.
+
+        Parameters
+        ----------
+        request : `dict`
+            The request, with the same keys as the command line arguments:
+            "script", "function", "package", "subpackage", "argument",
+            "n_field", "output", "import_profiling". "do_memory" and "do_time"
+            are also accepted.
+
+        Returns
+        -------
+        `dict`
+            The answer, with the computed "data", the time taken by the server
+            as "elapsed" and if the target was "reloaded".
+        """
+        start: float = perf_counter()
+        target, reloaded = self.__load_target(request=request)
+
+        assessor: PerformanceAssessor = PerformanceAssessor(
+            main=target.function,
+            n_field=request.get("n_field", 0),
+            **load_argument(path=request.get("argument"))
+        )
+
+        assessor.launch_profiling(
+            do_memory=request.get("do_memory", True),
+            do_time=request.get("do_time", True)
+        )
+
+        if target.import_profiling is not None:
+            assessor.add_evaluation(
+                key="import_evaluation",
+                evaluation=target.import_profiling
+            )
+
+        if request.get("output") is not None:
+            assessor.plot(path=request["output"])
+
+        return {
+            "status": "ok",
+            "data": data_to_json(data=assessor.data()),
+            "reloaded": reloaded,
+            "elapsed": perf_counter() - start
+        }
+
+    def __load_target(self, request: dict) -> tuple:
+        """Get a loaded target, loading it again only if its source changed.
+
+        Parameters
+        ----------
+        request : `dict`
+            The profiling request.
+
+        Returns
+        -------
+        `tuple`
+            The checked arguments, with the loaded function, and if the
+            target was loaded during this call.
+        """
+        key: tuple = tuple(request.get(field) for field in (
+            "script", "function", "package", "subpackage", "import_profiling"
+        ))
+
+        # Modules imported at the first load are already in `sys.modules`
+        # at the next ones: keep watching them.
+        previous: set = set()
+
+        if key in self.__target:
+            target, mtime = self.__target[key]
+            previous = set(mtime)
+            changed: set = {
+                path for path, time in mtime.items()
+                if not exists(path) or getmtime(path) != time
+            }
+
+            if not changed:
+                return target, False
+
+            # Forget changed modules, so they are imported again.
+            for name, module in list(sys.modules.items()):
+                if getattr(module, "__file__", None) in changed:
+                    del sys.modules[name]
+
+        loaded: set = set(sys.modules)
+
+        target: Namespace = check_argument(Namespace(
+            script=request["script"],
+            # Plots are not always written: the output is then only checked.
+            output=request.get("output") or ".",
+            function=request.get("function", "main"),
+            n_field=request.get("n_field", 0),
+            package=request.get("package"),
+            subpackage=request.get("subpackage"),
+            argument=None,
+            import_profiling=request.get("import_profiling", False),
+            line=None
+        ))
+
+        # Watch the target files and every module imported with them.
+        watched: set = {
+            abspath(path) for path in (request["script"],
+                                       request.get("package"),
+                                       request.get("subpackage"))
+            if path is not None
+        } | {path for path in previous if exists(path)}
+
+        for name in set(sys.modules) - loaded:
+            path: str = getattr(sys.modules[name], "__file__", None)
+
+            if path is not None and exists(path):
+                watched.add(path)
+
+        self.__target[key] = (
+            target,
+            {path: getmtime(path) for path in watched}
+        )
+
+        return target, True
+
+
+class _SessionHandler(StreamRequestHandler):
+    """Handle one JSON request per line, answering one JSON line each.
+    """
+
+    def handle(self):
+        """Answer the requests of a connected client."""
+        for line in self.rfile:
+            try:
+                request: dict = json.loads(line)
+
+                if request.get("command") == "shutdown":
+                    answer: dict = {"status": "ok"}
+                    # Shutting down from the serving thread would block it.
+                    Thread(target=self.server.shutdown).start()
+                elif request.get("command") == "ping":
+                    answer = {"status": "ok"}
+                else:
+                    answer = self.server.profile(request=request)
+            # The server must survive any error of the profiled code.
+            # pylint: disable=broad-exception-caught
+            except Exception as error:
+                answer = {"status": "error",
+                          "error": f"{type(error).__name__}: {error}"}
+            # pylint: enable=broad-exception-caught
+
+            self.wfile.write(json.dumps(answer).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+def main():
+    """Start a session server, until it is interrupted or shut down.
+    """
+    parser: ArgumentParser = ArgumentParser(
+        description="Start a perfassess session server on a Unix socket."
+    )
+
+    parser.add_argument(
+        "-S",
+        "--socket",
+        dest="socket",
+        required=True,
+        type=str,
+        metavar="[FILE]",
+        help="The Unix socket path to listen on."
+    )
+
+    server: SessionServer = SessionServer(socket_path=parser.parse_args().socket)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,446 @@
+r"""Run a suite of targets, described in a YAML file or in a `pyproject.toml`.
+
+Suite file
+----------
+In a YAML file:
+
+```yml
+worker: 4
+target:
+  - name: small_list
+    script: src/perfassess/testor.py
+    function: testor
+    argument: {value: [1, 2, 3]}
+    repeat: 5
+    budget: {time: 0.1, memory: 100}
+```
+
+Or in a `pyproject.toml`:
+
+```toml
+[tool.perfassess]
+worker = 4
+
+[[tool.perfassess.target]]
+name = "small_list"
+script = "src/perfassess/testor.py"
+function = "testor"
+argument = "data/argument.yml"
+```
+
+Paths are relative to the suite file directory. "argument" is either a YAML
+file path or the arguments themselves. "time" budgets are in seconds, "memory"
+budgets in Kib.
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [A]
+from argparse import Namespace
+# [C]
+from concurrent.futures import ProcessPoolExecutor
+# [F]
+from functools import partial
+# [J]
+import json
+# [O]
+from os.path import basename, dirname, exists, isabs, join
+# [T]
+from tempfile import TemporaryDirectory
+
+# [T]
+try:
+    import tomllib
+except ModuleNotFoundError:
+    # Python 3.10 has no TOML parser: only YAML suites can be used.
+    tomllib = None
+
+# [N]
+import numpy as np
+# [Y]
+from yaml import safe_load
+
+# [C]
+from .class_performance_assessor import PerformanceAssessor
+# [P]
+from .parse_argument.check_argument import check_argument, load_argument
+from .parse_argument.generate_argument import (generate_argument,
+                                               rebase_argument)
+# [R]
+from .result_cache import ResultCache, argument_file, cache_key, module_file
+from .result_io import data_from_json, data_to_json, save_result
+
+
+def load_suite(path: str) -> dict:
+    """Load a suite file.
+
+    Parameters
+    ----------
+    path : `str`
+        A ".yml" suite file, or a "pyproject.toml" file with a
+        `[tool.perfassess]` table.
+
+    Returns
+    -------
+    `dict`
+        The suite, with a "target" list and a "worker" number. Target paths
+        are made relative to the current directory.
+
+    Raises
+    ------
+    `FileNotFoundError`
+        If the suite file does not exist.
+
+    `ValueError`
+        If the suite file is not a ".yml" or ".toml" file, if it has no
+        targets, if a target has no script or a wrong repeat number, or if two
+        targets have the same name.
+    """
+    if not exists(path):
+        raise FileNotFoundError(f"[Err##] Suite file \"{path}\" does not "
+                                "exist.")
+
+    if path.endswith(".yml"):
+        with open(path, "r", encoding="utf-8") as file:
+            suite: dict = safe_load(file) or {}
+    elif path.endswith(".toml"):
+        if tomllib is None:
+            raise ValueError("[Err##] Reading a \".toml\" suite file needs "
+                             "python 3.11 or higher.")
+
+        with open(path, "rb") as file:
+            suite = tomllib.load(file).get("tool", {}).get("perfassess", {})
+    else:
+        raise ValueError(f"[Err##] Suite file \"{path}\" have to be a \".yml\""
+                         " or a \".toml\" file.")
+
+    if not suite.get("target"):
+        raise ValueError(f"[Err##] Suite file \"{path}\" does not contain "
+                         "any target.")
+
+    root: str = dirname(path)
+    target_list: list = []
+
+    for i, target in enumerate(suite["target"]):
+        if "script" not in target:
+            raise ValueError(f"[Err##] Target number {i} of suite file "
+                             f"\"{path}\" have no \"script\".")
+
+        repeat: object = target.get("repeat", 1)
+
+        # A boolean is an integer for python.
+        if not isinstance(repeat, int) or isinstance(repeat, bool) \
+                or repeat < 1:
+            raise ValueError(f"[Err##] Target number {i} of suite file "
+                             f"\"{path}\" should have an integer "
+                             "\"repeat\" greater or equal to 1.")
+
+        target = dict(target)
+        target.setdefault("function", "main")
+        target.setdefault(
+            "name",
+            f"{basename(target['script'])[:-3]}.{target['function']}"
+        )
+
+        # Paths are relative to the suite file.
+        for key in ("script", "package", "subpackage", "argument"):
+            if isinstance(target.get(key), str) and not isabs(target[key]):
+                target[key] = join(root, target[key])
+
+        # So are the files of the generators of inline arguments.
+        if isinstance(target.get("argument"), dict):
+            target["argument"] = rebase_argument(target["argument"],
+                                                 root=root)
+
+        target_list += [target]
+
+    names: list = [target["name"] for target in target_list]
+
+    if len(set(names)) != len(names):
+        raise ValueError(f"[Err##] Suite file \"{path}\" have targets with "
+                         "the same name.")
+
+    return {"target": target_list, "worker": suite.get("worker", 1)}
+
+
+def find_suite() -> str:
+    """Find a suite file in the current directory.
+
+    Returns
+    -------
+    `str`
+        The first found file between "perfassess.yml" and a "pyproject.toml"
+        with a `[tool.perfassess]` table.
+
+    Raises
+    ------
+    `FileNotFoundError`
+        If no suite file is found.
+    """
+    if exists("perfassess.yml"):
+        return "perfassess.yml"
+
+    if exists("pyproject.toml") and tomllib is not None:
+        with open("pyproject.toml", "rb") as file:
+            if "perfassess" in tomllib.load(file).get("tool", {}):
+                return "pyproject.toml"
+
+    raise FileNotFoundError("[Err##] No \"perfassess.yml\" or "
+                            "\"pyproject.toml\" with a [tool.perfassess] "
+                            "table found in the current directory.")
+
+
+def run_target(
+    target: dict,
+    cache: ResultCache = None,
+    force: bool = False
+) -> dict:
+    """Profile one target of a suite.
+
+    Parameters
+    ----------
+    target : `dict`
+        The target, like given by `load_suite()`.
+
+    cache : `ResultCache`, optional
+        The cache of the results of unchanged targets. By default None.
+
+    force : `bool`, optional
+        Profile the target even if its result is cached. By default False.
+
+    Returns
+    -------
+    `dict`
+        The target result, with its "name", "status", the total "time" (s)
+        and "memory" (Kib) of each repetition and the "data" of the fastest
+        repetition.
+    """
+    result: dict = {"name": target["name"], "time": [], "memory": [],
+                    "data": {}, "error": None}
+
+    # The suite must keep going when a target fails.
+    # pylint: disable=broad-exception-caught
+    try:
+        checked: Namespace = check_argument(Namespace(
+            script=target["script"],
+            output=".",
+            function=target["function"],
+            n_field=target.get("n_field", 0),
+            package=target.get("package"),
+            subpackage=target.get("subpackage"),
+            argument=None,
+            import_profiling=False,
+            line=None
+        ))
+        function: object = checked.function
+
+        if cache is not None:
+            path_list: list = module_file(function=function) + \
+                argument_file(argument=target.get("argument"))
+
+            key: str = cache_key(option=target, path_list=path_list)
+            entry: str = None if force else cache.find(key=key)
+
+            if entry is not None:
+                with open(join(entry, "target.json"), "r",
+                          encoding="utf-8") as file:
+                    return json.load(file)
+
+        if isinstance(target.get("argument"), dict):
+            argument: dict = generate_argument(target["argument"])
+        else:
+            argument = load_argument(path=target.get("argument"))
+
+        for _ in range(target.get("repeat", 1)):
+            assessor: PerformanceAssessor = PerformanceAssessor(
+                main=function,
+                n_field=target.get("n_field", 0),
+                **argument
+            )
+
+            assessor.launch_profiling()
+            data: dict = assessor.data()
+
+            result["time"] += [float(
+                np.sum(data["time_evaluation"]["data"].T[1])
+            )]
+            result["memory"] += [float(
+                np.sum(data["memory_evaluation"]["data"].T[0])
+            )]
+
+            # Keep the fastest repetition, the least disturbed one.
+            if result["time"][-1] == min(result["time"]):
+                result["data"] = data_to_json(data=data)
+    except Exception as error:
+        result["error"] = f"{type(error).__name__}: {error}"
+    # pylint: enable=broad-exception-caught
+
+    result["status"] = __budget_status(target=target, result=result)
+
+    # Failures are not cached, to be tried again.
+    if cache is not None and result["error"] is None:
+        with TemporaryDirectory() as directory:
+            path: str = join(directory, "target.json")
+
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(result, file)
+
+            cache.put(key=key, path_list=[path])
+
+    return result
+
+
+def __budget_status(target: dict, result: dict) -> str:
+    """Check a target result against its budget.
+
+    Parameters
+    ----------
+    target : `dict`
+        The target, with an optional "budget".
+
+    result : `dict`
+        The target result.
+
+    Returns
+    -------
+    `str`
+        "error", "fail" or "pass".
+    """
+    if result["error"] is not None:
+        return "error"
+
+    budget: dict = target.get("budget") or {}
+
+    if "time" in budget and min(result["time"]) > budget["time"]:
+        return "fail"
+    if "memory" in budget and min(result["memory"]) > budget["memory"]:
+        return "fail"
+
+    return "pass"
+
+
+def run_suite(
+    suite: dict,
+    output: str,
+    worker: int = None,
+    cache: ResultCache = None,
+    force: bool = False
+) -> list:
+    """Run every target of a suite, then write one consolidated report and
+    result file.
+
+    Parameters
+    ----------
+    suite : `dict`
+        The suite, like given by `load_suite()`.
+
+    output : `str`
+        The directory where "suite_evaluation.html" and "suite_result.json"
+        are written.
+
+    worker : `int`, optional
+        The number of worker processes. By default None, using the suite one.
+
+    cache : `ResultCache`, optional
+        The cache of the results of unchanged targets. By default None.
+
+    force : `bool`, optional
+        Profile every target even if its result is cached. By default False.
+
+    Returns
+    -------
+    `list`
+        The result of each target, like given by `run_target()`.
+
+    Raises
+    ------
+    `ValueError`
+        If the number of workers is lower than 1.
+    """
+    worker = suite["worker"] if worker is None else worker
+
+    if worker < 1:
+        raise ValueError(f"[Err##] The number of workers \"{worker}\" should "
+                         "be greater or equal to 1.")
+
+    run: object = partial(run_target, cache=cache, force=force)
+
+    if worker == 1:
+        result_list: list = list(map(run, suite["target"]))
+    else:
+        with ProcessPoolExecutor(max_workers=worker) as executor:
+            result_list = list(executor.map(run, suite["target"]))
+
+    budget_list: list = [target.get("budget") or {}
+                         for target in suite["target"]]
+
+    # Failing targets have no values.
+    summary: dict = {
+        "head": np.array(["time (s)", "memory (Kib)", "time budget (s)",
+                          "memory budget (Kib)", "target"]),
+        "label": np.array([result["name"] for result in result_list]),
+        "data": np.array([
+            [
+                min(result["time"], default=np.nan),
+                min(result["memory"], default=np.nan),
+                budget.get("time", np.nan),
+                budget.get("memory", np.nan)
+            ]
+            for result, budget in zip(result_list, budget_list)
+        ], dtype=float)
+    }
+
+    assessor: PerformanceAssessor = PerformanceAssessor(main=None)
+    assessor.add_evaluation(key="suite_evaluation", evaluation=summary)
+    assessor.plot(path=output)
+
+    # One result file, with every target data.
+    data: dict = {"suite_evaluation": summary}
+
+    for result in result_list:
+        for key, evaluation in data_from_json(data=result["data"]).items():
+            data[f"{result['name']}.{key}"] = evaluation
+
+    save_result(data=data, path=join(output, "suite_result.json"))
+
+    return result_list
+
+
+def main(argument: object) -> int:
+    """Run a suite from parsed command line arguments, printing a summary.
+
+    Parameters
+    ----------
+    argument : `ArgumentParser`
+        The parsed arguments, with "suite", "output", "worker", "cache",
+        "cache_size" and "force".
+
+    Returns
+    -------
+    `int`
+        The exit status: 1 if a target failed or went over its budget, 0
+        else.
+    """
+    path: str = find_suite() if argument.suite is None else argument.suite
+    cache: ResultCache = None
+
+    if argument.cache is not None:
+        cache = ResultCache(path=argument.cache,
+                            max_size=argument.cache_size)
+
+    result_list: list = run_suite(suite=load_suite(path=path),
+                                  output=argument.output,
+                                  worker=argument.worker,
+                                  cache=cache,
+                                  force=argument.force)
+
+    for result in result_list:
+        message: str = result["error"] or (
+            f"{min(result['time']):.6f} s, {min(result['memory']):.2f} Kib"
+        )
+
+        print(f"[{result['status'].upper():>5}] {result['name']}: {message}")
+
+    return int(any(result["status"] != "pass" for result in result_list))
@@ -0,0 +1,308 @@
+r"""An object to measure how the throughput of a function scales with the
+number of concurrent threads or processes.
+
+At each concurrency level, every worker calls the function in a loop, during
+the same wall clock window. The throughput is the number of calls per second
+of all workers, and the latency the time of one call. The speedup is the
+throughput against the one of a single worker, and the parallel efficiency
+the speedup against the ideal one, the concurrency. Threads stop scaling on
+the GIL or on locks, processes on memory bandwidth or on shared resources.
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [C]
+from concurrent.futures import (Executor, ProcessPoolExecutor,
+                                ThreadPoolExecutor)
+# [M]
+import multiprocessing
+# [O]
+import os
+# [T]
+from time import perf_counter, sleep, time
+from typing import Callable
+
+# [N]
+import numpy as np
+
+
+# Header of the throughput evaluation, the last one being the label column.
+HEAD: np.array = np.array([
+    "concurrency", "throughput (op/s)", "latency (s)", "latency p95 (s)",
+    "speedup", "efficiency", "run"
+])
+# Time given to the workers to start, before the measured window, in s.
+START_DELAY: float = 0.2
+# The function and its arguments, inherited by forked workers instead of
+# pickled: functions loaded from a script cannot be imported by name.
+FORKED_TARGET: dict = {}
+# Fork the workers when it is possible.
+FORK: bool = "fork" in multiprocessing.get_all_start_methods()
+
+
+def measure(
+    function: Callable,
+    argument: dict,
+    start: float,
+    duration: float
+) -> tuple:
+    """Call a function in a loop, during a wall clock window. Run by each
+    worker.
+
+    Parameters
+    ----------
+    function : `Callable`
+        The function to call.
+
+    argument : `dict`
+        The function arguments.
+
+    start : `float`
+        The window start, as given by `time.time()`, shared by processes.
+
+    duration : `float`
+        The window duration, in s.
+
+    Returns
+    -------
+    `tuple`
+        The time of each call, in s, and the time taken by the loop, in s.
+    """
+    sleep(max(start - time(), 0))
+
+    stop: float = start + duration
+    latency: list = []
+
+    # The call started last may end after the window.
+    while time() < stop:
+        call_start: float = perf_counter()
+        function(**argument)
+        latency += [perf_counter() - call_start]
+
+    return np.array(latency), time() - start
+
+
+def measure_forked(start: float, duration: float) -> tuple:
+    """Call the function of `FORKED_TARGET` in a loop, during a wall clock
+    window. Run by each forked worker.
+
+    Parameters
+    ----------
+    start : `float`
+        The window start, as given by `time.time()`.
+
+    duration : `float`
+        The window duration, in s.
+
+    Returns
+    -------
+    `tuple`
+        The time of each call, in s, and the time taken by the loop, in s.
+    """
+    return measure(start=start, duration=duration, **FORKED_TARGET)
+
+
+class ThroughputBenchmark:
+    """A class to measure the throughput and the latency of a function, from
+    1 to N concurrent threads, and separately processes.
+    """
+
+    # pylint: disable=too-many-arguments
+    # A benchmark needs a lot of options.
+    def __init__(
+        self,
+        function: Callable,
+        max_concurrency: int = None,
+        duration: float = 1,
+        worker_type: tuple = ("thread", "process"),
+        **kwargs
+    ):
+        """Initialize a ThroughputBenchmark object.
+
+        Parameters
+        ----------
+        function : `Callable`
+            The function to measure. With processes, it has to be picklable.
+
+        max_concurrency : `int`, optional
+            The highest concurrency level, N. By default None, using the
+            number of CPUs.
+
+        duration : `float`, optional
+            The measured window of each level, in s. By default 1.
+
+        worker_type : `tuple`, optional
+            The kinds of workers, "thread" and/or "process". By default both.
+
+        kwargs
+            All possible arguments for the function to measure.
+
+        Raises
+        ------
+        `ValueError`
+            If `max_concurrency` is lower than 1, if `duration` is not
+            strictly positive, or if a worker type is not "thread" or
+            "process".
+        """
+        if max_concurrency is None:
+            max_concurrency = os.cpu_count() or 1
+
+        if max_concurrency < 1:
+            raise ValueError("[Err##] Given max_concurrency "
+                             f"\"{max_concurrency}\" should be at least 1.")
+
+        if duration <= 0:
+            raise ValueError(f"[Err##] Given duration \"{duration}\" should "
+                             "be strictly positive.")
+
+        for worker_type_i in worker_type:
+            if worker_type_i not in ("thread", "process"):
+                raise ValueError(f"[Err##] Given worker_type "
+                                 f"\"{worker_type_i}\" should be \"thread\" "
+                                 "or \"process\".")
+
+        self.__function: Callable = function
+        self.__function_argument: dict = dict(kwargs)
+        self.__max_concurrency: int = max_concurrency
+        self.__duration: float = duration
+        self.__worker_type: tuple = tuple(dict.fromkeys(worker_type))
+
+        # One row per worker type and level: [concurrency, throughput,
+        # latency, latency p95].
+        self.__row: list = []
+        self.__label: list = []
+
+    # pylint: enable=too-many-arguments
+
+    def __run_level(self, executor: Executor, concurrency: int) -> list:
+        """Measure one concurrency level.
+
+        Parameters
+        ----------
+        executor : `Executor`
+            The pool, with `concurrency` workers.
+
+        concurrency : `int`
+            The number of workers.
+
+        Returns
+        -------
+        `list`
+            The concurrency, the throughput, the mean latency and the 95th
+            percentile latency.
+        """
+        start: float = time() + START_DELAY
+
+        if isinstance(executor, ProcessPoolExecutor) and FORK:
+            # Set before the workers are forked, at the first submission.
+            FORKED_TARGET.update(function=self.__function,
+                                 argument=self.__function_argument)
+            future_list: list = [
+                executor.submit(measure_forked, start, self.__duration)
+                for _ in range(concurrency)
+            ]
+        else:
+            # The function has to be importable by spawned workers.
+            future_list = [
+                executor.submit(measure, self.__function,
+                                self.__function_argument, start,
+                                self.__duration)
+                for _ in range(concurrency)
+            ]
+        result_list: list = [future.result() for future in future_list]
+        FORKED_TARGET.clear()
+        latency: np.array = np.concatenate([latency_i for latency_i, _
+                                            in result_list])
+
+        if len(latency) == 0:
+            return [concurrency, 0, np.nan, np.nan]
+
+        # Calls started in the window and ended after it are counted whole,
+        # over the time taken by the slowest worker.
+        elapsed: float = max(elapsed_i for _, elapsed_i in result_list)
+
+        return [concurrency, len(latency) / elapsed, np.mean(latency),
+                np.percentile(latency, 95)]
+
+    def launch(self):
+        """Measure each concurrency level, with each worker type."""
+        self.__row = []
+        self.__label = []
+
+        for worker_type in self.__worker_type:
+            for concurrency in range(1, self.__max_concurrency + 1):
+                if worker_type == "thread":
+                    executor: Executor = ThreadPoolExecutor(
+                        max_workers=concurrency
+                    )
+                else:
+                    executor = ProcessPoolExecutor(
+                        max_workers=concurrency,
+                        mp_context=multiprocessing.get_context(
+                            "fork" if FORK else None
+                        )
+                    )
+
+                with executor:
+                    self.__row += [self.__run_level(executor=executor,
+                                                    concurrency=concurrency)]
+                    self.__label += [f"{worker_type} {concurrency}"]
+
+    def data(self) -> dict:
+        """Get computed data.
+
+        Returns
+        -------
+        `dict`
+            Computed data, with a "throughput_evaluation" giving one row per
+            worker type and concurrency, and a "throughput_speedup" and a
+            "throughput_efficiency" giving the scaling of each worker type,
+            with the ideal one. All have "head", "label" and "data" keys.
+        """
+        row: np.array = np.array(self.__row, dtype=float).reshape(-1, 4)
+        worker_type: np.array = np.array([label.split()[0]
+                                          for label in self.__label],
+                                         dtype=str)
+        speedup: np.array = np.full(len(row), np.nan)
+
+        # Against a single worker of the same type.
+        for worker_type_i in self.__worker_type:
+            index: np.array = worker_type == worker_type_i
+            single: float = row[index][0, 1] if index.any() else 0
+
+            if single > 0:
+                speedup[index] = row[index, 1] / single
+
+        efficiency: np.array = speedup / row[:, 0]
+        level: np.array = np.arange(1, self.__max_concurrency + 1)
+
+        # The ideal scaling, drawn with the measured ones.
+        scaling_label: np.array = np.concatenate((
+            worker_type, np.full(len(level), "ideal")
+        ))
+        scaling_level: np.array = np.concatenate((row[:, 0], level))
+
+        return {
+            "throughput_evaluation": {
+                "head": HEAD,
+                "label": np.array(self.__label, dtype=str),
+                "data": np.column_stack((row, speedup, efficiency))
+            },
+            "throughput_speedup": {
+                "head": np.array(["concurrency", "speedup", "worker"]),
+                "label": scaling_label,
+                "data": np.column_stack((
+                    scaling_level, np.concatenate((speedup, level))
+                ))
+            },
+            "throughput_efficiency": {
+                "head": np.array(["concurrency", "efficiency", "worker"]),
+                "label": scaling_label,
+                "data": np.column_stack((
+                    scaling_level,
+                    np.concatenate((efficiency, np.ones(len(level))))
+                ))
+            }
+        }
@@ -0,0 +1,138 @@
+r"""Test if "src/perfassess/block_profiling.py" is functional.
+
+Usage
+-----
+When you are in the main directory ("performance_assessor/"), you can launch:
+
+```sh
+    # Execute this command line in a conda environment.
+    $ pytest
+```
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [O]
+import os
+from os.path import basename, dirname
+
+# [P]
+import pytest
+
+# [S]
+import src.perfassess as perfassess
+from src.perfassess.class_performance_assessor import PerformanceAssessor
+
+
+def __stage(size: int) -> list:
+    """A stage of a bigger function, to profile.
+
+    Parameters
+    ----------
+    size : `int`
+        The list size.
+
+    Returns
+    -------
+    `list`
+        A list of the given size.
+    """
+    return [0] * size
+
+
+def __get_row(assessor: PerformanceAssessor, name: str) -> list:
+    """Get the time evaluation row of a function.
+
+    Parameters
+    ----------
+    assessor : `PerformanceAssessor`
+        The assessor to read.
+
+    name : `str`
+        The function name.
+
+    Returns
+    -------
+    `list`
+        The numerical data of the function.
+    """
+    data: dict = assessor.data()["time_evaluation"]
+
+    return [row for label, row in zip(data["label"], data["data"])
+            if label.endswith(f"({name})")][0]
+
+
+def test_profile_block():
+    """Test if many profiled blocks accumulate into one assessor."""
+    assessor: PerformanceAssessor = perfassess.get_assessor(reset=True)
+
+    for _ in range(3):
+        with perfassess.profile() as block_assessor:
+            __stage(size=100_000)
+
+    assert block_assessor is assessor
+    assert __get_row(assessor=assessor, name="__stage")[0] == 3
+    assert set(assessor.data()) >= {"time_evaluation", "memory_evaluation"}
+
+
+def test_profiled():
+    """Test if every call of a decorated function, even nested, is profiled
+    once into the given assessor.
+    """
+    assessor: PerformanceAssessor = PerformanceAssessor(main=None)
+
+    @perfassess.profiled(assessor=assessor, do_memory=False)
+    def inner(value: int) -> int:
+        return value + 1
+
+    @perfassess.profiled(assessor=assessor, do_memory=False)
+    def outer(value: int) -> int:
+        return inner(value=value) + inner(value=value)
+
+    outer(value=3)
+    outer(value=1)
+
+    assert outer(value=0) == 2
+    assert __get_row(assessor=assessor, name="outer")[0] == 3
+    assert __get_row(assessor=assessor, name="inner")[0] == 6
+    assert "memory_evaluation" not in assessor.data()
+
+
+def test_profiled_own_code():
+    """Test if the profiler own code is not in the evaluations of a decorated
+    function.
+    """
+    assessor: PerformanceAssessor = PerformanceAssessor(main=None)
+    own_file: set = set(os.listdir(dirname(perfassess.__file__)))
+
+    @perfassess.profiled(assessor=assessor)
+    def stage() -> list:
+        return __stage(size=100_000)
+
+    for _ in range(3):
+        stage()
+
+    data: dict = assessor.data()
+
+    for name in ["time_evaluation", "memory_evaluation"]:
+        assert len(data[name]["label"]) > 0
+        assert not {basename(label.split(":")[0])
+                    for label in data[name]["label"]} & own_file
+
+
+def test_profile_error():
+    """Test if the profiling stops when the block raises an error, keeping the
+    assessor usable.
+    """
+    assessor: PerformanceAssessor = PerformanceAssessor(main=None)
+
+    with pytest.raises(ZeroDivisionError):
+        with perfassess.profile(assessor=assessor):
+            _ = 1 / 0
+
+    with perfassess.profile(assessor=assessor):
+        __stage(size=10)
+
+    assert __get_row(assessor=assessor, name="__stage")[0] == 1
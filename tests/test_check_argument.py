@@ -37,7 +37,9 @@ class ArgumentParserSimulator:
         n_field: int,
         package: str,
         subpackage: str,
-        argument: str
+        argument: str,
+        import_profiling: bool = False,
+        line: list = None
     ):
         """Simulate the creation of parsed arguments.
 
@@ -63,6 +65,12 @@ class ArgumentParserSimulator:
 
         argument : `str`
             A YAML file path.
+
+        import_profiling : `bool`, optional
+            Assess the importations. By default False.
+
+        line : `list`, optional
+            Functions to time line by line. By default None.
         """
         self.script: str = script
         self.output: str = output
@@ -71,6 +79,8 @@ class ArgumentParserSimulator:
         self.package: str = package
         self.subpackage: str = subpackage
         self.argument: str = argument
+        self.import_profiling: bool = import_profiling
+        self.line: list = line
 
     def redefine_parameter(self, **kwargs):
         """Give multiple parameters to redefine them.
@@ -95,6 +105,10 @@ class ArgumentParserSimulator:
                 self.subpackage = value
             elif key == "argument":
                 self.argument = value
+            elif key == "import_profiling":
+                self.import_profiling = value
+            elif key == "line":
+                self.line = value
             else:
                 raise KeyError("[Err##] Wrong key given.")
 
@@ -199,7 +213,9 @@ def test_value_error(__argument: dataclass, parameter: dict):
 @pytest.mark.parametrize(
     "parameter",
     [
-        {"function": "none"}
+        {"function": "none"},
+        {"line": ["none"]},
+        {"line": ["main.none"]}
     ]
 )
 def test_module_error(__argument: dataclass, parameter: dict):
@@ -218,3 +234,27 @@ def test_module_error(__argument: dataclass, parameter: dict):
     # Test the error.
     with pytest.raises(ValueError):
         check_argument(__argument)
+
+
+def test_import_profiling(__argument: dataclass):
+    """Test if the importations of the script are assessed.
+
+    Parameters
+    ----------
+    __argument : `dataclass`
+        The class that simulates input argument.
+    """
+    __argument.redefine_parameter(
+        script="src/perfassess/testor.py",
+        function="testor",
+        package=None,
+        subpackage=None,
+        import_profiling=True
+    )
+
+    argument = check_argument(__argument)
+    evaluation: dict = argument.import_profiling
+
+    assert "testor" in evaluation["label"]
+    assert evaluation["data"].shape == (len(evaluation["label"]), 5)
+    assert (evaluation["data"][:, 1] >= evaluation["data"][:, 0]).all()
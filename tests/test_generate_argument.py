@@ -0,0 +1,131 @@
+r"""Test if "src/perfassess/parse_argument/generate_argument.py" is functional.
+
+Usage
+-----
+When you are in the main directory ("performance_assessor/"), you can launch:
+
+```sh
+    # Execute this command line in a conda environment.
+    $ pytest
+```
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [N]
+import numpy as np
+# [P]
+import pytest
+
+# [C]
+from src.perfassess.parse_argument.check_argument import load_argument
+# [G]
+from src.perfassess.parse_argument.generate_argument import generate_argument
+
+
+def test_generate_argument():
+    """Test if generators are replaced by their values, recursively."""
+    argument: dict = generate_argument({
+        "array": {"$generator": "random", "shape": [4, 2], "dtype": "int32",
+                  "low": 0, "high": 10, "seed": 1},
+        "nested": [{"$generator": "range", "stop": 3}],
+        "text": {"$generator": "repeat", "value": "ab", "count": 3},
+        "factory": {"$generator": "factory", "module": "math",
+                    "function": "hypot", "argument": {}},
+        "literal": {"key": 1}
+    })
+
+    assert argument["array"].shape == (4, 2)
+    assert argument["array"].dtype == np.int32
+    assert argument["nested"] == [[0, 1, 2]]
+    assert argument["text"] == "ababab"
+    assert argument["factory"] == 0
+    assert argument["literal"] == {"key": 1}
+
+    # Same seed, same values.
+    assert (generate_argument({"$generator": "random", "shape": [3],
+                               "seed": 7})
+            == generate_argument({"$generator": "random", "shape": [3],
+                                  "seed": 7})).all()
+
+
+@pytest.mark.parametrize(
+    "argument",
+    [
+        {"$generator": "none"},
+        {"$generator": "range"},
+        {"$generator": "factory", "function": "main"}
+    ]
+)
+def test_generator_error(argument: dict):
+    """Test if an error is thrown when a generator is wrong.
+
+    Parameters
+    ----------
+    argument : `dict`
+        The wrong generator.
+    """
+    with pytest.raises(ValueError):
+        generate_argument(argument)
+
+
+def test_fixture(tmp_path: object):
+    """Test if fixtures are memory-mapped and cached.
+
+    Parameters
+    ----------
+    tmp_path : `Path`
+        A temporary directory, given by pytest.
+    """
+    np.save(tmp_path / "array.npy", np.arange(10))
+    np.arange(6, dtype=np.int16).tofile(tmp_path / "array.bin")
+
+    fixture: dict = {"$generator": "fixture", "path": str(tmp_path / "array.npy")}
+    array: np.ndarray = generate_argument(fixture)
+
+    assert isinstance(array, np.memmap)
+    assert generate_argument(fixture) is array
+
+    raw: np.ndarray = generate_argument({
+        "$generator": "fixture",
+        "path": str(tmp_path / "array.bin"),
+        "dtype": "int16",
+        "shape": [2, 3]
+    })
+
+    assert raw.shape == (2, 3)
+    assert raw[1, 2] == 5
+
+    with pytest.raises(ValueError):
+        generate_argument({"$generator": "fixture",
+                           "path": str(tmp_path / "array.bin")})
+
+
+def test_relative_file(tmp_path: object, monkeypatch: pytest.MonkeyPatch):
+    """Test if generator files are relative to the argument file, not to the
+    current directory.
+
+    Parameters
+    ----------
+    tmp_path : `Path`
+        A temporary directory, given by pytest.
+
+    monkeypatch : `pytest.MonkeyPatch`
+        To launch from another directory.
+    """
+    data: object = tmp_path / "data"
+    data.mkdir()
+    np.save(data / "array.npy", np.arange(4))
+    (data / "factory.py").write_text("def build():\n    return 3\n")
+    (data / "argument.yml").write_text(
+        "array: {$generator: fixture, path: array.npy}\n"
+        "value: {$generator: factory, script: factory.py, function: build}\n"
+    )
+    monkeypatch.chdir(tmp_path)
+
+    argument: dict = load_argument(path="data/argument.yml")
+
+    assert argument["array"].tolist() == [0, 1, 2, 3]
+    assert argument["value"] == 3
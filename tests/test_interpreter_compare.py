@@ -0,0 +1,122 @@
+r"""Test if "src/perfassess/interpreter_compare.py" is functional.
+
+Usage
+-----
+When you are in the main directory ("performance_assessor/"), you can launch:
+
+```sh
+    # Execute this command line in a conda environment.
+    $ pytest
+```
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [A]
+from argparse import Namespace
+# [S]
+import sys
+
+# [N]
+import numpy as np
+# [P]
+import pytest
+
+# [I]
+from src.perfassess.interpreter_compare import (compare_result, main,
+                                                strip_option)
+# [R]
+from src.perfassess.result_io import load_result
+
+
+def __function_data(cumtime: list, size: list) -> dict:
+    """Build the data of a run, with a function evaluation.
+
+    Parameters
+    ----------
+    cumtime : `list`
+        The cumulative time of each function.
+
+    size : `list`
+        The allocated memory of each function.
+
+    Returns
+    -------
+    `dict`
+        The computed data.
+    """
+    return {"function_evaluation": {
+        "head": np.array(["ncalls", "tottime (s)", "cumtime (s)",
+                          "size (Kib)", "allocations",
+                          "filename:lineno(function)"]),
+        "label": np.array([f"script.py:{i}(f_{i})"
+                           for i in range(len(cumtime))]),
+        "data": np.array([[1] * len(cumtime), cumtime, cumtime, size,
+                          [1] * len(cumtime)], dtype=float).T
+    }}
+
+
+def test_strip_option():
+    """Test if options and their values are removed."""
+    argv: list = ["-s", "a.py", "--python", "python3.10", "python3.12",
+                  "-o", "out/", "--output=out/", "--n_field", "1"]
+
+    argv = strip_option(argv=argv, option=("--python",))
+
+    assert argv == ["-s", "a.py", "-o", "out/", "--output=out/",
+                    "--n_field", "1"]
+    assert strip_option(argv=argv, option=("-o", "--output"), n_value=1) == \
+        ["-s", "a.py", "--n_field", "1"]
+
+
+def test_compare_result():
+    """Test if functions are compared with the first interpreter."""
+    compared: dict = compare_result(result={
+        "cpython-3.10.0": __function_data(cumtime=[2, 1], size=[10, 5]),
+        "cpython-3.12.0": __function_data(cumtime=[1], size=[20])
+    })
+    evaluation: dict = compared["interpreter_evaluation"]
+    summary: dict = compared["interpreter_summary"]
+
+    assert list(evaluation["head"]) == [
+        "cumtime cpython-3.10.0 (s)", "cumtime cpython-3.12.0 (s)",
+        "size cpython-3.10.0 (Kib)", "size cpython-3.12.0 (Kib)",
+        "speedup cpython-3.12.0", "filename:lineno(function)"
+    ]
+    assert list(evaluation["data"][0]) == [2, 1, 10, 20, 2]
+    # Missing for the second interpreter.
+    assert np.isnan(evaluation["data"][1, [1, 3, 4]]).all()
+    assert list(summary["label"]) == ["cpython-3.10.0", "cpython-3.12.0"]
+    assert summary["data"][:, 2] == pytest.approx([1, 3])
+
+
+def test_main(tmp_path: object):
+    """Test if the target is profiled by each interpreter, in subprocesses.
+
+    Parameters
+    ----------
+    tmp_path : `Path`
+        A temporary directory, given by pytest.
+    """
+    argv: list = ["-s", "src/perfassess/testor.py", "-f", "testor", "-a",
+                  "data/argument.yml", "-o", str(tmp_path), "--python",
+                  sys.executable, sys.executable]
+
+    assert main(argument=Namespace(output=str(tmp_path),
+                                   python=[sys.executable] * 2),
+                argv=argv) == 0
+
+    data: dict = load_result(path=str(tmp_path / "interpreter_result.json"))
+    label: np.array = data["interpreter_summary"]["label"]
+
+    # The same interpreter twice has two names.
+    assert len(set(label)) == 2
+    assert (tmp_path / label[0] / "time_evaluation.html").exists()
+    assert any("testor" in label_i
+               for label_i in data["interpreter_evaluation"]["label"])
+
+    with pytest.raises(FileNotFoundError):
+        main(argument=Namespace(output=str(tmp_path / "no"),
+                                python=[sys.executable]), argv=[])
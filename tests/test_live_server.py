@@ -0,0 +1,94 @@
+r"""Test if "src/perfassess/live_server.py" is functional.
+
+Usage
+-----
+When you are in the main directory ("performance_assessor/"), you can launch:
+
+```sh
+    # Execute this command line in a conda environment.
+    $ pytest
+```
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [J]
+import json
+# [S]
+import socket
+# [U]
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+# [P]
+import pytest
+
+# [L]
+from src.perfassess.live_server import serve
+# [S]
+from src.perfassess.sampled_profiler import SampledProfiler
+
+
+def test_live_server():
+    """Test if the evaluations of a running sampler are served over HTTP."""
+    sampler: SampledProfiler = SampledProfiler(rate=1)
+    server: object = serve(source=sampler)
+    url: str = "http://{}:{}".format(*server.server_address)
+
+    try:
+        function = sampler(lambda: sum(range(100)))
+        function()
+
+        with urlopen(f"{url}/data.json") as answer:
+            data: dict = json.load(answer)
+
+        assert data["sample_evaluation"]["data"] == [[1, 1]]
+
+        # Still running: new calls are seen.
+        function()
+
+        with urlopen(f"{url}/data/sample_evaluation.json") as answer:
+            assert json.load(answer)["data"] == [[2, 2]]
+
+        with urlopen(f"{url}/") as answer:
+            assert b"time_evaluation" in answer.read()
+
+        with pytest.raises(HTTPError):
+            urlopen(f"{url}/unknown")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_live_server_socket(tmp_path: object):
+    """Test if the evaluations are served over a Unix socket.
+
+    Parameters
+    ----------
+    tmp_path : `Path`
+        A temporary directory, given by pytest.
+    """
+    sampler: SampledProfiler = SampledProfiler(rate=1)
+    socket_path: str = str(tmp_path / "perfassess.sock")
+    server: object = serve(source=sampler, socket_path=socket_path)
+
+    try:
+        with socket.socket(socket.AF_UNIX) as client:
+            client.connect(socket_path)
+            client.sendall(b"GET /data.json HTTP/1.0\r\n\r\n")
+            answer: bytes = b""
+
+            while chunk := client.recv(4096):
+                answer += chunk
+
+        head, _, body = answer.partition(b"\r\n\r\n")
+
+        assert b" 200 " in head.split(b"\r\n")[0]
+        assert "time_evaluation" in json.loads(body)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert not (tmp_path / "perfassess.sock").exists()
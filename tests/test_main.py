@@ -14,11 +14,26 @@ __authors__ = ["Lucas ROUAUD"]
 __contact__ = ["lucas.rouaud@gmail.com"]
 __copyright__ = "MIT License"
 
+# [G]
+import gc
+# [J]
+import json
+# [T]
+from time import sleep
+import tracemalloc
+
+# [N]
+import numpy as np
 # [P]
 import pytest
 
 # [P]
-from src.perfassess.main import PerformanceAssessor
+from src.perfassess.class_performance_assessor import PerformanceAssessor
+from src.perfassess.code_filter import CodeFilter
+from src.perfassess.function_table import function_at
+from src.perfassess.gc_monitor import count_object
+from src.perfassess.memory_sampler import MemorySampler
+from src.perfassess.monitoring import HAS_MONITORING
 
 
 # =========================================
@@ -84,3 +99,569 @@ def test_launch_no_profiling(__assessor: PerformanceAssessor):
     """
     with pytest.raises(ValueError):
         __assessor.launch_profiling(do_memory=False, do_time=False)
+
+
+@pytest.mark.parametrize("gc_mode", ["enable", "disable", "freeze"])
+def test_launch_gc(gc_mode: str):
+    """Test if garbage collections are recorded, and if the garbage collector
+    state is given back.
+
+    Parameters
+    ----------
+    gc_mode : `str`
+        The garbage collector state during the measure.
+    """
+    performance_assessor: PerformanceAssessor = PerformanceAssessor(
+        main=lambda: [[[]] for _ in range(100_000)],
+        n_field=1
+    )
+
+    performance_assessor.launch_profiling(do_gc=True, gc_mode=gc_mode)
+    data: dict = performance_assessor.data()
+
+    assert gc.isenabled()
+    assert data["gc_evaluation"]["data"].shape == (3, 5)
+    assert (data["gc_evaluation"]["data"][:, 0].sum() > 0) == \
+        (gc_mode != "disable")
+
+
+class __Node:
+    """An object created many times."""
+
+
+def test_launch_object():
+    """Test if live objects are counted by type, and allocations by site."""
+    keep: list = []
+    performance_assessor: PerformanceAssessor = PerformanceAssessor(
+        main=lambda: keep.extend(__Node() for _ in range(10_000))
+    )
+
+    performance_assessor.launch_profiling(do_object=True, gc_mode="freeze")
+    data: dict = performance_assessor.data()
+    count: dict = dict(zip(data["object_evaluation"]["label"],
+                           data["object_evaluation"]["data"]))
+    node: str = f"{__name__}.__Node"
+
+    assert data["object_evaluation"]["label"][0] == node
+    assert count[node].tolist() == [10_000, 0, 10_000]
+    assert list(data["memory_evaluation"]["head"]) == [
+        "size (Kib)", "python size (Kib)", "numpy size (Kib)", "allocations",
+        "average size (b)", "function"
+    ]
+    # The size of a site is its number of allocations times their size.
+    assert np.all(data["memory_evaluation"]["data"][:, 3] >= 1)
+    assert data["memory_evaluation"]["data"][:, 0] * 1024 == pytest.approx(
+        np.prod(data["memory_evaluation"]["data"][:, 3:], axis=1)
+    )
+
+
+def __same_name() -> type:
+    """A function defining a new class, with the same name at each call.
+
+    Returns
+    -------
+    `type`
+        The defined class.
+    """
+    class Node:
+        """An object with the same name as other ones."""
+
+    return Node
+
+
+def test_count_object():
+    """Test if types with the same name are added up, and unreachable
+    cycles not counted.
+    """
+    node: str = f"{__name__}.__same_name.<locals>.Node"
+    before: int = count_object()[node]
+    keep: list = [kind() for kind in [__same_name(), __same_name()]]
+    cycle: list = [__same_name()() for _ in range(100)]
+
+    for node_i in cycle:
+        node_i.cycle = cycle
+
+    # Disabled, so that only the census collects the cycle.
+    gc.disable()
+
+    try:
+        del cycle, node_i
+        assert count_object()[node] - before == len(keep)
+    finally:
+        gc.enable()
+
+
+def __array_and_list() -> list:
+    """A function allocating a NumPy buffer and python objects.
+
+    Returns
+    -------
+    `list`
+        Both, kept alive until the snapshot.
+    """
+    return [np.ones(100_000), [[] for _ in range(1_000)]]
+
+
+@pytest.mark.parametrize("include", [None, ["*/test_main.py"]])
+def test_memory_domain(include: list):
+    """Test if NumPy data buffers are told apart from the python heap.
+
+    Parameters
+    ----------
+    include : `list`
+        The kept code.
+    """
+    keep: list = []
+    performance_assessor: PerformanceAssessor = PerformanceAssessor(
+        main=lambda: keep.append(__array_and_list())
+    )
+
+    performance_assessor.launch_profiling(include=include)
+    data: dict = performance_assessor.data()
+    domain: dict = dict(zip(data["memory_domain"]["label"],
+                            data["memory_domain"]["data"][:, 0]))
+    memory: np.array = data["memory_evaluation"]["data"]
+
+    # 100 000 float64.
+    assert domain["numpy data"] == pytest.approx(781.25, rel=0.01)
+    assert domain["python heap"] > 0
+    assert np.sum(memory[:, 2]) == pytest.approx(781.25, rel=0.01)
+    assert memory[:, 0] == pytest.approx(memory[:, 1] + memory[:, 2])
+
+
+def test_launch_wrong_gc_mode(__assessor: PerformanceAssessor):
+    """Test if an error is thrown when a wrong garbage collector mode is
+    given.
+
+    Parameters
+    ----------
+    __assessor : `PerformanceAssessor`
+        The class to test.
+    """
+    with pytest.raises(ValueError):
+        __assessor.launch_profiling(gc_mode="none")
+
+
+def test_launch_line():
+    """Test if lines of chosen functions are timed."""
+    def __square_sum(value: int) -> int:
+        total: int = 0
+
+        for value_i in range(value):
+            total += value_i ** 2
+
+        return total
+
+    performance_assessor: PerformanceAssessor = PerformanceAssessor(
+        main=__square_sum,
+        value=100
+    )
+
+    performance_assessor.launch_profiling(line_function=[__square_sum])
+    data: dict = performance_assessor.data()
+
+    hit: dict = dict(zip(data["line_evaluation"]["label"],
+                         data["line_evaluation"]["data"][:, 1]))
+
+    assert sorted(hit.values()) == [1, 1, 100, 101]
+    assert len(data["line_source"]["label"]) == 7
+
+
+def __recursive(value: int) -> int:
+    """A recursive function to profile.
+
+    Parameters
+    ----------
+    value : `int`
+        The recursion depth.
+
+    Returns
+    -------
+    `int`
+        The sum of values until 0.
+    """
+    if value == 0:
+        return sorted([0])[0]
+
+    return value + __recursive(value - 1)
+
+
+def __nested_sleep(depth: int):
+    """A recursive function, sleeping at the end of the recursion.
+
+    Parameters
+    ----------
+    depth : `int`
+        The recursion depth.
+    """
+    if depth == 0:
+        sleep(0.05)
+    else:
+        __nested_sleep(depth - 1)
+
+
+def test_line_recursive():
+    """Test if the lines of a recursive function are timed once, by its
+    innermost call.
+    """
+    performance_assessor: PerformanceAssessor = PerformanceAssessor(
+        main=__nested_sleep,
+        depth=10
+    )
+
+    performance_assessor.launch_profiling(line_function=[__nested_sleep],
+                                          do_memory=False)
+    data: dict = performance_assessor.data()["line_evaluation"]
+
+    # Not the sleep added to each outer call.
+    assert 0.05 <= np.sum(data["data"][:, 0]) < 0.1
+
+
+@pytest.mark.parametrize("time_backend", ["cprofile", "monitoring"])
+def test_launch_time_backend(time_backend: str):
+    """Test if every time backend gives the same table.
+
+    Parameters
+    ----------
+    time_backend : `str`
+        The time profiler.
+    """
+    performance_assessor: PerformanceAssessor = PerformanceAssessor(
+        main=__recursive,
+        value=10
+    )
+
+    if time_backend == "monitoring" and not HAS_MONITORING:
+        with pytest.warns(RuntimeWarning):
+            performance_assessor.launch_profiling(time_backend=time_backend,
+                                                  do_memory=False)
+    else:
+        performance_assessor.launch_profiling(time_backend=time_backend,
+                                              do_memory=False)
+
+    data: dict = performance_assessor.data()["time_evaluation"]
+
+    assert list(data["head"]) == ["ncalls", "tottime (s)", "percall (s)",
+                                  "cumtime (s)", "percall (s)",
+                                  "filename:lineno(function)"]
+    assert data["data"].shape[1] == 5
+
+
+@pytest.mark.skipif(not HAS_MONITORING, reason="Needs sys.monitoring.")
+def test_monitoring_filter():
+    """Test if filtered code is removed from the monitoring profiler."""
+    performance_assessor: PerformanceAssessor = PerformanceAssessor(
+        main=__recursive,
+        value=10
+    )
+
+    performance_assessor.launch_profiling(time_backend="monitoring",
+                                          do_memory=False,
+                                          include=["*/test_main.py"])
+    data: dict = performance_assessor.data()["time_evaluation"]
+    row: dict = dict(zip(data["label"], data["data"]))
+
+    assert len(row) == 1
+    assert row[next(iter(row))][0] == 11
+
+    # Code filtered by a run is still profiled by the next ones.
+    performance_assessor.launch_profiling(time_backend="monitoring",
+                                          do_memory=False,
+                                          include=["*/src/*"])
+    performance_assessor.launch_profiling(time_backend="monitoring",
+                                          do_memory=False,
+                                          include=["*/test_main.py"])
+
+    assert len(performance_assessor.data()["time_evaluation"]["label"]) == 1
+
+
+def __waiter():
+    """A generator waiting when an exception is thrown into it.
+
+    Yields
+    ------
+    `None`
+        Once, before the exception.
+    """
+    try:
+        yield
+    except ValueError:
+        sleep(0.05)
+
+
+def __thrower():
+    """Throw an exception into a generator."""
+    generator: object = __waiter()
+    next(generator)
+
+    try:
+        generator.throw(ValueError)
+    except StopIteration:
+        pass
+
+
+@pytest.mark.skipif(not HAS_MONITORING, reason="Needs sys.monitoring.")
+def test_monitoring_throw():
+    """Test if a generator resumed by an exception gets its own time."""
+    performance_assessor: PerformanceAssessor = PerformanceAssessor(
+        main=__thrower
+    )
+
+    performance_assessor.launch_profiling(time_backend="monitoring",
+                                          do_memory=False,
+                                          include=["*/test_main.py"])
+    data: dict = performance_assessor.data()["time_evaluation"]
+    row: dict = {label.split("(")[-1][:-1]: value
+                 for label, value in zip(data["label"], data["data"])}
+
+    assert row["__waiter"][1] >= 0.04
+    assert row["__thrower"][1] < 0.04
+
+
+def test_line_throw():
+    """Test if the lines run after an exception is thrown into a generator
+    are timed.
+    """
+    performance_assessor: PerformanceAssessor = PerformanceAssessor(
+        main=__thrower
+    )
+
+    performance_assessor.launch_profiling(line_function=[__waiter],
+                                          do_memory=False)
+    data: dict = performance_assessor.data()["line_evaluation"]
+    row: dict = {label.split(":")[1].split("(")[0]: value
+                 for label, value in zip(data["label"], data["data"])}
+    # The "sleep()" line.
+    line: str = str(__waiter.__code__.co_firstlineno + 11)
+
+    assert row[line][1] == 1
+    assert row[line][0] >= 0.04
+
+
+def test_code_filter():
+    """Test if module names and path globs are matched."""
+    code_filter: CodeFilter = CodeFilter(include=["numpy", "*/src/*"],
+                                         exclude=["numpy.linalg"])
+
+    assert code_filter.match("/lib/site-packages/numpy/core/numeric.py")
+    assert code_filter.match("/home/user/src/script.py")
+    assert not code_filter.match("/lib/site-packages/numpy/linalg/linalg.py")
+    assert not code_filter.match("/usr/lib/python3.11/json/decoder.py")
+    assert not CodeFilter()
+
+
+__KEEP: list = []
+
+
+def __encode(size: int):
+    """Keep a JSON string, made by the standard library.
+
+    Parameters
+    ----------
+    size : `int`
+        The number of encoded integers.
+    """
+    __KEEP.append(json.dumps(list(range(size))))
+
+
+def test_cprofile_filter_folding():
+    """Test if filtered code time and memory go to their kept callers."""
+    performance_assessor: PerformanceAssessor = PerformanceAssessor(
+        main=__encode,
+        size=20_000
+    )
+
+    performance_assessor.launch_profiling(include=["*/test_main.py"])
+    data: dict = performance_assessor.data()
+    time: dict = dict(zip(data["time_evaluation"]["label"],
+                          data["time_evaluation"]["data"]))
+    memory: np.array = data["memory_evaluation"]["label"]
+
+    assert len(time) == 1
+    assert next(iter(time)).endswith("(__encode)")
+    # "tottime" includes the time of "json", folded into the caller.
+    assert next(iter(time.values()))[1] == \
+        pytest.approx(next(iter(time.values()))[3], rel=0.05)
+    assert all("test_main.py:" in label for label in memory)
+    assert np.sum(data["memory_evaluation"]["data"][:, 0]) >= 100
+
+    __KEEP.clear()
+
+
+def test_code_filter_fold_stats():
+    """Test if the time of filtered functions is shared between callers."""
+    kept_a: tuple = ("/src/a.py", 1, "a")
+    kept_b: tuple = ("/src/b.py", 1, "b")
+    lib: tuple = ("/lib/json.py", 1, "dumps")
+    deep: tuple = ("/lib/json.py", 9, "encode")
+
+    folded: dict = CodeFilter(include=["*/src/*"]).fold_stats(stats={
+        kept_a: (1, 1, 1.0, 5.0, {}),
+        kept_b: (1, 1, 1.0, 3.0, {}),
+        lib: (3, 3, 2.0, 6.0, {kept_a: (2, 2, 1.5, 4.5),
+                               kept_b: (1, 1, 0.5, 1.5)}),
+        deep: (3, 3, 4.0, 4.0, {lib: (3, 3, 4.0, 4.0)})
+    })
+
+    assert set(folded) == {kept_a, kept_b}
+    assert folded[kept_a][2] == pytest.approx(1 + 6 * 0.75)
+    assert folded[kept_b][2] == pytest.approx(1 + 6 * 0.25)
+    assert folded[kept_a][3] == 5.0
+
+
+@pytest.mark.parametrize("include", [None, ["*/test_main.py"]])
+def test_function_evaluation(include: list):
+    """Test if time and memory are joined by function."""
+    performance_assessor: PerformanceAssessor = PerformanceAssessor(
+        main=__encode,
+        size=20_000
+    )
+
+    performance_assessor.launch_profiling(include=include)
+    data: dict = performance_assessor.data()["function_evaluation"]
+    row: dict = dict(zip(data["label"], data["data"]))
+    encode: np.array = next(value for label, value in row.items()
+                            if label.endswith("(__encode)"))
+
+    assert list(data["head"]) == ["ncalls", "tottime (s)", "cumtime (s)",
+                                  "size (Kib)", "allocations",
+                                  "filename:lineno(function)"]
+    assert encode[0] == 1
+
+    if include is None:
+        # The string is allocated by "json".
+        assert any(label.startswith("encoder.py") and value[3] >= 100
+                   for label, value in row.items())
+    else:
+        assert encode[3] >= 100
+        assert encode[4] >= 1
+
+    __KEEP.clear()
+
+
+def test_function_at():
+    """Test if lines are mapped to their innermost function."""
+    line: int = __encode.__code__.co_firstlineno
+
+    assert function_at(filename=__file__, lineno=line + 8) == \
+        (__file__, line, "__encode")
+    assert function_at(filename=__file__, lineno=line)[2] == "<module>"
+    assert function_at(filename="/no/file.py", lineno=1) is None
+
+
+def test_launch_resource():
+    """Test if the operating system resources of a run are computed."""
+    performance_assessor: PerformanceAssessor = PerformanceAssessor(
+        main=lambda: bytearray(50 * 1024 * 1024)
+    )
+
+    performance_assessor.launch_profiling(do_time=False)
+    data: dict = performance_assessor.data()["resource_evaluation"]
+    row: dict = dict(zip(data["head"], data["data"][0]))
+
+    assert data["data"].shape == (1, len(data["head"]) - 1)
+    assert row["wall time (s)"] > 0
+    assert row["traced peak (Kib)"] >= 50 * 1024
+
+
+def __allocate(size: int) -> bytearray:
+    """Allocate memory, then wait a bit to be sampled.
+
+    Parameters
+    ----------
+    size : `int`
+        The number of bytes to allocate.
+
+    Returns
+    -------
+    `bytearray`
+        The allocated memory.
+    """
+    memory: bytearray = bytearray(size)
+    sleep(0.05)
+
+    return memory
+
+
+def __phased():
+    """A function with two phases, for the memory sampler."""
+    memory: bytearray = __allocate(size=10 * 1024 * 1024)
+    del memory
+    __allocate(size=1024)
+
+
+def test_launch_sample():
+    """Test if memory is sampled over time, with the running phase."""
+    performance_assessor: PerformanceAssessor = PerformanceAssessor(
+        main=__phased
+    )
+
+    performance_assessor.launch_profiling(do_time=False,
+                                          sample_interval=0.005)
+    data: dict = performance_assessor.data()["memory_timeline"]
+    during: np.array = data["data"][data["label"] == "__allocate"]
+
+    assert data["data"].shape[1] == 3
+    assert list(data["label"][[0, -1]]) == ["outside", "outside"]
+    assert np.max(during[:, 1]) >= 10 * 1024
+    assert np.all(np.diff(data["data"][:, 0]) >= 0)
+
+    with pytest.raises(ValueError):
+        performance_assessor.launch_profiling(sample_interval=0)
+
+
+def test_launch_start_error(monkeypatch: pytest.MonkeyPatch):
+    """Test if the started evaluations are stopped when a later one cannot
+    start.
+
+    Parameters
+    ----------
+    monkeypatch : `pytest.MonkeyPatch`
+        To make the memory sampler fail.
+    """
+    def fail(_):
+        raise RuntimeError("Sampler failure.")
+
+    monkeypatch.setattr(MemorySampler, "start", fail)
+    performance_assessor: PerformanceAssessor = PerformanceAssessor(
+        main=__phased
+    )
+
+    with pytest.raises(RuntimeError, match="Sampler failure."):
+        performance_assessor.launch_profiling(gc_mode="freeze", do_gc=True,
+                                              sample_interval=0.005)
+
+    assert not tracemalloc.is_tracing()
+    assert gc.isenabled()
+    assert gc.get_freeze_count() == 0
+    assert not gc.callbacks
+
+
+__LEAK: list = []
+__CACHE: dict = {}
+
+
+def __leaky():
+    """A function filling a cache once, and leaking at each call."""
+    __CACHE.setdefault("cache", [0] * 10_000)
+    __LEAK.append(bytearray(4096))
+    _ = [0] * 10_000
+
+
+def test_launch_leak_detection():
+    """Test if only steadily growing sites are flagged as leaks."""
+    performance_assessor: PerformanceAssessor = PerformanceAssessor(
+        main=__leaky
+    )
+
+    performance_assessor.launch_leak_detection(n_call=8)
+    data: dict = performance_assessor.data()
+    leak: np.array = data["leak_traceback"]["label"]
+
+    assert len(leak) == 1
+    assert "test_main.py" in leak[0]
+    assert data["leak_traceback"]["data"][0, 0] == pytest.approx(4, rel=0.1)
+    assert data["leak_timeline"]["data"].shape == (8, 2)
+
+    with pytest.raises(ValueError):
+        performance_assessor.launch_leak_detection(n_call=2)
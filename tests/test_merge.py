@@ -0,0 +1,184 @@
+r"""Test if "src/perfassess/merge.py" is functional.
+
+Usage
+-----
+When you are in the main directory ("performance_assessor/"), you can launch:
+
+```sh
+    # Execute this command line in a conda environment.
+    $ pytest
+```
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [A]
+from argparse import Namespace
+
+# [N]
+import numpy as np
+# [P]
+import pytest
+
+# [M]
+from src.perfassess.merge import main, merge_result
+# [R]
+from src.perfassess.result_io import load_result, save_result
+
+
+@pytest.fixture
+def __result_dir(tmp_path: object) -> object:
+    """Write the results of three hosts, with different paths.
+
+    Parameters
+    ----------
+    tmp_path : `Path`
+        A temporary directory, given by pytest.
+
+    Returns
+    -------
+    `Path`
+        The directory containing the results.
+    """
+    result_dir: object = tmp_path / "result"
+    result_dir.mkdir()
+
+    for i, size in enumerate([[1, 2], [3, 4], [5]]):
+        label: list = [f"/node_{i}/src/script.py:{j}"
+                       for j in range(len(size))]
+
+        save_result(path=str(result_dir / f"node_{i}.json"), data={
+            "memory_evaluation": {
+                "head": np.array(["size (Kib)", "function"]),
+                "label": np.array(label),
+                "data": np.array([size], dtype=float).T
+            },
+            "time_evaluation": {
+                "head": np.array(["ncalls", "tottime (s)", "percall (s)",
+                                  "cumtime (s)", "percall (s)",
+                                  "filename:lineno(function)"]),
+                "label": np.array(["script.py:1(main)"]),
+                "data": np.array([[i + 1, 1, 1 / (i + 1), 2, 2 / (i + 1)]],
+                                 dtype=float)
+            },
+            "memory_timeline": {
+                "head": np.array(["time (s)", "traced (Kib)", "rss (Kib)",
+                                  "phase"]),
+                "label": np.array(["main"]),
+                "data": np.array([[0, 1, 1]], dtype=float)
+            }
+        })
+
+    return result_dir
+
+
+def test_merge_sum(__result_dir: object):
+    """Test if results are aligned by trimmed names, then summed.
+
+    Parameters
+    ----------
+    __result_dir : `Path`
+        The directory containing the results.
+    """
+    merged: dict = merge_result(path_list=[str(__result_dir)], n_field=2)
+    memory: dict = dict(zip(merged["memory_evaluation"]["label"],
+                            merged["memory_evaluation"]["data"][:, 0]))
+    spread: np.array = merged["memory_evaluation_spread"]["data"]
+
+    assert memory == {"src/script.py:0": 9, "src/script.py:1": 6}
+    assert spread[0].tolist() == [1, 5, 2, 3]
+    assert spread[1].tolist() == pytest.approx([2, 4, np.sqrt(2), 2])
+    # Per call values are computed again.
+    assert merged["time_evaluation"]["data"][0].tolist() == \
+        pytest.approx([6, 3, 0.5, 6, 1])
+    assert "memory_timeline" not in merged
+    assert merged["merge_evaluation"]["data"][:, 0].tolist() == [3, 3]
+
+
+def test_merge_mean(__result_dir: object, tmp_path: object):
+    """Test if results are averaged, and if the report is written.
+
+    Parameters
+    ----------
+    __result_dir : `Path`
+        The directory containing the results.
+
+    tmp_path : `Path`
+        A temporary directory, given by pytest.
+    """
+    main(argument=Namespace(result=[str(__result_dir)], output=str(tmp_path),
+                            n_field=2, mode="mean"))
+
+    merged: dict = load_result(path=str(tmp_path / "merge_result.json"))
+
+    assert merged["memory_evaluation"]["data"][:, 0].tolist() == [3, 3]
+    assert (tmp_path / "memory_evaluation_spread.html").exists()
+
+
+def test_merge_wrong_mode(__result_dir: object):
+    """Test if an error is thrown for a wrong mode.
+
+    Parameters
+    ----------
+    __result_dir : `Path`
+        The directory containing the results.
+    """
+    with pytest.raises(ValueError):
+        merge_result(path_list=[str(__result_dir)], mode="median")
+
+
+def test_merge_average_size(tmp_path: object):
+    """Test if the average allocation size is computed again after a sum.
+
+    Parameters
+    ----------
+    tmp_path : `Path`
+        A temporary directory, given by pytest.
+    """
+    for i, (size, count) in enumerate([(1, 1), (3, 7)]):
+        save_result(path=str(tmp_path / f"node_{i}.json"), data={
+            "memory_evaluation": {
+                "head": np.array(["size (Kib)", "allocations",
+                                  "average size (b)", "function"]),
+                "label": np.array(["script.py:1"]),
+                "data": np.array([[size, count, size * 1024 / count]])
+            }
+        })
+
+    merged: dict = merge_result(path_list=[str(tmp_path)])
+
+    assert merged["memory_evaluation"]["data"][0].tolist() == \
+        pytest.approx([4, 8, 512])
+
+
+def test_merge_reduction(tmp_path: object):
+    """Test if peaks are maximized and ratios averaged after a sum.
+
+    Parameters
+    ----------
+    tmp_path : `Path`
+        A temporary directory, given by pytest.
+    """
+    for i, (pause, ratio) in enumerate([(0.5, 1), (0.25, 3)]):
+        save_result(path=str(tmp_path / f"node_{i}.json"), data={
+            "gc_evaluation": {
+                "head": np.array(["collections", "max pause (s)",
+                                  "generation"]),
+                "label": np.array(["generation 0"]),
+                "data": np.array([[2, pause]])
+            },
+            "resource_evaluation": {
+                "head": np.array(["wall time (s)", "cpu / wall", "run"]),
+                "label": np.array(["run"]),
+                "data": np.array([[1, ratio]])
+            }
+        })
+
+    merged: dict = merge_result(path_list=[str(tmp_path)])
+
+    assert merged["gc_evaluation"]["data"][0].tolist() == \
+        pytest.approx([4, 0.5])
+    assert merged["resource_evaluation"]["data"][0].tolist() == \
+        pytest.approx([2, 2])
@@ -0,0 +1,79 @@
+r"""Test if "src/perfassess/noise.py" is functional.
+
+Usage
+-----
+When you are in the main directory ("performance_assessor/"), you can launch:
+
+```sh
+    # Execute this command line in a conda environment.
+    $ pytest
+```
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [O]
+import os
+
+# [N]
+import numpy as np
+# [P]
+import pytest
+
+# [C]
+from src.perfassess.class_performance_assessor import PerformanceAssessor
+# [N]
+from src.perfassess.noise import NoiseMonitor, calibrate, noise_score
+
+
+def test_noise_score():
+    """Test if the noise is the spread of the calibration times."""
+    time: np.array = calibrate(n_loop=5, size=1_000)
+
+    assert time.shape == (5,)
+    assert np.all(time > 0)
+    assert noise_score(time=np.array([1, 1, 1])) == 0
+    assert noise_score(time=np.array([1, 3])) == pytest.approx(50)
+
+
+@pytest.mark.skipif(not hasattr(os, "sched_setaffinity"),
+                    reason="CPU pinning needs os.sched_setaffinity().")
+def test_pinning():
+    """Test if the run is pinned, then the CPUs given back."""
+    previous: set = os.sched_getaffinity(0)
+    cpu: int = min(previous)
+    noise_monitor: NoiseMonitor = NoiseMonitor(cpu=[cpu])
+
+    noise_monitor.start()
+
+    assert os.sched_getaffinity(0) == {cpu}
+
+    noise_monitor.stop()
+
+    assert os.sched_getaffinity(0) == previous
+    assert noise_monitor.data()["data"][0, 7] == 1
+
+    with pytest.raises(ValueError):
+        NoiseMonitor(cpu=[max(previous) + 10_000]).start()
+
+    assert os.sched_getaffinity(0) == previous
+
+
+def test_max_noise():
+    """Test if a too noisy run is launched again, then a warning given."""
+    performance_assessor: PerformanceAssessor = PerformanceAssessor(
+        main=lambda: [[[]] for _ in range(1_000)]
+    )
+
+    with pytest.warns(RuntimeWarning, match="after 2 runs"):
+        performance_assessor.launch_profiling(max_noise=1e-9, n_retry=1)
+
+    data: dict = performance_assessor.data()["noise_evaluation"]
+
+    assert data["head"][-1] == "governor"
+    assert data["data"].shape == (1, 9)
+
+    with pytest.raises(ValueError):
+        performance_assessor.launch_profiling(n_retry=-1)
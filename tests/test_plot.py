@@ -0,0 +1,135 @@
+r"""Test if "src/perfassess/plot.py" is functional.
+
+Usage
+-----
+When you are in the main directory ("performance_assessor/"), you can launch:
+
+```sh
+    # Execute this command line in a conda environment.
+    $ pytest
+```
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [T]
+from time import perf_counter, sleep
+
+# [N]
+import numpy as np
+# [P]
+import plotly.graph_objects as go
+import pytest
+
+# [C]
+from src.perfassess.class_performance_assessor import PerformanceAssessor
+# [P]
+from src.perfassess import plot
+from src.perfassess.plot import (downsample, set_phase_timeline, set_plot,
+                                 set_timeline)
+
+
+def test_downsample():
+    """Test if extreme values are kept by the downsampling."""
+    value: np.array = np.sin(np.arange(100_000) / 100)
+    value[54_321] = 10
+    value[12_345] = -10
+
+    index: np.array = downsample(value=value, n_point=1_000)
+
+    assert len(index) <= 1_000
+    assert {0, 99_999, 54_321, 12_345} <= set(index)
+    assert np.all(np.diff(index) > 0)
+    assert len(downsample(value=value[:10], n_point=1_000)) == 10
+
+
+def test_large_plot():
+    """Test if large plots are drawn with WebGL, with fewer points."""
+    size: int = 100_000
+    data: np.array = np.array([np.arange(size), np.arange(size) % 7]).T
+
+    timeline: go.Figure = set_timeline(
+        head=np.array(["time (s)", "size (Kib)", "site"]),
+        label=np.array(["a", "b"] * (size // 2)),
+        data=data,
+        max_point=1_000
+    )
+    bar: go.Figure = set_plot(head=np.array(["size (Kib)", "function"]),
+                              label=np.arange(size).astype(str),
+                              data=data[:, :1].astype(float),
+                              max_point=1_000)
+
+    assert [type(trace) for trace in timeline.data] == [go.Scattergl] * 2
+    assert len(timeline.data[0].x) <= 1_000
+    assert timeline.data[1].meta == {"x": 0, "y": 1, "group": 1}
+    assert len(bar.data[0].x) == 1_000
+    assert bar.data[0].y[0] == size - 1
+
+
+def test_many_phase():
+    """Test if a timeline with thousands of phases is built quickly, and if
+    phases are merged above the maximal number of points.
+    """
+    size: int = 3_000
+    start: float = perf_counter()
+    timeline: go.Figure = set_phase_timeline(
+        head=np.array(["time (s)", "size (Kib)", "phase"]),
+        label=np.arange(size).astype(str),
+        data=np.array([np.arange(size), np.ones(size)], dtype=float).T
+    )
+
+    # Adding the phases one by one takes minutes.
+    assert perf_counter() - start < 10
+    # With the plot border.
+    assert len(timeline.layout.shapes) == size + 1
+    assert timeline.layout.annotations[-1].text == str(size - 1)
+
+    # Above the maximal number of phases, neighbouring ones are merged.
+    timeline = set_phase_timeline(
+        head=np.array(["time (s)", "size (Kib)", "phase"]),
+        label=np.arange(size).astype(str),
+        data=np.array([np.arange(size), np.ones(size)], dtype=float).T,
+        max_point=1_000
+    )
+
+    assert len(timeline.layout.shapes) == 1_000 + 1
+    assert timeline.layout.annotations[0].text == "0 (+2 phases)"
+    assert timeline.layout.shapes[-1].x1 == size - 1
+
+
+def __sampled():
+    """A function to sample for a while."""
+    sleep(0.1)
+
+
+def test_sidecar(tmp_path: object, monkeypatch: pytest.MonkeyPatch):
+    """Test if downsampled plots have their full data in a sidecar file.
+
+    Parameters
+    ----------
+    tmp_path : `Path`
+        A temporary directory, given by pytest.
+
+    monkeypatch : `pytest.MonkeyPatch`
+        To draw few points.
+    """
+    monkeypatch.setattr(plot, "MAX_POINT", 10)
+
+    performance_assessor: PerformanceAssessor = PerformanceAssessor(
+        main=__sampled
+    )
+    performance_assessor.launch_profiling(do_time=False,
+                                          sample_interval=0.002)
+    performance_assessor.plot(path=str(tmp_path))
+
+    data: np.array = performance_assessor.data()["memory_timeline"]["data"]
+    sidecar: np.array = np.fromfile(tmp_path / "memory_timeline.bin",
+                                    dtype="<f8").reshape(len(data), -1)
+
+    assert len(data) > 10
+    assert np.array_equal(sidecar[:, :-1], data)
+    assert "memory_timeline.bin" in \
+        (tmp_path / "memory_timeline.html").read_text(encoding="utf-8")
+    assert not (tmp_path / "memory_evaluation.bin").exists()
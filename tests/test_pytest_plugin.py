@@ -0,0 +1,90 @@
+r"""Test if "src/perfassess/pytest_plugin.py" is functional.
+
+Usage
+-----
+When you are in the main directory ("performance_assessor/"), you can launch:
+
+```sh
+    # Execute this command line in a conda environment.
+    $ pytest
+```
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [I]
+from importlib.metadata import entry_points
+
+# [P]
+import pytest
+
+# [R]
+from src.perfassess.result_io import load_result
+
+
+pytest_plugins: list = ["pytester"]
+# Once perfassess is installed, pytest already loads the plugin: loading it
+# again, under another name, would add its options twice.
+PLUGIN_OPTION: list = [] if any(
+    entry_point.name == "perfassess"
+    for entry_point in entry_points(group="pytest11")
+) else ["-p", "src.perfassess.pytest_plugin"]
+
+
+TEST_FILE: str = """
+import pytest
+
+
+@pytest.fixture
+def size():
+    return 100_000
+
+
+@pytest.mark.perf_budget(time=60, peak_memory=1_000_000, repeat=2)
+def test_pass(size):
+    assert len([0] * size) == size
+
+
+@pytest.mark.perf_budget(memory=1)
+def test_fail(size):
+    global KEEP
+    KEEP = [0] * size
+
+
+def test_not_marked():
+    assert True
+"""
+
+
+def test_plugin(pytester: pytest.Pytester):
+    """Test if budgets fail tests, and if results are reported.
+
+    Parameters
+    ----------
+    pytester : `pytest.Pytester`
+        A pytest runner, given by pytest.
+    """
+    pytester.makepyfile(test_budget=TEST_FILE)
+    report: str = str(pytester.path / "report.json")
+
+    result: object = pytester.runpytest(*PLUGIN_OPTION,
+                                        "--perfassess-report", report)
+
+    result.assert_outcomes(passed=2, failed=1)
+    result.stdout.fnmatch_lines(["*perf_budget: memory = * > 1*",
+                                 "*memory_evaluation:*"])
+
+    data: dict = load_result(path=report)
+
+    assert list(data["budget_evaluation"]["label"]) == [
+        "test_budget.py::test_pass", "test_budget.py::test_fail"
+    ]
+    assert "test_budget.py::test_pass.time_evaluation" in data
+
+    # The previous report is used to show differences.
+    result = pytester.runpytest(*PLUGIN_OPTION, "--perfassess-report",
+                                report)
+
+    result.stdout.fnmatch_lines(["*(+*)*test_budget.py*"])
@@ -0,0 +1,228 @@
+r"""Test if "src/perfassess/result_cache.py" is functional.
+
+Usage
+-----
+When you are in the main directory ("performance_assessor/"), you can launch:
+
+```sh
+    # Execute this command line in a conda environment.
+    $ pytest
+```
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [I]
+from importlib import import_module
+# [O]
+import os
+from os.path import abspath
+# [S]
+import sys
+
+# [N]
+import numpy as np
+# [P]
+import pytest
+
+# [C]
+from src.perfassess.class_performance_assessor import PerformanceAssessor
+# [R]
+from src.perfassess.result_cache import (ResultCache, cache_key,
+                                         changed_file, file_state,
+                                         module_file)
+# [S]
+from src.perfassess.suite import load_suite, run_suite
+
+
+def test_cache_key(tmp_path: object):
+    """Test if the key only changes with the sources and the options.
+
+    Parameters
+    ----------
+    tmp_path : `Path`
+        A temporary directory, given by pytest.
+    """
+    script: object = tmp_path / "script.py"
+    script.write_text("def function():\n    pass\n", encoding="utf-8")
+    path_list: list = [str(script)]
+
+    key: str = cache_key(option={"n_field": 0}, path_list=path_list)
+
+    assert cache_key(option={"n_field": 0}, path_list=path_list) == key
+    assert cache_key(option={"n_field": 1}, path_list=path_list) != key
+
+    # Same modification time, other content.
+    stat: os.stat_result = os.stat(script)
+    script.write_text("def function():\n    return\n", encoding="utf-8")
+    os.utime(script, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert cache_key(option={"n_field": 0}, path_list=path_list) != key
+
+
+def test_module_file(tmp_path: object, monkeypatch: pytest.MonkeyPatch):
+    """Test if the files of a function are its whole import closure, even
+    with modules imported before.
+
+    Parameters
+    ----------
+    tmp_path : `Path`
+        A temporary directory, given by pytest.
+
+    monkeypatch : `pytest.MonkeyPatch`
+        To import the temporary modules.
+    """
+    (tmp_path / "cache_helper_2.py").write_text("SIZE = 3\n")
+    (tmp_path / "cache_helper.py").write_text(
+        "from cache_helper_2 import SIZE\n"
+    )
+
+    for name in ["cache_script_a", "cache_script_b"]:
+        (tmp_path / f"{name}.py").write_text(
+            "import cache_helper\n"
+            "def function():\n"
+            "    return cache_helper.SIZE\n"
+        )
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    for name in ["cache_script_a", "cache_script_b"]:
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    monkeypatch.delitem(sys.modules, "cache_helper", raising=False)
+    monkeypatch.delitem(sys.modules, "cache_helper_2", raising=False)
+
+    file_list: list = [
+        module_file(function=import_module(name).function)
+        for name in ["cache_script_a", "cache_script_b"]
+    ]
+
+    for file_list_i, name in zip(file_list, ["a", "b"]):
+        assert file_list_i == sorted([
+            str(tmp_path / "cache_helper.py"),
+            str(tmp_path / "cache_helper_2.py"),
+            str(tmp_path / f"cache_script_{name}.py")
+        ])
+
+
+def test_result_cache(tmp_path: object):
+    """Test if cached files are given back, and the least recently used
+    entries removed first.
+
+    Parameters
+    ----------
+    tmp_path : `Path`
+        A temporary directory, given by pytest.
+    """
+    output: object = tmp_path / "output"
+    output.mkdir()
+    state: dict = file_state(path=str(output))
+
+    (output / "result.json").write_bytes(b"0" * 400_000)
+
+    assert changed_file(path=str(output), state=state) == \
+        [str(output / "result.json")]
+
+    # Room for two entries only.
+    cache: ResultCache = ResultCache(path=str(tmp_path / "cache"), max_size=1)
+
+    for key in ["a", "b"]:
+        cache.put(key=key, path_list=[str(output / "result.json")])
+
+    (output / "result.json").unlink()
+
+    assert cache.get(key="a", output=str(output))
+    assert (output / "result.json").stat().st_size == 400_000
+
+    # "b" is now the least recently used entry.
+    os.utime(tmp_path / "cache" / "b", (0, 0))
+    cache.put(key="c", path_list=[str(output / "result.json")])
+
+    assert cache.find(key="b") is None
+    assert cache.find(key="a") is not None
+    assert not cache.get(key="d", output=str(output))
+
+    with pytest.raises(ValueError):
+        ResultCache(path=str(tmp_path / "cache"), max_size=-1)
+
+
+def test_cached_suite(tmp_path: object, monkeypatch: pytest.MonkeyPatch):
+    """Test if suite targets are reused from the cache, unless forced.
+
+    Parameters
+    ----------
+    tmp_path : `Path`
+        A temporary directory, given by pytest.
+
+    monkeypatch : `pytest.MonkeyPatch`
+        To count the profilings.
+    """
+    suite: object = tmp_path / "perfassess.yml"
+    suite.write_text(
+        "target:\n"
+        f"  - {{name: pass, script: {abspath('src/perfassess/testor.py')},\n"
+        "     function: testor, argument: {value: [1, 2, 3]}}\n",
+        encoding="utf-8"
+    )
+    cache: ResultCache = ResultCache(path=str(tmp_path / "cache"))
+    profiling: list = []
+    launch_profiling: object = PerformanceAssessor.launch_profiling
+
+    monkeypatch.setattr(
+        PerformanceAssessor, "launch_profiling",
+        lambda self, **kwargs: profiling.append(1) or
+        launch_profiling(self, **kwargs)
+    )
+
+    result_list: list = [
+        run_suite(suite=load_suite(path=str(suite)), output=str(tmp_path),
+                  cache=cache, force=force)[0]
+        for force in [False, False, True]
+    ]
+
+    assert len(profiling) == 2
+    assert result_list[1] == result_list[0]
+    assert result_list[1]["status"] == "pass"
+
+
+def test_cached_fixture(tmp_path: object, monkeypatch: pytest.MonkeyPatch):
+    """Test if editing a file read by an argument generator invalidates the
+    cached result.
+
+    Parameters
+    ----------
+    tmp_path : `Path`
+        A temporary directory, given by pytest.
+
+    monkeypatch : `pytest.MonkeyPatch`
+        To count the profilings.
+    """
+    np.save(tmp_path / "value.npy", np.arange(3))
+    (tmp_path / "argument.yml").write_text(
+        "value: {$generator: fixture, path: value.npy}\n", encoding="utf-8"
+    )
+    suite: object = tmp_path / "perfassess.yml"
+    suite.write_text(
+        "target:\n"
+        f"  - {{name: pass, script: {abspath('src/perfassess/testor.py')},\n"
+        "     function: testor, argument: argument.yml}\n",
+        encoding="utf-8"
+    )
+    cache: ResultCache = ResultCache(path=str(tmp_path / "cache"))
+    profiling: list = []
+    launch_profiling: object = PerformanceAssessor.launch_profiling
+
+    monkeypatch.setattr(
+        PerformanceAssessor, "launch_profiling",
+        lambda self, **kwargs: profiling.append(1) or
+        launch_profiling(self, **kwargs)
+    )
+
+    for value in [np.arange(3), np.arange(3), np.arange(4)]:
+        np.save(tmp_path / "value.npy", value)
+        run_suite(suite=load_suite(path=str(suite)), output=str(tmp_path),
+                  cache=cache)
+
+    assert len(profiling) == 2
@@ -0,0 +1,109 @@
+r"""Test if "src/perfassess/sampled_profiler.py" is functional.
+
+Usage
+-----
+When you are in the main directory ("performance_assessor/"), you can launch:
+
+```sh
+    # Execute this command line in a conda environment.
+    $ pytest
+```
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [C]
+from cProfile import Profile
+# [S]
+import sys
+
+# [P]
+import pytest
+
+# [S]
+from src.perfassess.sampled_profiler import OTHER, SampledProfiler
+
+
+@pytest.mark.parametrize("option, sampled", [
+    ({"rate": 0}, 0),
+    ({"rate": 1}, 50),
+    ({"period": 3600}, 1)
+])
+def test_sample(option: dict, sampled: int):
+    """Test if only the chosen fraction of calls is profiled.
+
+    Parameters
+    ----------
+    option : `dict`
+        The sampling options.
+
+    sampled : `int`
+        The expected number of sampled calls.
+    """
+    sampler: SampledProfiler = SampledProfiler(**option)
+    function = sampler(lambda value: value + 1)
+
+    assert [function(i) for i in range(50)] == list(range(1, 51))
+
+    data: dict = sampler.data()
+
+    assert data["sample_evaluation"]["data"].tolist() == [[50, sampled]]
+    assert data["time_evaluation"]["data"][:, 0].sum() == sampled
+
+
+def test_sample_cap(tmp_path: object):
+    """Test if windows keep a bounded number of rows, and if the aggregation
+    can be plotted.
+
+    Parameters
+    ----------
+    tmp_path : `Path`
+        A temporary directory, given by pytest.
+    """
+    sampler: SampledProfiler = SampledProfiler(rate=1, max_row=2,
+                                               do_memory=True)
+
+    @sampler
+    def allocate(size: int) -> list:
+        return sorted(map(str, range(size)), key=len)
+
+    for _ in range(5):
+        allocate(size=1000)
+
+    data: dict = sampler.data()
+
+    assert len(data["time_evaluation"]["label"]) == 2
+    assert OTHER in data["time_evaluation"]["label"]
+    assert len(data["memory_evaluation"]["label"]) <= 2
+
+    sampler.plot(path=str(tmp_path))
+
+    assert (tmp_path / "time_evaluation.html").exists()
+
+
+def test_sample_other_profiler():
+    """Test if a call is left unprofiled, and the other profiler running,
+    when another profiler is already running.
+    """
+    sampler: SampledProfiler = SampledProfiler(rate=1)
+    function = sampler(lambda value: value + 1)
+    profile: Profile = Profile()
+    profile.enable()
+
+    try:
+        result: int = function(1)
+        profiler: object = sys.getprofile()
+    finally:
+        profile.disable()
+
+    assert result == 2
+    assert profiler is profile or sys.version_info >= (3, 12)
+    assert sampler.data()["sample_evaluation"]["data"].tolist() == [[1, 0]]
+
+
+def test_sample_wrong_rate():
+    """Test if an error is thrown for a wrong rate."""
+    with pytest.raises(ValueError):
+        SampledProfiler(rate=2)
@@ -0,0 +1,129 @@
+r"""Test if "src/perfassess/session_server.py" and
+"src/perfassess/session_client.py" are functional.
+
+Usage
+-----
+When you are in the main directory ("performance_assessor/"), you can launch:
+
+```sh
+    # Execute this command line in a conda environment.
+    $ pytest
+```
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [O]
+import os
+# [T]
+from threading import Thread
+
+# [P]
+import pytest
+
+# [S]
+from src.perfassess.session_client import SessionClient
+from src.perfassess.session_server import SessionServer
+
+
+@pytest.fixture
+def __client(tmp_path: object) -> SessionClient:
+    """Start a session server in a thread, then return a client to it.
+
+    Parameters
+    ----------
+    tmp_path : `Path`
+        A temporary directory, given by pytest.
+
+    Returns
+    -------
+    `SessionClient`
+        A client connected to the started server.
+    """
+    socket_path: str = str(tmp_path / "perfassess.sock")
+    server: SessionServer = SessionServer(socket_path=socket_path)
+    thread: Thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield SessionClient(socket_path=socket_path)
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_session_profile(__client: SessionClient, tmp_path: object):
+    """Test if a target is kept loaded, then reloaded when its source changes.
+
+    Parameters
+    ----------
+    __client : `SessionClient`
+        The client to test.
+
+    tmp_path : `Path`
+        A temporary directory, given by pytest.
+    """
+    script: object = tmp_path / "script.py"
+    script.write_text("def target(value=3):\n    return [0] * value\n")
+
+    answer: dict = __client.profile(script=str(script), function="target")
+
+    assert answer["reloaded"]
+    assert set(answer["data"]) == {"memory_evaluation", "memory_domain",
+                                   "time_evaluation", "resource_evaluation",
+                                   "function_evaluation"}
+    assert not __client.profile(script=str(script),
+                                function="target")["reloaded"]
+
+    script.write_text("def target(value=5):\n    return [1] * value\n")
+    # Make sure the modification time changes.
+    os.utime(script, (0, 0))
+
+    assert __client.profile(script=str(script), function="target")["reloaded"]
+
+
+def test_session_dependency(__client: SessionClient, tmp_path: object):
+    """Test if an imported module is still watched after a reload.
+
+    Parameters
+    ----------
+    __client : `SessionClient`
+        The client to test.
+
+    tmp_path : `Path`
+        A temporary directory, given by pytest.
+    """
+    helper: object = tmp_path / "session_helper.py"
+    helper.write_text("SIZE = 3\n")
+    script: object = tmp_path / "script.py"
+    script.write_text(
+        "import sys\n"
+        f"sys.path.insert(0, {str(tmp_path)!r})\n"
+        "import session_helper\n"
+        "def target():\n"
+        "    return [0] * session_helper.SIZE\n"
+    )
+
+    assert __client.profile(script=str(script), function="target")["reloaded"]
+
+    # The helper, not imported again with the script, is still watched.
+    for path in (script, helper):
+        os.utime(path, (0, 0))
+
+        assert __client.profile(script=str(script),
+                                function="target")["reloaded"]
+
+
+def test_session_error(__client: SessionClient):
+    """Test if an error of the server is given back to the client.
+
+    Parameters
+    ----------
+    __client : `SessionClient`
+        The client to test.
+    """
+    with pytest.raises(RuntimeError):
+        __client.profile(script="//None//none.py", function="none")
+
+    assert __client.ping()["status"] == "ok"
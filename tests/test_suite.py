@@ -0,0 +1,110 @@
+r"""Test if "src/perfassess/suite.py" is functional.
+
+Usage
+-----
+When you are in the main directory ("performance_assessor/"), you can launch:
+
+```sh
+    # Execute this command line in a conda environment.
+    $ pytest
+```
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [O]
+from os.path import abspath
+
+# [P]
+import pytest
+
+# [S]
+from src.perfassess.result_io import load_result
+from src.perfassess.suite import load_suite, run_suite
+
+
+@pytest.fixture
+def __suite_path(tmp_path: object) -> str:
+    """Write a suite file with a passing, a failing and a broken target.
+
+    Parameters
+    ----------
+    tmp_path : `Path`
+        A temporary directory, given by pytest.
+
+    Returns
+    -------
+    `str`
+        The suite file path.
+    """
+    script: str = abspath("src/perfassess/testor.py")
+    suite: object = tmp_path / "perfassess.yml"
+
+    suite.write_text(
+        "target:\n"
+        f"  - {{name: pass, script: {script}, function: testor,\n"
+        "     argument: {value: [1, 2, 3]}, repeat: 2,\n"
+        "     budget: {time: 100, memory: 100000}}\n"
+        f"  - {{name: fail, script: {script}, function: testor,\n"
+        f"     argument: {abspath('data/argument.yml')},\n"
+        "     budget: {memory: -1}}\n"
+        f"  - {{name: error, script: {script}, function: none}}\n"
+    )
+
+    return str(suite)
+
+
+def test_run_suite(__suite_path: str, tmp_path: object):
+    """Test if a suite is run, with one consolidated result file.
+
+    Parameters
+    ----------
+    __suite_path : `str`
+        The suite file path.
+
+    tmp_path : `Path`
+        A temporary directory, given by pytest.
+    """
+    result_list: list = run_suite(suite=load_suite(path=__suite_path),
+                                  output=str(tmp_path))
+
+    assert [result["status"] for result in result_list] == \
+        ["pass", "fail", "error"]
+    assert len(result_list[0]["time"]) == 2
+
+    data: dict = load_result(path=str(tmp_path / "suite_result.json"))
+
+    assert list(data["suite_evaluation"]["label"]) == ["pass", "fail", "error"]
+    assert "pass.time_evaluation" in data
+    assert (tmp_path / "suite_evaluation.html").exists()
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "worker: 1\n",
+        "target:\n  - {function: main}\n",
+        "target:\n  - {script: a.py, name: a}\n  - {script: b.py, name: a}\n",
+        "target:\n  - {script: a.py, repeat: 0}\n",
+        "target:\n  - {script: a.py, repeat: \"3\"}\n",
+        "target:\n  - {script: a.py, repeat: 2.5}\n"
+    ]
+)
+def test_wrong_suite(tmp_path: object, content: str):
+    """Test if an error is thrown when a suite file is wrong.
+
+    Parameters
+    ----------
+    tmp_path : `Path`
+        A temporary directory, given by pytest.
+
+    content : `str`
+        The wrong suite file content.
+    """
+    suite: object = tmp_path / "perfassess.yml"
+    suite.write_text(content)
+
+    with pytest.raises(ValueError):
+        load_suite(path=str(suite))
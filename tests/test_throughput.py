@@ -0,0 +1,74 @@
+r"""Test if "src/perfassess/throughput.py" is functional.
+
+Usage
+-----
+When you are in the main directory ("performance_assessor/"), you can launch:
+
+```sh
+    # Execute this command line in a conda environment.
+    $ pytest
+```
+"""
+
+__authors__ = ["Lucas ROUAUD"]
+__contact__ = ["lucas.rouaud@gmail.com"]
+__copyright__ = "MIT License"
+
+# [T]
+from time import sleep
+
+# [N]
+import numpy as np
+# [P]
+import pytest
+
+# [C]
+from src.perfassess.class_performance_assessor import PerformanceAssessor
+# [T]
+from src.perfassess.throughput import ThroughputBenchmark
+
+
+def test_throughput(tmp_path: object):
+    """Test if the throughput of each level and worker type is measured.
+
+    Parameters
+    ----------
+    tmp_path : `Path`
+        A temporary directory, given by pytest.
+    """
+    performance_assessor: PerformanceAssessor = PerformanceAssessor(
+        # Not picklable, so given to the processes by forking.
+        main=lambda pause: sleep(pause),
+        pause=0.01
+    )
+
+    performance_assessor.launch_throughput(max_concurrency=2, duration=0.2)
+    performance_assessor.plot(path=str(tmp_path))
+    data: dict = performance_assessor.data()
+    evaluation: dict = data["throughput_evaluation"]
+
+    assert list(evaluation["label"]) == ["thread 1", "thread 2",
+                                         "process 1", "process 2"]
+    # Sleeping releases the GIL: both workers types scale.
+    assert evaluation["data"][:, 1] == pytest.approx([100, 200, 100, 200],
+                                                     rel=0.3)
+    assert evaluation["data"][:, 2] == pytest.approx(0.01, rel=0.5)
+    assert evaluation["data"][[0, 2], 4] == pytest.approx([1, 1])
+    assert np.sum(data["throughput_speedup"]["label"] == "ideal") == 2
+    assert (tmp_path / "throughput_speedup.html").exists()
+
+
+@pytest.mark.parametrize(
+    "option",
+    [{"max_concurrency": -1}, {"max_concurrency": 0}, {"duration": 0}, {"worker_type": ("task",)}]
+)
+def test_wrong_throughput(option: dict):
+    """Test if wrong options are refused.
+
+    Parameters
+    ----------
+    option : `dict`
+        The wrong option.
+    """
+    with pytest.raises(ValueError):
+        ThroughputBenchmark(sleep, **option)